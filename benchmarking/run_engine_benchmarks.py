@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""Compare the speed and memory consumption of inscriptis' rendering engines.
+
+The benchmark uses a large synthetic page which concatenates all test cases
+from the `tests/html` directory, and all pages available in the benchmarking
+cache (see `run_benchmarking.py`).
+
+Usage::
+
+    python run_engine_benchmarks.py [scenario ...]
+"""
+
+import argparse
+import multiprocessing
+import os
+import re
+import sys
+import tracemalloc
+from glob import glob
+from time import perf_counter
+
+BENCHMARKING_ROOT = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCHMARKING_ROOT, "../src")
+TESTS_HTML_DIR = os.path.join(BENCHMARKING_ROOT, "../tests/html")
+CACHE_DIR = os.path.join(BENCHMARKING_ROOT, "html_cache")
+sys.path.insert(0, os.path.abspath(SRC_DIR))
+
+from lxml.etree import Comment, HTMLParser, ParserError, fromstring  # noqa: E402
+from lxml.html import document_fromstring, tostring  # noqa: E402
+from lxml.html import fromstring as html_fromstring  # noqa: E402
+
+from inscriptis import Converter, get_annotated_text, get_text, get_texts, render_many  # noqa: E402
+from inscriptis.backend import get_available_parser_backends  # noqa: E402
+from inscriptis.backend._tree import get_html_tree as get_normalised_html_tree  # noqa: E402
+from inscriptis.css_profiles import CSS_PROFILES  # noqa: E402
+from inscriptis.html_engine import Inscriptis, InscriptisRenderer, InscriptisTarget  # noqa: E402
+from inscriptis.model.config import ParserConfig  # noqa: E402
+from inscriptis.model.html_element import HtmlElement  # noqa: E402
+
+TRIES = 5
+LARGE_PAGE_REPETITIONS = 20
+SVG_PAGE_PARAGRAPHS = 2000
+SVG_PATHS_PER_ICON = 40
+SPARSE_TABLE_SIZE = 3000
+SMALL_DOCUMENT_ROUNDS = 200
+ARTICLE_PARAGRAPHS = 300
+ARTICLE_NAV_ITEMS = 30
+STYLE_SHEET_RULE_COUNTS = (10, 1000, 10000)
+THREAD_COUNTS = (1, 2, 4, 8)
+THREAD_DOCUMENT_ROUNDS = 50
+
+
+def get_large_page() -> str:
+    """Return a large HTML page composed of the test cases."""
+    content = []
+    for fname in sorted(glob(os.path.join(TESTS_HTML_DIR, "*.html"))):
+        with open(fname) as f:
+            # serialize the test case's body to obtain well-formed snippets
+            body = document_fromstring(f"<html><body>{f.read()}</body></html>").find("body")
+            body.tag = "div"
+            content.append(tostring(body, encoding="unicode", with_tail=False))
+    body = "\n".join(content) * LARGE_PAGE_REPETITIONS
+    return f"<html><body>{body}</body></html>"
+
+
+def get_svg_page() -> str:
+    """Return a page whose paragraphs are decorated with inline SVG icons."""
+    paths = "".join(f'<path d="M{i} {i}L{i + 1} {i + 1}"/>' for i in range(SVG_PATHS_PER_ICON))
+    icon = f'<svg viewBox="0 0 24 24"><g>{paths}</g><text>icon</text></svg>'
+    body = "\n".join(f"<p>{icon}Paragraph {no} with some text.</p>" for no in range(SVG_PAGE_PARAGRAPHS))
+    return f"<html><body>{body}</body></html>"
+
+
+def get_sparse_table_page() -> str:
+    """Return a page with a wide first table row followed by many single-cell rows."""
+    first_row = "<tr>" + "<td>c</td>" * SPARSE_TABLE_SIZE + "</tr>"
+    rows = "<tr><td>r</td></tr>" * SPARSE_TABLE_SIZE
+    return f"<html><body><table>{first_row}{rows}</table></body></html>"
+
+
+def get_article_page() -> str:
+    """Return a page with navigation lists and paragraphs with inline markup."""
+    nav = "<ul>" + "".join(f'<li><a href="/item{no}">Item {no}</a></li>' for no in range(ARTICLE_NAV_ITEMS)) + "</ul>"
+    paragraph = (
+        "<p>Some <b>bold</b> and <em>emphasised</em> text with a <a href='/link'>link</a>"
+        " and <span>inline <code>code</code></span>.</p>"
+    )
+    return (
+        f"<html><body><div><nav>{nav}</nav><article><h1>Title</h1>{paragraph * ARTICLE_PARAGRAPHS}</article>"
+        f"<footer>{nav}</footer></div></body></html>"
+    )
+
+
+def get_styled_page(rule_count: int) -> str:
+    """Return an article page with a style sheet of the given size and a hidden comment section."""
+    rules = "".join(f".rule{no} {{ margin-top: 1em }} #id{no} {{ display: block }}\n" for no in range(rule_count // 2))
+    comments = "".join(f'<div class="comment">Comment {no} with <b>markup</b></div>' for no in range(2000))
+    body = get_article_page().removeprefix("<html><body>")
+    return (
+        f"<html><head><style>{rules}.hidden {{ display: none }}</style></head>"
+        f'<body><div class="hidden">{comments}</div>{body}'
+    )
+
+
+def get_cached_pages() -> list[str]:
+    """Return the pages stored in the benchmarking cache, if available."""
+    pages = []
+    for fname in sorted(glob(os.path.join(CACHE_DIR, "*"))):
+        with open(fname) as f:
+            pages.append(f.read())
+    return pages
+
+
+def _get_peak_rss() -> int:
+    """Return the peak resident set size of the current process (in KiB)."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _get_rss_growth(func, html: str, queue: multiprocessing.Queue) -> None:
+    """Report the growth of the peak resident set size caused by `func`."""
+    rss_before = _get_peak_rss()
+    func(html)
+    queue.put(_get_peak_rss() - rss_before)
+
+
+def measure(func, html: str) -> tuple[float, int, int]:
+    """Measure the time and memory required by `func`.
+
+    Python allocations are traced with tracemalloc, while the (Linux only)
+    resident set size also covers the memory allocated by lxml (e.g., for
+    parse trees).
+
+    Returns:
+        A tuple of the average time (in seconds), the peak Python allocation
+        (in bytes) and the growth of the resident set size (in KiB).
+
+    """
+    start_time = perf_counter()
+    for _ in range(TRIES):
+        func(html)
+    elapsed = (perf_counter() - start_time) / TRIES
+
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # use a fresh interpreter, since freed memory is not returned to the OS
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_get_rss_growth, args=(func, html, queue))
+    process.start()
+    rss = queue.get()
+    process.join()
+    return elapsed, peak, rss
+
+
+def report(title: str, results: dict[str, tuple[float, int, int]]) -> None:
+    """Print the benchmarking results relative to the first entry."""
+    print(f"\n{title}")
+    print(f"  {'':<30} {'time':>22} {'tracemalloc peak':>26} {'RSS growth':>26}")
+    base_time, base_peak, base_rss = next(iter(results.values()))
+    for name, (elapsed, peak, rss) in results.items():
+        print(
+            f"  {name:<30} {elapsed * 1000:10.2f} ms ({elapsed / base_time:6.2f}x)"
+            f" {peak / 1024:12.1f} KiB ({peak / max(base_peak, 1):6.2f}x)"
+            f" {rss:12d} KiB ({rss / max(base_rss, 1):6.2f}x)",
+        )
+
+
+#
+# engines
+#
+def tree_engine(html: str) -> str:
+    """Convert the HTML content with the tree walker."""
+    return Inscriptis(document_fromstring(html)).get_text()
+
+
+def sax_engine(html: str) -> str:
+    """Convert the HTML content with the SAX-style parser target."""
+    return fromstring(html, HTMLParser(target=InscriptisTarget())).get_text()
+
+
+def legacy_get_html_tree(html: str):
+    """Obtain the parse tree with the normalisation used up to version 2.7."""
+    html = html.strip()
+    if html.startswith("<?xml "):
+        html = re.sub(r"^<\?xml [^>]+?\?>", "", html)
+    try:
+        return html_fromstring(html)
+    except ParserError:
+        return html_fromstring("<pre>" + html + "</pre>")
+
+
+def get_html_tree(html: str):
+    """Obtain the parse tree with inscriptis' normalisation."""
+    return get_normalised_html_tree(html)
+
+
+class RecursiveInscriptis(Inscriptis):
+    """Inscriptis with the recursive tree traversal used up to version 2.7."""
+
+    def _parse_html_tree(self, state, tree):
+        if isinstance(tree.tag, str):
+            # hidden elements are neither opened nor rendered
+            if not self._start_tag(state, tree.tag, tree.attrib):
+                state.tags[-1].write(tree.tail)
+                return state.canvas
+
+            state.tags[-1].write(tree.text)
+
+            for node in tree:
+                self._parse_html_tree(state, node)
+
+            self._end_tag(state, tree.tag)
+            state.tags[-1].write(tree.tail)
+
+        elif tree.tag is Comment and tree.tail:
+            state.tags[-1].canvas.write(state.tags[-1], tree.tail)
+
+        return state.canvas
+
+
+#
+# benchmarking scenarios
+#
+def benchmark_sax(pages: list[str]) -> None:
+    """Compare the tree walking engine with the SAX-style parser target."""
+    for no, html in enumerate(pages):
+        if tree_engine(html) != sax_engine(html):
+            print(f"WARNING: the SAX target's output differs for page {no}.")
+        report(
+            f"Tree walker vs. SAX target (page {no}, {len(html) // 1024} KiB)",
+            {"tree walker": measure(tree_engine, html), "SAX target": measure(sax_engine, html)},
+        )
+
+
+def benchmark_traversal(pages: list[str]) -> None:
+    """Compare the node throughput of the recursive and the iterative traversal."""
+    # libxml2 limits the nesting depth to 256 levels
+    nested_page = "<html><body>" + "<div><span>nested</span>" * 250 + "</body></html>"
+    for no, html in enumerate([*pages, nested_page]):
+        html_tree = document_fromstring(html)
+        nodes = sum(1 for _ in html_tree.iter())
+        if RecursiveInscriptis(html_tree).get_text() != Inscriptis(html_tree).get_text():
+            print(f"WARNING: the recursive traversal's output differs for page {no}.")
+        results = {}
+        for name, engine in (("recursive", RecursiveInscriptis), ("iterative", Inscriptis)):
+            start_time = perf_counter()
+            for _ in range(TRIES):
+                engine(html_tree).get_text()
+            elapsed = (perf_counter() - start_time) / TRIES
+            results[name] = elapsed
+        print(f"\nRecursive vs. iterative traversal (page {no}, {nodes} nodes)")
+        base_time = results["recursive"]
+        for name, elapsed in results.items():
+            print(f"  {name:<30} {nodes / elapsed:12.0f} nodes/s ({base_time / elapsed:6.2f}x)")
+
+
+def benchmark_backends(pages: list[str]) -> None:
+    """Compare the parse and render time of all available parser backends."""
+    test_cases = []
+    for fname in sorted(glob(os.path.join(TESTS_HTML_DIR, "*.html"))):
+        with open(fname) as f:
+            test_cases.append(f"<html><body>{f.read()}</body></html>")
+
+    workloads = [(f"page {no}, {len(html) // 1024} KiB", [html]) for no, html in enumerate(pages)]
+    workloads.append((f"{len(test_cases)} test cases", test_cases))
+    for title, documents in workloads:
+        results = {}
+        for backend in get_available_parser_backends():
+            config = ParserConfig(parser_backend=backend)
+            start_time = perf_counter()
+            for _ in range(TRIES):
+                for html in documents:
+                    get_text(html, config)
+            results[backend] = (perf_counter() - start_time) / TRIES
+
+        print(f"\nParse and render time per parser backend ({title})")
+        base_time = results["lxml"]
+        for backend, elapsed in results.items():
+            print(f"  {backend:<30} {elapsed * 1000:10.2f} ms ({elapsed / base_time:6.2f}x)")
+
+
+def benchmark_svg(pages: list[str]) -> None:
+    """Compare the rendering of SVG-heavy pages with and without dropping SVG elements."""
+    drop_svg = ParserConfig(drop_elements=("svg",))
+    for no, html in enumerate([get_svg_page(), *pages]):
+        results = {}
+        for name, config in (("render svg", None), ("drop svg", drop_svg)):
+            start_time = perf_counter()
+            for _ in range(TRIES):
+                get_text(html, config)
+            results[name] = (perf_counter() - start_time) / TRIES
+
+        print(f"\nRendering vs. dropping SVG elements (page {no}, {len(html) // 1024} KiB)")
+        base_time = results["render svg"]
+        for name, elapsed in results.items():
+            print(f"  {name:<30} {elapsed * 1000:10.2f} ms ({elapsed / base_time:6.2f}x)")
+
+
+def benchmark_normalisation(pages: list[str]) -> None:
+    """Compare the copies made by the legacy and the current input normalisation."""
+    xml_page = f'\n  <?xml version="1.0"?>\n{pages[0]}\n'
+    empty_page = "\n".join(f"<!-- comment {no} -->" for no in range(SVG_PAGE_PARAGRAPHS * 10))
+    workloads = {"page 0": pages[0], "page 0 with XML declaration": xml_page, "comments only": empty_page}
+    for title, html in workloads.items():
+        report(
+            f"Legacy vs. copy-free normalisation ({title}, {len(html) // 1024} KiB)",
+            {"legacy": measure(legacy_get_html_tree, html), "copy-free": measure(get_html_tree, html)},
+        )
+
+
+def benchmark_many(pages: list[str]) -> None:
+    """Compare rendering a page with several configurations one by one and at once."""
+    configs = (
+        ParserConfig(css=CSS_PROFILES["strict"]),
+        ParserConfig(css=CSS_PROFILES["relaxed"]),
+        ParserConfig(annotation_rules={"h1": ["heading"], "h2": ["heading"], "b": ["emphasis"]}),
+    )
+    for no, html in enumerate(pages):
+        results = {}
+        start_time = perf_counter()
+        for _ in range(TRIES):
+            for config in configs:
+                get_annotated_text(html, config)
+        results["one by one"] = (perf_counter() - start_time) / TRIES
+
+        start_time = perf_counter()
+        for _ in range(TRIES):
+            render_many(html, configs)
+        results["render_many"] = (perf_counter() - start_time) / TRIES
+
+        print(f"\nRendering {len(configs)} configurations one by one vs. at once (page {no}, {len(html) // 1024} KiB)")
+        base_time = results["one by one"]
+        for name, elapsed in results.items():
+            print(f"  {name:<30} {elapsed * 1000:10.2f} ms ({elapsed / base_time:6.2f}x)")
+
+
+def benchmark_preview(pages: list[str]) -> None:
+    """Compare converting complete pages with converting their first 2000 characters."""
+    for no, html in enumerate(pages):
+        results = {}
+        for name, config in (("complete page", None), ("max_chars=2000", ParserConfig(max_chars=2000))):
+            start_time = perf_counter()
+            for _ in range(TRIES):
+                get_text(html, config)
+            results[name] = (perf_counter() - start_time) / TRIES
+
+        print(f"\nComplete conversion vs. preview (page {no}, {len(html) // 1024} KiB)")
+        base_time = results["complete page"]
+        for name, elapsed in results.items():
+            print(f"  {name:<30} {elapsed * 1000:10.2f} ms ({elapsed / base_time:6.2f}x)")
+
+
+def benchmark_guards(_: list[str]) -> None:
+    """Compare the conversion of a hostile sparse table with and without resource guards."""
+    html = get_sparse_table_page()
+    results = {}
+    for name, config in (("full layout", None), ("max_table_cells=10000", ParserConfig(max_table_cells=10000))):
+        start_time = perf_counter()
+        for _ in range(TRIES):
+            get_text(html, config)
+        results[name] = (perf_counter() - start_time) / TRIES
+
+    print(f"\nResource guards ({SPARSE_TABLE_SIZE} columns x {SPARSE_TABLE_SIZE} rows sparse table)")
+    base_time = results["full layout"]
+    for name, elapsed in results.items():
+        print(f"  {name:<30} {elapsed * 1000:10.2f} ms ({elapsed / base_time:6.2f}x)")
+
+
+def get_small_documents() -> list[str]:
+    """Return the (small) test cases as individual documents."""
+    documents = []
+    for fname in sorted(glob(os.path.join(TESTS_HTML_DIR, "*.html"))):
+        with open(fname) as f:
+            documents.append(f.read())
+    return documents
+
+
+def benchmark_converter(_: list[str]) -> None:
+    """Compare the per-document overhead of get_text and Converter for small documents."""
+    documents = get_small_documents()
+    config = ParserConfig()
+    converter = Converter(config)
+    candidates = {
+        "get_text(html)": get_text,
+        "get_text(html, config)": lambda html: get_text(html, config),
+        "Converter(config).convert(html)": converter.convert,
+    }
+    results = dict.fromkeys(candidates, float("inf"))
+    for _ in range(TRIES):
+        for name, convert in candidates.items():
+            start_time = perf_counter()
+            for _ in range(SMALL_DOCUMENT_ROUNDS):
+                for html in documents:
+                    convert(html)
+            elapsed = (perf_counter() - start_time) / (SMALL_DOCUMENT_ROUNDS * len(documents))
+            results[name] = min(results[name], elapsed)
+
+    print(f"\nPer-document conversion time ({len(documents)} small documents)")
+    base_time = results["get_text(html)"]
+    for name, elapsed in results.items():
+        print(f"  {name:<35} {elapsed * 1e6:10.2f} us ({elapsed / base_time:6.2f}x)")
+
+
+def benchmark_plain_text(_: list[str]) -> None:
+    """Compare plain text conversions on the text canvas and on the annotation canvas."""
+    documents = get_small_documents()
+    # annotation rules which never match only enable the annotation bookkeeping
+    candidates = {
+        "annotation canvas": Converter(ParserConfig(annotation_rules={"inscriptis-unused": ["unused"]})),
+        "text canvas": Converter(ParserConfig()),
+    }
+    results = dict.fromkeys(candidates, float("inf"))
+    for _ in range(TRIES):
+        for name, converter in candidates.items():
+            start_time = perf_counter()
+            for _ in range(SMALL_DOCUMENT_ROUNDS):
+                for html in documents:
+                    converter.convert(html)
+            results[name] = min(results[name], perf_counter() - start_time)
+
+    print(f"\nPlain text conversion of the test corpus ({len(documents)} documents)")
+    base_time = results["annotation canvas"]
+    for name, elapsed in results.items():
+        per_document = elapsed / (SMALL_DOCUMENT_ROUNDS * len(documents))
+        print(f"  {name:<35} {per_document * 1e6:10.2f} us ({elapsed / base_time:6.2f}x)")
+
+
+def benchmark_elements(pages: list[str]) -> None:
+    """Count the HtmlElement copies and Python allocations required for rendering the pages."""
+    copy = HtmlElement.__copy__
+    copies = 0
+
+    def counting_copy(element: HtmlElement) -> HtmlElement:
+        nonlocal copies
+        copies += 1
+        return copy(element)
+
+    print("\nHtmlElement copies and allocations per rendered page (page 0: article page)")
+    renderer = InscriptisRenderer(None)
+    for no, html in enumerate([get_article_page(), *pages]):
+        tree = document_fromstring(html)
+        HtmlElement.__copy__ = counting_copy
+        copies = 0
+        try:
+            renderer.render(tree)
+        finally:
+            HtmlElement.__copy__ = copy
+
+        tracemalloc.start()
+        renderer.render(tree)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start_time = perf_counter()
+        for _ in range(TRIES):
+            renderer.render(tree)
+        elapsed = (perf_counter() - start_time) / TRIES
+        print(
+            f"  page {no:<3} {renderer.state.element_count:8d} elements {copies:8d} copies"
+            f" {peak / 1024:10.1f} KiB tracemalloc peak {elapsed * 1000:10.2f} ms",
+        )
+
+
+def benchmark_style_sheets(_: list[str]) -> None:
+    """Compare conversions with and without style sheets for growing numbers of rules."""
+    config = ParserConfig(parse_style_sheets=True)
+    print("\nStyle sheets (article page with a hidden comment section)")
+    for rule_count in STYLE_SHEET_RULE_COUNTS:
+        html = get_styled_page(rule_count)
+        results = {}
+        for name, conversion_config in (("ignored", None), ("parse_style_sheets", config)):
+            start_time = perf_counter()
+            for _ in range(TRIES):
+                get_text(html, conversion_config)
+            results[name] = (perf_counter() - start_time) / TRIES
+        print(
+            f"  {rule_count:6d} rules: ignored {results['ignored'] * 1000:8.2f} ms,"
+            f" parsed {results['parse_style_sheets'] * 1000:8.2f} ms"
+            f" ({results['parse_style_sheets'] / results['ignored']:6.2f}x)",
+        )
+
+
+def benchmark_threads(_: list[str]) -> None:
+    """Report the throughput of get_texts for growing numbers of threads."""
+    documents = get_small_documents() * THREAD_DOCUMENT_ROUNDS + [get_article_page()] * THREAD_DOCUMENT_ROUNDS
+    config = ParserConfig()
+    expected = [get_text(html, config) for html in documents]
+    # sys._is_gil_enabled is only available on Python 3.13+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"\nThread scaling ({len(documents)} documents, GIL {'enabled' if gil_enabled else 'disabled'})")
+    base_throughput = None
+    for thread_count in THREAD_COUNTS:
+        elapsed = float("inf")
+        for _ in range(TRIES):
+            start_time = perf_counter()
+            texts = get_texts(documents, config, max_workers=thread_count)
+            elapsed = min(elapsed, perf_counter() - start_time)
+        if texts != expected:
+            print(f"WARNING: the output of {thread_count} threads differs from the sequential conversion.")
+        throughput = len(documents) / elapsed
+        base_throughput = base_throughput or throughput
+        print(
+            f"  {thread_count:2d} threads {throughput:10.1f} documents/s ({throughput / base_throughput:6.2f}x)",
+        )
+
+
+SCENARIOS = {
+    "sax": benchmark_sax,
+    "traversal": benchmark_traversal,
+    "backends": benchmark_backends,
+    "svg": benchmark_svg,
+    "normalisation": benchmark_normalisation,
+    "many": benchmark_many,
+    "preview": benchmark_preview,
+    "guards": benchmark_guards,
+    "converter": benchmark_converter,
+    "plaintext": benchmark_plain_text,
+    "elements": benchmark_elements,
+    "stylesheets": benchmark_style_sheets,
+    "threads": benchmark_threads,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the benchmarking arguments."""
+    parser = argparse.ArgumentParser(description="Inscriptis engine benchmarks")
+    parser.add_argument(
+        "scenario",
+        nargs="*",
+        choices=[[], *SCENARIOS],
+        help=f"The scenarios to run (options: {', '.join(SCENARIOS)}; default: all).",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark_pages = [get_large_page(), *get_cached_pages()]
+    for scenario in args.scenario or SCENARIOS:
+        SCENARIOS[scenario](benchmark_pages)
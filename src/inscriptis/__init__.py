@@ -61,60 +61,57 @@ Annotations in the `label` field are returned as a list of triples with
 
 from __future__ import annotations
 
-import re
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
 from typing import TYPE_CHECKING, Any
 
-from lxml.etree import ParserError
-from lxml.html import HtmlElement, fromstring
-
-from inscriptis.html_engine import Inscriptis
+from inscriptis.backend import DEFAULT_PARSER_BACKEND, get_parser_backend
+from inscriptis.html_engine import Inscriptis, InscriptisRenderer, InscriptisStream
+from inscriptis.model.canvas import Canvas
+from inscriptis.model.config import ParserConfig, get_default_config
+from inscriptis.result import ConversionResult
 
 if TYPE_CHECKING:
-    from inscriptis.model.config import ParserConfig
-
-RE_STRIP_XML_DECLARATION = re.compile(r"^<\?xml [^>]+?\?>")
-
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import IO
 
-def _get_html_tree(html_content: str) -> HtmlElement | None:
-    """Obtain the HTML parse tree for the given HTML content.
-
-    Args:
-        html_content: The content to parse.
 
-    Returns:
-        The corresponding HTML parse tree.
+# number of characters (or bytes) read at once by `iter_text`
+STREAM_CHUNK_SIZE = 65536
 
-    """
-    html_content = html_content.strip()
-    if not html_content:
-        return None
+HtmlContent = str | bytes | memoryview
 
-    # strip XML declaration, if necessary
-    if html_content.startswith("<?xml "):
-        html_content = RE_STRIP_XML_DECLARATION.sub("", html_content, count=1)
 
-    try:
-        return fromstring(html_content)
-    except ParserError:
-        return fromstring("<pre>" + html_content + "</pre>")
+def _parse_html(html_content: HtmlContent, config: ParserConfig | None, encoding: str | None) -> Any:
+    """Parse the HTML content with the parser backend specified in the config."""
+    if config is None:
+        return get_parser_backend(DEFAULT_PARSER_BACKEND).parse(html_content, encoding)
+    return get_parser_backend(config.parser_backend).parse(html_content, encoding, config.drop_elements)
 
 
-def get_text(html_content: str, config: ParserConfig | None = None) -> str:
+def get_text(html_content: HtmlContent, config: ParserConfig | None = None, encoding: str | None = None) -> str:
     """Provide a text representation of the given HTML content.
 
     Args:
-      html_content (str): The HTML content to convert.
+      html_content (str): The HTML content to convert (either as str or as
+        bytes).
       config: An optional ParserConfig object.
+      encoding: An optional encoding which overrides the encoding declared
+        by byte content.
 
     Returns:
       The text representation of the HTML content.
 
     """
-    html_tree = _get_html_tree(html_content)
+    html_tree = _parse_html(html_content, config, encoding)
     return Inscriptis(html_tree, config).get_text() if html_tree is not None else ""
 
 
-def get_annotated_text(html_content: str, config: ParserConfig | None = None) -> dict[str, Any]:
+def get_annotated_text(
+    html_content: HtmlContent,
+    config: ParserConfig | None = None,
+    encoding: str | None = None,
+) -> dict[str, Any]:
     """Return a dictionary of the extracted text and annotations.
 
     Notes:
@@ -128,15 +125,283 @@ def get_annotated_text(html_content: str, config: ParserConfig | None = None) ->
         {"text": "Peter Blackburn",
          "label": [ [0, 15, "heading"] ]}
 
+    Args:
+      html_content: The HTML content to convert (either as str or as bytes).
+      config: An optional ParserConfig object.
+      encoding: An optional encoding which overrides the encoding declared
+        by byte content.
+
     Returns:
         A dictionary of text (key: 'text') and annotations (key: 'label')
 
     """
-    html_tree = _get_html_tree(html_content)
+    html_tree = _parse_html(html_content, config, encoding)
     if html_tree is None:
         return {}
 
-    inscriptis = Inscriptis(html_tree, config)
-    text = inscriptis.get_text()
-    labels = [(a.start, a.end, a.metadata) for a in inscriptis.get_annotations()]
-    return {"text": text, "label": labels}
+    result = Inscriptis(html_tree, config).get_result()
+    return {"text": result.text, "label": result.labels}
+
+
+def get_result(
+    html_content: HtmlContent,
+    config: ParserConfig | None = None,
+    encoding: str | None = None,
+) -> ConversionResult:
+    """Return the lazily computed result of the conversion.
+
+    In contrast to :func:`get_text` and :func:`get_annotated_text`, the
+    result's projections (i.e., its text, lines, blocks, annotations, labels
+    and surface forms) are only computed once they are accessed.
+
+    Examples:
+        result = get_result(html, ParserConfig(annotation_rules={"h1": ["heading"]}))
+        print(result.head(5))
+        print(result.surfaces)
+
+    Args:
+      html_content: The HTML content to convert (either as str or as bytes).
+      config: An optional ParserConfig object.
+      encoding: An optional encoding which overrides the encoding declared
+        by byte content.
+
+    Returns:
+        The :class:`~inscriptis.result.ConversionResult`.
+
+    """
+    html_tree = _parse_html(html_content, config, encoding)
+    if html_tree is None:
+        return ConversionResult(Canvas())
+    return Inscriptis(html_tree, config).get_result()
+
+
+class Converter:
+    """Convert many documents with the same configuration.
+
+    The converter resolves the parser backend and sets up the renderer and
+    its document state only once, so that the per-document overhead of
+    :func:`get_text` and :func:`get_annotated_text` is avoided for batch
+    workloads with many (small) documents. Converters are not thread-safe;
+    use one converter per thread (see :func:`get_texts`).
+
+    Examples:
+        converter = Converter(ParserConfig(annotation_rules={"h1": ["heading"]}))
+        for html in documents:
+            result = converter.convert_annotated(html)
+
+    Args:
+      config: An optional ParserConfig object.
+
+    Attributes:
+      fired_guards: the names of the resource guards (i.e., `max_elements`,
+        `max_depth` or `max_table_cells`) which fired while converting the
+        last document.
+
+    """
+
+    def __init__(self, config: ParserConfig | None = None) -> None:
+        # a private default configuration, since the shared one must not be modified
+        self.config = config or ParserConfig()
+        self._backend = get_parser_backend(self.config.parser_backend)
+        self._renderer = InscriptisRenderer(self.config)
+        self.fired_guards: frozenset[str] = frozenset()
+
+    def _render(self, html_content: HtmlContent, encoding: str | None) -> InscriptisRenderer | None:
+        """Parse and render the given HTML content."""
+        self.fired_guards = frozenset()
+        html_tree = self._backend.parse(html_content, encoding, self.config.drop_elements)
+        if html_tree is None:
+            return None
+        renderer = self._renderer.render(html_tree)
+        self.fired_guards = frozenset(renderer.fired_guards)
+        return renderer
+
+    def convert(self, html_content: HtmlContent, encoding: str | None = None) -> str:
+        """Provide a text representation of the given HTML content.
+
+        Args:
+          html_content: The HTML content to convert (either as str or as bytes).
+          encoding: An optional encoding which overrides the encoding declared
+            by byte content.
+
+        Returns:
+          The text representation of the HTML content (see :func:`get_text`).
+
+        """
+        renderer = self._render(html_content, encoding)
+        return renderer.get_text() if renderer else ""
+
+    def convert_annotated(self, html_content: HtmlContent, encoding: str | None = None) -> dict[str, Any]:
+        """Return a dictionary of the extracted text and annotations.
+
+        Args:
+          html_content: The HTML content to convert (either as str or as bytes).
+          encoding: An optional encoding which overrides the encoding declared
+            by byte content.
+
+        Returns:
+            A dictionary of text (key: 'text') and annotations (key: 'label')
+            (see :func:`get_annotated_text`).
+
+        """
+        if not (renderer := self._render(html_content, encoding)):
+            return {}
+        result = renderer.get_result()
+        return {"text": result.text, "label": result.labels}
+
+    def convert_result(self, html_content: HtmlContent, encoding: str | None = None) -> ConversionResult:
+        """Return the lazily computed result of the conversion.
+
+        Args:
+          html_content: The HTML content to convert (either as str or as bytes).
+          encoding: An optional encoding which overrides the encoding declared
+            by byte content.
+
+        Returns:
+            The :class:`~inscriptis.result.ConversionResult` (see
+            :func:`get_result`), which remains valid after converting
+            further documents.
+
+        """
+        renderer = self._render(html_content, encoding)
+        return renderer.get_result() if renderer else ConversionResult(Canvas())
+
+
+def get_texts(
+    html_contents: Iterable[HtmlContent],
+    config: ParserConfig | None = None,
+    encoding: str | None = None,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Convert many documents concurrently with a pool of threads.
+
+    Every worker thread uses its own :class:`Converter`, while the
+    configuration and its render plan are shared by all threads. The
+    conversion scales with the number of threads on free-threaded Python
+    builds (e.g., CPython 3.13t); otherwise, only lxml's parsing runs
+    without holding the GIL.
+
+    Examples:
+        texts = get_texts(documents, ParserConfig(display_links=True), max_workers=8)
+
+    Args:
+      html_contents: The HTML content of the documents to convert (either
+        as str or as bytes).
+      config: An optional ParserConfig object, which must not be modified
+        during the conversion.
+      encoding: An optional encoding which overrides the encoding declared
+        by byte content.
+      max_workers: The maximum number of threads (default: see
+        :class:`concurrent.futures.ThreadPoolExecutor`).
+
+    Returns:
+      The text representations of the documents in the order of
+      `html_contents` (see :func:`get_text`).
+
+    """
+    config = config or get_default_config()
+    # compile the render plan once rather than in every thread
+    _ = config.render_plan
+    converters = local()
+
+    def convert(html_content: HtmlContent) -> str:
+        converter = getattr(converters, "converter", None)
+        if converter is None:
+            converter = converters.converter = Converter(config)
+        return converter.convert(html_content, encoding)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(convert, html_contents))
+
+
+def render_many(
+    html_content: HtmlContent,
+    configs: Sequence[ParserConfig],
+    encoding: str | None = None,
+) -> list[dict[str, Any]]:
+    """Render the given HTML content with several configurations at once.
+
+    The content is parsed only once and the resulting tree is rendered with
+    every configuration, which saves the repeated parsing required when
+    calling :func:`get_text` or :func:`get_annotated_text` for every
+    configuration.
+
+    Examples:
+        strict, annotated = render_many(html, [
+            ParserConfig(css=CSS_PROFILES["strict"]),
+            ParserConfig(annotation_rules={"h1": ["heading"]})])
+        print(strict["text"])
+        print(annotated["label"])
+
+    Args:
+      html_content: The HTML content to convert (either as str or as bytes).
+      configs: The ParserConfig objects to render the content with. All
+        configurations need to use the same parser backend and elements to
+        drop, since the content is only parsed once.
+      encoding: An optional encoding which overrides the encoding declared
+        by byte content.
+
+    Returns:
+        A list which contains a dictionary of text (key: 'text') and
+        annotations (key: 'label') for every configuration.
+
+    Raises:
+        ValueError: if the configurations require different parse trees.
+
+    """
+    if not configs:
+        return []
+    if len({(config.parser_backend, config.drop_elements) for config in configs}) > 1:
+        msg = "All configurations need to use the same parser backend and elements to drop."
+        raise ValueError(msg)
+
+    html_tree = _parse_html(html_content, configs[0], encoding)
+    if html_tree is None:
+        return [{"text": "", "label": []} for _ in configs]
+
+    results = [Inscriptis(html_tree, config).get_result() for config in configs]
+    return [{"text": result.text, "label": result.labels} for result in results]
+
+
+def iter_text(
+    source: IO,
+    config: ParserConfig | None = None,
+    encoding: str | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Incrementally convert large HTML documents to text.
+
+    The document is read chunk by chunk and rendered with
+    :class:`~inscriptis.html_engine.InscriptisStream`, which frees rendered
+    elements and discards the returned text. The memory required for the
+    conversion, therefore, does not depend on the document's size. Reading
+    stops as soon as the configuration's `max_chars` or `max_blocks` limit
+    has been reached.
+
+    Examples:
+        with open("wiki-dump.html", "rb") as f, open("wiki-dump.txt", "w") as out:
+            for text in iter_text(f, encoding="utf-8"):
+                out.write(text)
+
+    Args:
+      source: A text or binary file object that provides the HTML content.
+      config: An optional ParserConfig object.
+      encoding: An optional encoding which overrides the encoding declared
+        by byte content.
+      chunk_size: The number of characters (or bytes) to read at once.
+
+    Returns:
+      An iterator over the document's text, which yields the lines rendered
+      after every chunk.
+
+    Raises:
+      ValueError: if the configuration specifies content selectors, which
+        require the complete HTML tree.
+
+    """
+    stream = InscriptisStream(config, keep_text=False, encoding=encoding)
+    while not stream.finished and (chunk := source.read(chunk_size)):
+        if text := stream.feed(chunk):
+            yield text
+    if text := stream.close():
+        yield text
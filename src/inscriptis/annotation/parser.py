@@ -72,6 +72,10 @@ class ApplyAnnotation:
 class AnnotationModel:
     """Adapt the CSS profile and CSS attributes for annotation support.
 
+    The given CSS profile and its HtmlElements are not modified, since
+    profiles such as :data:`inscriptis.css_profiles.CSS_PROFILES` are shared
+    by all configurations (and threads).
+
     Attributes:
         css: the refined CSS class which contains annotations for HtmlElements
              which should be annotated.
@@ -81,11 +85,12 @@ class AnnotationModel:
 
     def __init__(self, css_profile, model: dict):
         tags, self.css_attr = self._parse(model)
+        css = dict(css_profile)
         for tag, annotations in tags.items():
-            if tag not in css_profile:
-                css_profile[tag] = copy(DEFAULT_HTML_ELEMENT)
-            css_profile[tag].annotation += tuple(annotations)
-        self.css = css_profile
+            # copy-on-write: only annotated elements are copied
+            css[tag] = copy(css.get(tag, DEFAULT_HTML_ELEMENT))
+            css[tag].annotation += tuple(annotations)
+        self.css = css
 
     @staticmethod
     def _parse(model: dict) -> tuple[dict, list]:
@@ -0,0 +1,104 @@
+"""Pluggable HTML parser backends.
+
+Parser backends turn HTML content into a tree that is rendered by
+:class:`~inscriptis.html_engine.Inscriptis`. Inscriptis only relies on the
+following subset of lxml's element API, which every backend's tree needs to
+provide:
+
+ - `tag`: the element's tag name or :func:`lxml.etree.Comment` for comments.
+ - `attrib`: a mapping of the element's attribute names to their values.
+ - `text`: the text before the element's first child.
+ - `tail`: the text between the element's end tag and the next node.
+ - iterating over an element yields its child elements and comments.
+ - `iter(tag)`: yields the element's descendants with the given tag (only
+   required for :attr:`~inscriptis.model.config.ParserConfig.parse_style_sheets`).
+
+Inscriptis ships with the following backends:
+
+ - `lxml`: lxml's HTML parser (default).
+ - `html5lib`: the html5lib parser, which builds an lxml tree (requires the
+   `html5lib` package).
+ - `selectolax`: the lexbor parser bundled with selectolax (requires the
+   `selectolax` package).
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from inscriptis import HtmlContent
+
+DEFAULT_PARSER_BACKEND = "lxml"
+
+PARSER_BACKENDS = {
+    "lxml": ("inscriptis.backend.lxml_backend", "LxmlBackend"),
+    "html5lib": ("inscriptis.backend.html5lib_backend", "Html5libBackend"),
+    "selectolax": ("inscriptis.backend.selectolax_backend", "SelectolaxBackend"),
+}
+
+_backend_instances: dict[str, ParserBackend] = {}
+
+
+class ParserBackend(ABC):
+    """Base class for HTML parser backends."""
+
+    name = ""
+
+    @abstractmethod
+    def parse(self, html_content: HtmlContent, encoding: str | None = None, drop_elements: Sequence[str] = ()) -> Any:
+        """Parse the given HTML content.
+
+        Args:
+            html_content: the content to parse.
+            encoding: an optional encoding which overrides the encoding
+                declared by byte content.
+            drop_elements: tag names or XPath expressions of elements to
+                remove from the tree, including their content but not their
+                tails.
+
+        Returns:
+            The root element of the parsed HTML tree or None, if the content
+            is empty.
+
+        """
+
+
+def get_parser_backend(name: str) -> ParserBackend:
+    """Return the parser backend with the given name.
+
+    Args:
+        name: the backend's name (e.g., `lxml`, `html5lib` or `selectolax`).
+
+    Raises:
+        ValueError: for unknown backends.
+        ImportError: if the backend's parser library is not installed.
+
+    """
+    if backend := _backend_instances.get(name):
+        return backend
+
+    if name not in PARSER_BACKENDS:
+        msg = f"Unknown parser backend '{name}' (available: {', '.join(PARSER_BACKENDS)})."
+        raise ValueError(msg)
+
+    module_name, class_name = PARSER_BACKENDS[name]
+    backend = getattr(import_module(module_name), class_name)()
+    _backend_instances[name] = backend
+    return backend
+
+
+def get_available_parser_backends() -> list[str]:
+    """Return the names of all parser backends whose libraries are installed."""
+    available = []
+    for name in PARSER_BACKENDS:
+        try:
+            get_parser_backend(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
@@ -0,0 +1,200 @@
+"""Build and prune the lxml trees of the lxml and html5lib parser backends."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from lxml.etree import ParserError, XPath, strip_elements
+from lxml.html import Element, HTMLParser, document_fromstring, fromstring
+
+from inscriptis.encoding import decode, detect_encoding
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from lxml.etree import _Element
+    from lxml.html import HtmlElement
+
+    from inscriptis import HtmlContent
+
+# leading XML declarations and the start of full HTML documents (rather than
+# fragments) are matched in place to avoid copying the content
+RE_XML_DECLARATION = re.compile(r"\s*<\?xml [^>]+?\?>")
+RE_XML_DECLARATION_BYTES = re.compile(rb"\s*<\?xml [^>]+?\?>")
+RE_FULL_HTML = re.compile(r"\s*<(?:html|!doctype)", re.IGNORECASE)
+RE_FULL_HTML_BYTES = re.compile(rb"\s*<(?:html|!doctype)", re.IGNORECASE)
+
+# encoding used for byte content that does not declare its encoding
+DEFAULT_ENCODING = "utf-8"
+
+RE_TAG_NAME = re.compile(r"^[A-Za-z][\w:.-]*$")
+# tag assigned to elements matched by XPath expressions prior to stripping them
+DROP_TAG = "inscriptis-drop"
+
+
+@lru_cache(maxsize=128)
+def compile_xpath(expression: str) -> XPath:
+    """Return the compiled XPath expression."""
+    return XPath(expression)
+
+
+def drop_elements_from_tree(html_tree: _Element, expressions: Sequence[str]) -> _Element | None:
+    """Remove the elements matching the given tag names or XPath expressions.
+
+    The elements are removed with lxml's `strip_elements`, which keeps their
+    tails, so that the text following a dropped element is preserved. Tag
+    names match elements in any namespace (e.g. the `svg` and `math`
+    elements created by html5lib). XPath expressions only drop the matching
+    elements within the HTML tree, while other results (e.g. comments, text
+    or attributes) are ignored.
+
+    Args:
+        html_tree: the HTML tree to prune.
+        expressions: tag names (e.g. `svg`) or XPath expressions (e.g.
+            `//div[@role="navigation"]`) of the elements to drop.
+
+    Returns:
+        The pruned HTML tree or None, if the root element has been dropped.
+
+    """
+    tags = set()
+    # dropping an ancestor of an HTML fragment's root also drops the fragment
+    root_ancestors = set(html_tree.iterancestors())
+    for expression in expressions:
+        if RE_TAG_NAME.match(expression):
+            tags.add(expression)
+            continue
+        result = compile_xpath(expression)(html_tree)
+        # expressions such as `count(//a)` evaluate to strings, numbers or booleans
+        for element in result if isinstance(result, list) else ():
+            if not isinstance(getattr(element, "tag", None), str):
+                continue
+            if element is html_tree or element in root_ancestors:
+                return None
+            if any(ancestor is html_tree for ancestor in element.iterancestors()):
+                element.tag = DROP_TAG
+                tags.add(DROP_TAG)
+
+    if html_tree.tag.rpartition("}")[2] in tags:
+        return None
+    strip_elements(html_tree, *(f"{{*}}{tag}" for tag in tags), with_tail=False)
+    return html_tree
+
+
+def get_trailing_whitespace(html_content: str | bytes) -> tuple[str, str]:
+    """Return the content's trailing whitespace and the character preceding it.
+
+    Only the end of the content is inspected, so that the content is not
+    copied.
+    """
+    end = len(html_content)
+    while end and html_content[end - 1 : end].isspace():
+        end -= 1
+    trailing, preceding = html_content[end:], html_content[end - 1 : end]
+    if isinstance(trailing, bytes):
+        trailing, preceding = trailing.decode("ascii"), preceding.decode("latin-1")
+    return trailing.replace("\r\n", "\n").replace("\r", "\n"), preceding
+
+
+def strip_trailing_whitespace(html_tree: HtmlElement, trailing: str, preceding: str) -> None:
+    """Remove the content's trailing whitespace from the HTML tree.
+
+    The whitespace is contained in the tree's last text or tail, unless lxml
+    has dropped it (e.g., after `</html>`). Removing it ensures that trailing
+    whitespace does not show up in preformatted content.
+
+    Args:
+        html_tree: the parsed HTML tree.
+        trailing: the content's trailing whitespace.
+        preceding: the character preceding the trailing whitespace.
+
+    """
+    element = html_tree
+    while not element.tail and len(element):
+        element = element[-1]
+    if element.tail:
+        attr = "tail"
+    elif isinstance(element.tag, str):
+        attr = "text"
+    else:
+        return
+
+    # only strip the text, if it ends with the content's trailing whitespace
+    text = getattr(element, attr) or ""
+    stripped = text.rstrip()
+    if text.endswith(trailing) and (not stripped or stripped.endswith(preceding)):
+        setattr(element, attr, text[: -len(trailing)] or None)
+
+
+def get_html_tree(
+    html_content: HtmlContent,
+    encoding: str | None = None,
+    drop_elements: Sequence[str] = (),
+) -> HtmlElement | None:
+    """Obtain the HTML parse tree for the given HTML content.
+
+    The encoding of byte content is determined by
+    :func:`inscriptis.encoding.detect_encoding` (i.e., based on byte order
+    marks and `<meta charset>` declarations). Content without any encoding
+    declaration is considered to be UTF-8 encoded. Encodings unknown to
+    lxml are decoded by Python.
+
+    The content is handed to lxml without copying it (except for Unicode
+    strings with an XML encoding declaration, which lxml rejects). Leading
+    whitespace and XML declarations are only inspected in place and documents
+    without any content (e.g., documents that only contain comments) yield an
+    empty `<pre>` element rather than being parsed a second time. Trailing
+    whitespace is removed from the parsed tree rather than from the content,
+    so that it does not show up in preformatted content.
+
+    Args:
+        html_content: The content to parse.
+        encoding: An optional encoding which overrides the encoding declared
+            by byte content.
+        drop_elements: Tag names or XPath expressions of elements which are
+            removed from the tree (see :attr:`~inscriptis.model.config.ParserConfig.drop_elements`).
+
+    Returns:
+        The corresponding HTML parse tree.
+
+    """
+    if isinstance(html_content, memoryview):
+        html_content = html_content.tobytes()
+    if not html_content or html_content.isspace():
+        return None
+
+    parser = None
+    if not isinstance(html_content, str):
+        encoding = encoding or detect_encoding(html_content) or DEFAULT_ENCODING
+        try:
+            parser = HTMLParser(encoding=encoding)
+        except LookupError:
+            html_content = decode(html_content, encoding)
+
+    if isinstance(html_content, str):
+        declaration = RE_XML_DECLARATION.match(html_content)
+        if declaration and "encoding" in declaration.group():
+            # lxml rejects Unicode strings with encoding declarations
+            html_content = html_content[declaration.end() :]
+            declaration = None
+        is_full_html = declaration and RE_FULL_HTML.match(html_content, declaration.end())
+    else:
+        declaration = RE_XML_DECLARATION_BYTES.match(html_content)
+        is_full_html = declaration and RE_FULL_HTML_BYTES.match(html_content, declaration.end())
+
+    try:
+        # lxml's fragment detection does not skip XML declarations
+        html_tree = (
+            document_fromstring(html_content, parser=parser)
+            if is_full_html
+            else fromstring(html_content, parser=parser)
+        )
+    except ParserError:
+        # the document does not contain any elements or text
+        return Element("pre")
+
+    if html_content[-1:].isspace():
+        strip_trailing_whitespace(html_tree, *get_trailing_whitespace(html_content))
+    return drop_elements_from_tree(html_tree, drop_elements) if drop_elements else html_tree
@@ -0,0 +1,43 @@
+"""Parse HTML content with html5lib."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import html5lib
+
+from inscriptis.backend import ParserBackend
+from inscriptis.backend._tree import drop_elements_from_tree
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from lxml.etree import _Element
+
+    from inscriptis import HtmlContent
+
+
+class Html5libBackend(ParserBackend):
+    """Parse HTML content with html5lib's HTML5 compliant parser.
+
+    html5lib builds an lxml tree, so that the result of the parser is
+    directly rendered by Inscriptis.
+    """
+
+    name = "html5lib"
+
+    def parse(
+        self,
+        html_content: HtmlContent,
+        encoding: str | None = None,
+        drop_elements: Sequence[str] = (),
+    ) -> _Element | None:
+        if isinstance(html_content, memoryview):
+            html_content = html_content.tobytes()
+        if not html_content.strip():
+            return None
+
+        # html5lib only accepts encoding hints for byte content
+        kwargs = {"override_encoding": encoding} if encoding and isinstance(html_content, bytes) else {}
+        html_tree = html5lib.parse(html_content, treebuilder="lxml", namespaceHTMLElements=False, **kwargs).getroot()
+        return drop_elements_from_tree(html_tree, drop_elements) if drop_elements else html_tree
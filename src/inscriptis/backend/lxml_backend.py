@@ -0,0 +1,29 @@
+"""Parse HTML content with lxml's HTML parser."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from inscriptis.backend import ParserBackend
+from inscriptis.backend._tree import get_html_tree
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from lxml.html import HtmlElement
+
+    from inscriptis import HtmlContent
+
+
+class LxmlBackend(ParserBackend):
+    """Parse HTML content with lxml (the default backend)."""
+
+    name = "lxml"
+
+    def parse(
+        self,
+        html_content: HtmlContent,
+        encoding: str | None = None,
+        drop_elements: Sequence[str] = (),
+    ) -> HtmlElement | None:
+        return get_html_tree(html_content, encoding, drop_elements)
@@ -0,0 +1,113 @@
+"""Parse HTML content with the lexbor parser bundled with selectolax."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lxml.etree import Comment
+from selectolax.lexbor import LexborHTMLParser
+
+from inscriptis.backend import ParserBackend
+from inscriptis.backend._tree import DEFAULT_ENCODING, RE_TAG_NAME
+from inscriptis.encoding import decode, detect_encoding
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from selectolax.lexbor import LexborNode
+
+    from inscriptis import HtmlContent
+
+TEXT_NODE = "-text"
+COMMENT_NODE = "-comment"
+
+
+def _collect_text(node: LexborNode | None) -> tuple[str | None, LexborNode | None]:
+    """Collect the text of the given node and its text node siblings.
+
+    Returns:
+        A tuple of the collected text (or None, if there is no text) and the
+        first sibling that is not a text node.
+
+    """
+    text = []
+    while node is not None and node.tag == TEXT_NODE:
+        text.append(node.text_content)
+        node = node.next
+    return "".join(text) or None, node
+
+
+class LexborElement:
+    """Expose a lexbor node with the element API required by Inscriptis.
+
+    Args:
+        node: the lexbor element or comment node.
+        tail: the text between the node and its next sibling.
+
+    """
+
+    __slots__ = ("_node", "attrib", "tag", "tail", "text")
+
+    def __init__(self, node: LexborNode, tail: str | None = None):
+        self._node = node
+        self.tail = tail
+        if node.tag == COMMENT_NODE:
+            self.tag = Comment
+            self.attrib = {}
+            self.text = node.comment_content
+        else:
+            self.tag = node.tag
+            self.attrib = {key: value or "" for key, value in node.attributes.items()}
+            self.text, _ = _collect_text(node.child)
+
+    def iter(self, tag: str) -> Iterator[LexborElement]:
+        """Iterate over the element's descendants with the given tag in document order."""
+        if self.tag is Comment:
+            return
+        for node in self._node.css(tag):
+            yield LexborElement(node)
+
+    def __iter__(self) -> Iterator[LexborElement]:
+        if self.tag is Comment:
+            return
+
+        # skip the element's text
+        _, child = _collect_text(self._node.child)
+        while child is not None:
+            tail, next_child = _collect_text(child.next)
+            if child.tag == COMMENT_NODE or not child.tag.startswith(("-", "_", "!")):
+                yield LexborElement(child, tail)
+            child = next_child
+
+
+class SelectolaxBackend(ParserBackend):
+    """Parse HTML content with selectolax's lexbor parser.
+
+    The backend only supports tag names (but no XPath expressions) for
+    dropping elements.
+    """
+
+    name = "selectolax"
+
+    def parse(
+        self,
+        html_content: HtmlContent,
+        encoding: str | None = None,
+        drop_elements: Sequence[str] = (),
+    ) -> LexborElement | None:
+        if isinstance(html_content, memoryview):
+            html_content = html_content.tobytes()
+        if not html_content.strip():
+            return None
+
+        # lexbor expects UTF-8 encoded byte content
+        if isinstance(html_content, bytes):
+            html_content = decode(html_content, encoding or detect_encoding(html_content) or DEFAULT_ENCODING)
+        parser = LexborHTMLParser(html_content)
+        if drop_elements:
+            if unsupported := [tag for tag in drop_elements if not RE_TAG_NAME.match(tag)]:
+                msg = f"The selectolax backend does not support XPath expressions ({', '.join(unsupported)})."
+                raise ValueError(msg)
+            parser.strip_tags(list(drop_elements), recursive=True)
+        root = parser.root
+        return LexborElement(root) if root is not None else None
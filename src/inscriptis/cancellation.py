@@ -0,0 +1,60 @@
+"""Cooperative cancellation and time budgets for HTML to text conversions.
+
+Conversions with a :attr:`~inscriptis.model.config.ParserConfig.timeout`
+or a :attr:`~inscriptis.model.config.ParserConfig.cancellation_token`
+check periodically (i.e., every :data:`ELEMENT_CHECK_INTERVAL` elements
+and every :data:`ROW_CHECK_INTERVAL` table rows) whether they have to be
+aborted, and raise a :class:`ConversionCancelled` exception in this case.
+
+Example::
+
+    from threading import Timer
+
+    from inscriptis import get_text
+    from inscriptis.cancellation import CancellationToken, ConversionCancelled
+    from inscriptis.model.config import ParserConfig
+
+    token = CancellationToken()
+    Timer(1.0, token.cancel).start()
+    try:
+        text = get_text(html_content, ParserConfig(cancellation_token=token))
+    except ConversionCancelled:
+        text = None
+"""
+
+from __future__ import annotations
+
+# number of elements converted between two cancellation checks
+ELEMENT_CHECK_INTERVAL = 256
+# number of table rows rendered between two cancellation checks
+ROW_CHECK_INTERVAL = 64
+
+
+class ConversionCancelled(Exception):  # noqa: N818
+    """The conversion has been cancelled with a :class:`CancellationToken`."""
+
+
+class ConversionTimeout(ConversionCancelled):
+    """The conversion has exceeded the configured timeout."""
+
+
+class CancellationToken:
+    """A token that allows cancelling running conversions.
+
+    A single token may be shared by several conversions (e.g., by all
+    conversions of a request), which are cancelled at once.
+    """
+
+    __slots__ = ("_cancelled",)
+
+    def __init__(self) -> None:
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel all conversions using this token."""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        """Indicate whether the token has been cancelled."""
+        return self._cancelled
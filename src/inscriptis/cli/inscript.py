@@ -9,7 +9,10 @@ from pathlib import Path
 import requests
 
 from inscriptis import get_annotated_text, get_text
+from inscriptis.backend import DEFAULT_PARSER_BACKEND, PARSER_BACKENDS
+from inscriptis.cancellation import ConversionCancelled
 from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.encoding import detect_encoding
 from inscriptis.metadata import __copyright__, __license__, __version__
 from inscriptis.model.config import ParserConfig
 
@@ -51,7 +54,7 @@ def parse_command_line() -> argparse.Namespace:
         "-e",
         "--encoding",
         type=str,
-        help="Input encoding to use (default:utf-8 for files; detected server encoding for Web URLs).",
+        help="Input encoding to use (default: the encoding declared by the HTTP header, the document or utf-8).",
     )
     parser.add_argument(
         "-i",
@@ -104,11 +107,38 @@ def parse_command_line() -> argparse.Namespace:
         default="  ",
         help="Separator to use between table cells (default: three spaces).",
     )
+    parser.add_argument(
+        "--parser-backend",
+        default=DEFAULT_PARSER_BACKEND,
+        choices=PARSER_BACKENDS,
+        help=f"HTML parser backend to use (default: {DEFAULT_PARSER_BACKEND}).",
+    )
+    parser.add_argument(
+        "--drop-element",
+        action="append",
+        default=[],
+        dest="drop_elements",
+        metavar="ELEMENT",
+        help="Tag name or XPath expression of elements to drop prior to rendering (can be used multiple times).",
+    )
+    parser.add_argument(
+        "--parse-style-sheets",
+        action="store_true",
+        default=False,
+        help="Apply the rules of the document's <style> sheets (default:false).",
+    )
     parser.add_argument(
         "--timeout",
         default=DEFAULT_TIMEOUT,
         help=f"Request timeout in seconds (default: {DEFAULT_TIMEOUT}).",
     )
+    parser.add_argument(
+        "--conversion-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Abort conversions which take longer than the given number of seconds (default: no timeout).",
+    )
     parser.add_argument(
         "-v",
         "--version",
@@ -128,33 +158,34 @@ def parse_command_line() -> argparse.Namespace:
     return args
 
 
-def get_html_content(url: str, timeout: int, encoding: str = "") -> str:
+def get_html_content(url: str, timeout: int) -> tuple[bytes, str | None]:
     """Return the HTML content to convert.
 
     Args:
         url: URL to the HTML content, or None if the content is obtained from stdin.
-        encoding: used encoding.
         timeout: timeout in seconds for retrieving the URL.
 
     Returns:
-        The html_content or None, if no content could be extracted.
+        The raw html_content (or an empty byte string, if no content could be
+        extracted) and the Content-Type header of URLs.
 
     """
     if not url:
-        return sys.stdin.read()
+        return sys.stdin.buffer.read(), None
     if (p := Path(url)).is_file():
-        with p.open(encoding=encoding or DEFAULT_ENCODING, errors="ignore") as f:
-            return f.read()
+        with p.open("rb") as f:
+            return f.read(), None
     elif url.startswith(("http://", "https://")):
         req = requests.get(url, timeout=timeout)
-        return req.content.decode(encoding or req.encoding or DEFAULT_ENCODING, errors="ignore")
-    return ""
+        return req.content, req.headers.get("Content-Type")
+    return b"", None
 
 
 def cli() -> None:
     """Run the inscript command line client."""
     args = parse_command_line()
-    if not (html_content := get_html_content(args.input, args.timeout, args.encoding)):
+    html_content, content_type = get_html_content(args.input, args.timeout)
+    if not html_content:
         print(f"ERROR: Cannot open input file '{args.input}'.")
         sys.exit(-1)
 
@@ -177,13 +208,22 @@ def cli() -> None:
         display_anchors=args.display_anchor_urls,
         annotation_rules=annotation_rules,
         table_cell_separator=args.table_cell_separator,
+        parser_backend=args.parser_backend,
+        drop_elements=args.drop_elements,
+        timeout=args.conversion_timeout,
+        parse_style_sheets=args.parse_style_sheets,
     )
-    if not annotation_rules:
-        output = get_text(html_content, config)
-    else:
-        output = args.postprocessor(get_annotated_text(html_content, config))
-        if hasattr(args.postprocessor, "verbatim") and not args.postprocessor.verbatim:
-            output = dumps(output)
+    encoding = args.encoding or detect_encoding(html_content, content_type)
+    try:
+        if not annotation_rules:
+            output = get_text(html_content, config, encoding)
+        else:
+            output = args.postprocessor(get_annotated_text(html_content, config, encoding))
+            if hasattr(args.postprocessor, "verbatim") and not args.postprocessor.verbatim:
+                output = dumps(output)
+    except ConversionCancelled as e:
+        print(f"ERROR: {e}")
+        sys.exit(-1)
 
     if args.output:
         with Path(args.output).open("w", encoding=DEFAULT_ENCODING) as f:
@@ -0,0 +1,301 @@
+"""Determine the encoding of raw HTML content.
+
+The encoding is determined cheaply (i.e., without decoding or inspecting the
+whole document) based on
+
+1. the content's byte order mark (BOM),
+2. the `charset` parameter of an optional HTTP `Content-Type` header, and
+3. `<meta charset>` and `<meta http-equiv="Content-Type">` declarations
+   within the first :data:`PRESCAN_LEN` bytes, which are located with the
+   WHATWG `prescan algorithm
+   <https://html.spec.whatwg.org/multipage/parsing.html#prescan-a-byte-stream-to-determine-its-encoding>`_,
+   and
+4. the encoding of a leading XML declaration (e.g., in XHTML documents).
+
+Charset labels are mapped to the encodings of the WHATWG `encoding standard
+<https://encoding.spec.whatwg.org/#names-and-labels>`_, which browsers use
+for decoding pages (e.g., pages declared as `gb2312` are decoded as `gbk`).
+
+Example::
+
+    from inscriptis import get_text
+    from inscriptis.encoding import detect_encoding
+
+    encoding = detect_encoding(html_content, "text/html; charset=iso-8859-1")
+    text = get_text(html_content, encoding=encoding)
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+
+# number of bytes inspected by the prescan algorithm
+PRESCAN_LEN = 1024
+
+# the byte order determines the codec, which does not skip the BOM itself
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+# Python codecs which correspond to a different encoding in WHATWG's
+# encoding standard (e.g., pages declared as `iso-8859-1` use windows-1252)
+WHATWG_ENCODINGS = {
+    "ascii": "cp1252",
+    "iso8859-1": "cp1252",
+    "iso8859-9": "cp1254",
+    "iso8859-11": "cp874",
+    "tis-620": "cp874",
+    "gb2312": "gbk",
+    "shift_jis": "cp932",
+    "euc_kr": "cp949",
+    "big5": "big5hkscs",
+}
+# WHATWG labels which are unknown to Python's codec registry
+WHATWG_LABELS = {
+    "x-user-defined": "cp1252",
+    "x-cp1250": "cp1250",
+    "x-cp1251": "cp1251",
+    "x-cp1252": "cp1252",
+    "windows-874": "cp874",
+    "dos-874": "cp874",
+    "unicode-1-1-utf-8": "utf-8",
+    "unicode11utf8": "utf-8",
+    "unicode20utf8": "utf-8",
+    "x-unicode20utf8": "utf-8",
+    "x-gbk": "gbk",
+    "csgb2312": "gbk",
+    "gb_2312": "gbk",
+    "gb_2312-80": "gbk",
+    "x-sjis": "cp932",
+    "windows-31j": "cp932",
+    "windows-949": "cp949",
+    "ks_c_5601-1989": "cp949",
+    "ksc_5601": "cp949",
+    "csksc56011987": "cp949",
+    "iso-ir-149": "cp949",
+    "cn-big5": "big5hkscs",
+    "x-x-big5": "big5hkscs",
+    "x-euc-jp": "euc_jp",
+    "cseucpkdfmtjapanese": "euc_jp",
+    "iso-8859-8-i": "iso8859-8",
+    "logical": "iso8859-8",
+    "visual": "iso8859-8",
+    "koi8-ru": "koi8-u",
+    "mac": "mac-roman",
+    "csmacintosh": "mac-roman",
+    "x-mac-roman": "mac-roman",
+    "x-mac-cyrillic": "mac-cyrillic",
+    "x-mac-ukrainian": "mac-cyrillic",
+}
+
+RE_CONTENT_TYPE_CHARSET = re.compile(r';\s*charset\s*=\s*(?:"([^"]*)"|([^\s;]+))', re.IGNORECASE)
+RE_META_CHARSET = re.compile(rb"charset\s*=\s*", re.IGNORECASE)
+RE_META = re.compile(rb"<meta[\t\n\f\r /]", re.IGNORECASE)
+RE_XML_DECLARATION_ENCODING = re.compile(rb"""\s*<\?xml\s[^>]*?encoding\s*=\s*["']([^"'>]*)["']""", re.IGNORECASE)
+RE_TAG = re.compile(rb"</?[a-zA-Z]")
+RE_TAG_NAME_END = re.compile(rb"[\t\n\f\r />]")
+RE_ATTRIBUTE = re.compile(
+    rb"[\t\n\f\r /]*([^\t\n\f\r />][^\t\n\f\r />=]*)[\t\n\f\r ]*"
+    rb"""(?:=[\t\n\f\r ]*(?:"([^"]*)"|'([^']*)'|([^\t\n\f\r >]*)))?"""
+)
+
+
+def get_encoding(label: str) -> str | None:
+    """Return the encoding for the given charset label.
+
+    Args:
+        label: the charset label (e.g., `UTF-8` or `latin1`).
+
+    Returns:
+        The name of the corresponding Python codec or None, if the label does
+        not refer to an encoding supported by Python.
+
+    """
+    label = label.strip().lower()
+    try:
+        codec_name = codecs.lookup(WHATWG_LABELS.get(label, label)).name
+    except LookupError:
+        return None
+    return WHATWG_ENCODINGS.get(codec_name, codec_name)
+
+
+def get_content_type_charset(content_type: str | None) -> str | None:
+    """Return the encoding declared by the given `Content-Type` header.
+
+    Args:
+        content_type: the header's value (e.g., `text/html; charset="utf-8"`).
+
+    Returns:
+        The declared encoding or None, if no (supported) encoding is declared.
+
+    """
+    if not content_type or not (match := RE_CONTENT_TYPE_CHARSET.search(content_type)):
+        return None
+    return get_encoding(match.group(1) if match.group(1) is not None else match.group(2))
+
+
+def _get_attribute(data: bytes, pos: int) -> tuple[bytes, bytes, int] | None:
+    """Read the next attribute of a tag (WHATWG "get an attribute").
+
+    Returns:
+        The attribute's lowercase name and value and the position following
+        it or None, if the tag does not contain further attributes.
+
+    """
+    match = RE_ATTRIBUTE.match(data, pos)
+    # attributes which are cut off by the end of the prescanned data abort the prescan
+    if not match or match.end() >= len(data):
+        return None
+    name, *values = match.groups()
+    value = next((value for value in values if value is not None), b"")
+    return name.lower(), value.lower(), match.end()
+
+
+def _skip_attributes(data: bytes, pos: int) -> int:
+    """Skip the attributes of the tag at the given position.
+
+    Returns:
+        The position following the tag's attributes or -1, if the tag is
+        cut off by the end of the prescanned data.
+
+    """
+    if not (name_end := RE_TAG_NAME_END.search(data, pos)):
+        return -1
+    pos = name_end.start()
+    while attribute := _get_attribute(data, pos):
+        pos = attribute[2]
+    return pos
+
+
+def _get_meta_content_charset(content: bytes) -> bytes | None:
+    """Extract the charset from a `<meta>` element's content attribute."""
+    if not (match := RE_META_CHARSET.search(content)):
+        return None
+
+    pos = match.end()
+    if pos >= len(content):
+        return None
+    if content[pos] in b"\"'":
+        quote_end = content.find(content[pos : pos + 1], pos + 1)
+        return content[pos + 1 : quote_end] if quote_end != -1 else None
+    value_end = pos
+    while value_end < len(content) and content[value_end] not in b"\t\n\f\r ;":
+        value_end += 1
+    return content[pos:value_end] or None
+
+
+def _get_meta_encoding(data: bytes, pos: int) -> tuple[str | None, int]:
+    """Determine the encoding declared by the `<meta>` element at the given position.
+
+    Returns:
+        The declared encoding (or None) and the position following the
+        element's attributes.
+
+    """
+    names = set()
+    got_pragma = False
+    need_pragma = None
+    encoding = None
+    while attribute := _get_attribute(data, pos):
+        name, value, pos = attribute
+        if name in names:
+            continue
+        names.add(name)
+        if name == b"http-equiv":
+            got_pragma = value == b"content-type"
+        elif name == b"content" and encoding is None:
+            if (charset := _get_meta_content_charset(value)) and (encoding := _decode_label(charset)):
+                need_pragma = True
+        elif name == b"charset" and encoding is None:
+            encoding = _decode_label(value)
+            need_pragma = False
+
+    if encoding is None or need_pragma is None or (need_pragma and not got_pragma):
+        return None, pos
+    # documents cannot declare UTF-16 within themselves
+    return "utf-8" if encoding.startswith("utf-16") else encoding, pos
+
+
+def _decode_label(label: bytes) -> str | None:
+    """Return the encoding for the given charset label in bytes."""
+    return get_encoding(label.decode("ascii", errors="replace"))
+
+
+def prescan(html_content: bytes, max_len: int = PRESCAN_LEN) -> str | None:
+    """Determine the encoding declared by `<meta>` elements or an XML declaration.
+
+    The function follows the WHATWG prescan algorithm, i.e. it skips
+    comments and the attributes of other tags, and only inspects the first
+    `max_len` bytes of the content. The encoding of a leading XML
+    declaration is only used, if no `<meta>` element declares an encoding.
+
+    Args:
+        html_content: the HTML content.
+        max_len: the number of bytes to inspect.
+
+    Returns:
+        The declared encoding or None, if no (supported) encoding has been
+        declared.
+
+    """
+    data = bytes(html_content[:max_len])
+    xml_encoding = None
+    if declaration := RE_XML_DECLARATION_ENCODING.match(data):
+        xml_encoding = _decode_label(declaration.group(1))
+
+    pos = data.find(b"<")
+    while pos != -1:
+        if data.startswith(b"<!--", pos):
+            if (pos := data.find(b"-->", pos + 2)) != -1:
+                pos += 2
+        elif meta := RE_META.match(data, pos):
+            encoding, pos = _get_meta_encoding(data, meta.end() - 1)
+            if encoding:
+                return encoding
+        elif RE_TAG.match(data, pos):
+            pos = _skip_attributes(data, pos)
+        elif data.startswith((b"<!", b"</", b"<?"), pos):
+            pos = data.find(b">", pos)
+        if pos == -1:
+            break
+        pos = data.find(b"<", pos + 1)
+    # byte content declared as UTF-16 without a BOM is treated as UTF-8
+    return "utf-8" if xml_encoding and xml_encoding.startswith("utf-16") else xml_encoding
+
+
+def detect_encoding(html_content: bytes, content_type: str | None = None, max_len: int = PRESCAN_LEN) -> str | None:
+    """Determine the encoding of the given HTML content.
+
+    Args:
+        html_content: the raw HTML content.
+        content_type: an optional HTTP `Content-Type` header.
+        max_len: the number of bytes inspected for `<meta>` declarations.
+
+    Returns:
+        The encoding indicated by the content's BOM, the `Content-Type`
+        header or its `<meta>` declarations (in this order) or None, if
+        no encoding has been declared.
+
+    """
+    for bom, encoding in BOMS:
+        if html_content[: len(bom)] == bom:
+            return encoding
+    return get_content_type_charset(content_type) or prescan(html_content, max_len)
+
+
+def decode(html_content: bytes, encoding: str) -> str:
+    """Decode the given HTML content and remove its byte order mark (if any).
+
+    Args:
+        html_content: the raw HTML content.
+        encoding: the content's encoding (e.g., as obtained by
+            :func:`detect_encoding`).
+
+    Returns:
+        The decoded content, in which undecodable bytes are replaced.
+
+    """
+    text = html_content.decode(encoding, errors="replace")
+    return text.removeprefix("\ufeff")
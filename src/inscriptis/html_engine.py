@@ -5,37 +5,34 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from lxml.etree import Comment
+from lxml.etree import Comment, HTMLPullParser
 
-from inscriptis.model.config import ParserConfig
+from inscriptis.cancellation import ELEMENT_CHECK_INTERVAL
+from inscriptis.html_properties import Display
+from inscriptis.model.config import ParserConfig, get_default_config
 from inscriptis.model.html_document_state import HtmlDocumentState
-from inscriptis.model.tag.a_tag import a_end_handler, a_start_handler
-from inscriptis.model.tag.br_tag import br_start_handler
-from inscriptis.model.tag.img_tag import img_start_handler
-from inscriptis.model.tag.list_tag import (
-    li_start_handler,
-    ol_end_handler,
-    ol_start_handler,
-    ul_end_handler,
-    ul_start_handler,
-)
-from inscriptis.model.tag.table_tag import (
-    table_end_handler,
-    table_start_handler,
-    td_end_handler,
-    td_start_handler,
-    tr_start_handler,
-)
+from inscriptis.result import ConversionResult
+from inscriptis.selector import select_elements
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
     import lxml.html
 
     from inscriptis.annotation import Annotation
     from inscriptis.model.canvas import Canvas
 
 
+def _check_content_selectors(config: ParserConfig, engine: str) -> None:
+    """Reject content selectors for engines which render the document while it is parsed.
+
+    Raises:
+        ValueError: if the configuration specifies content selectors.
+
+    """
+    if config.content_selectors:
+        msg = f"{engine} does not support content selectors, since they require the complete HTML tree."
+        raise ValueError(msg)
+
+
 class Inscriptis:
     """Translate an lxml HTML tree to the corresponding text representation.
 
@@ -43,6 +40,11 @@ class Inscriptis:
       html_tree: the lxml HTML tree to convert.
       config: an optional ParserConfig configuration object.
 
+    Attributes:
+      fired_guards: the names of the resource guards (i.e., `max_elements`,
+        `max_depth` or `max_table_cells`) which caused the flattening of
+        elements.
+
     Example::
 
       from lxml.html import fromstring
@@ -61,69 +63,147 @@ class Inscriptis:
 
     def __init__(self, html_tree: lxml.html.HtmlElement, config: ParserConfig | None = None) -> None:
         # use the default configuration, if no config object is provided
-        config = config or ParserConfig()
-
-        # setup start and end tag call tables
-        self.start_tag_handler_dict: dict[str, Callable[[HtmlDocumentState, dict], None] | None] = {
-            "table": table_start_handler,
-            "tr": tr_start_handler,
-            "td": td_start_handler,
-            "th": td_start_handler,
-            "ul": ul_start_handler,
-            "ol": ol_start_handler,
-            "li": li_start_handler,
-            "br": br_start_handler,
-            "a": a_start_handler if config.parse_a() else None,
-            "img": img_start_handler if config.display_images else None,
-        }
-        self.end_tag_handler_dict: dict[str, Callable[[HtmlDocumentState], None] | None] = {
-            "table": table_end_handler,
-            "ul": ul_end_handler,
-            "ol": ol_end_handler,
-            "td": td_end_handler,
-            "th": td_end_handler,
-            "a": a_end_handler if config.parse_a() else None,
-        }
-
-        if config.custom_html_tag_handler_mapping:
-            self.start_tag_handler_dict.update(config.custom_html_tag_handler_mapping.start_tag_mapping)
-            self.end_tag_handler_dict.update(config.custom_html_tag_handler_mapping.end_tag_mapping)
+        config = config or get_default_config()
 
         # parse the HTML tree
-        self.canvas = self._parse_html_tree(HtmlDocumentState(config), html_tree)
+        state = HtmlDocumentState(config)
+        self._render(state, html_tree)
+        self.fired_guards = state.fired_guards
+
+    def _render(self, state: HtmlDocumentState, html_tree: lxml.html.HtmlElement) -> None:
+        """Render the HTML tree (or its selected elements) to the state's canvas."""
+        config = state.config
+        if state.style_sheet is not None:
+            self._collect_style_sheets(state, html_tree)
+
+        if config.content_selectors:
+            # only render the selected elements (without their tails)
+            for element in select_elements(html_tree, config.content_selectors):
+                if state.limit_reached:
+                    break
+                self._parse_html_tree(state, element, with_tail=False)
+        else:
+            self._parse_html_tree(state, html_tree)
+
+        self.canvas = state.canvas
+        if config.max_chars is not None or config.max_blocks is not None:
+            self.canvas.truncate()
+
+    @staticmethod
+    def _collect_style_sheets(state: HtmlDocumentState, html_tree: lxml.html.HtmlElement) -> None:
+        """Add the document's style sheets, which apply to the whole document, to the state."""
+        for style in html_tree.iter("style"):
+            state.style_sheet.add_style_element(style.attrib, style.text)
+
+    def _start_tag(self, state: HtmlDocumentState, tag: str, attrib: dict) -> bool:
+        """Open the given tag and apply its layout and start tag handler.
+
+        Tags that resolve to `display: none` are not opened, since neither
+        they nor their descendants contribute to the text output. Annotation
+        rules are, therefore, not applied to hidden content.
+
+        Conversions with a timeout or cancellation token check every
+        :data:`~inscriptis.cancellation.ELEMENT_CHECK_INTERVAL` elements,
+        whether they need to be aborted. Elements exceeding the configured
+        resource guards are flattened to inline text.
+
+        Returns:
+            False, if the tag (and its content) is not displayed.
 
-    def _parse_html_tree(self, state: HtmlDocumentState, tree) -> Canvas:
+        """
+        state.element_count += 1
+        if state.cancellable and not state.element_count % ELEMENT_CHECK_INTERVAL:
+            state.check_cancellation()
+
+        tag_plan = state.apply_starttag_layout(tag, attrib)
+        if state.tags[-1].display == Display.none:
+            state.tags.pop()
+            return False
+
+        # elements exceeding a resource guard (and their descendants) are
+        # rendered as inline text without tag handlers
+        if state.guarded and (state.flat_tags or state.exceeds_guard(tag)):
+            state.open_flat_element(tag)
+            return True
+
+        if tag_plan.start_handler:
+            tag_plan.start_handler(state, attrib)
+        cur = state.tags[-1]
+        cur.canvas.open_tag(cur)
+        return True
+
+    def _end_tag(self, state: HtmlDocumentState, tag: str) -> None:
+        """Apply the end tag handler of the given tag and close it."""
+        if state.flat_tags:
+            state.close_flat_element()
+            return
+
+        if handler := state.tag_plans.get(tag, state.default_tag_plan).end_handler:
+            handler(state)
+        prev = state.tags.pop()
+        prev.canvas.close_tag(prev)
+
+    def _close_open_elements(self, state: HtmlDocumentState, open_elements: list) -> None:
+        """Close the given open elements, starting with the innermost one."""
+        for element in reversed(open_elements):
+            self._end_tag(state, element.tag)
+
+    def _parse_html_tree(self, state: HtmlDocumentState, tree, with_tail: bool = True) -> Canvas:
         """Parse the HTML tree.
 
+        The tree is traversed iteratively with an explicit stack of the open
+        elements and their child iterators, so that arbitrarily deep trees
+        do not hit Python's recursion limit. Subtrees which are not displayed
+        are skipped.
+
+        The traversal stops as soon as the output reaches the configured
+        `max_chars` or `max_blocks` limit. All open elements are closed in
+        this case, so that open tables and annotations are completed.
+
         Args:
             state: the current HTML document state.
             tree: the HTML tree to parse.
+            with_tail: whether to render the tail of the tree's root.
 
         """
-        if isinstance(tree.tag, str):
-            state.apply_starttag_layout(tree.tag, tree.attrib)
-
-            if handler := self.start_tag_handler_dict.get(tree.tag):
-                handler(state, tree.attrib)
-            cur = state.tags[-1]
-            cur.canvas.open_tag(cur)
-
-            state.tags[-1].write(tree.text)
-
-            for node in tree:
-                self._parse_html_tree(state, node)
-
-            # handle the endtag
-            if handler := self.end_tag_handler_dict.get(tree.tag):
-                handler(state)
-            prev = state.tags.pop()
-            prev.canvas.close_tag(prev)
-
-            # write the tail text to the element's container
-            state.tags[-1].write(tree.tail)
-
-        elif tree.tag is Comment and tree.tail:
-            state.tags[-1].canvas.write(state.tags[-1], tree.tail)
+        limited = state.canvas.max_chars is not None or state.canvas.max_blocks is not None
+        tail = tree.tail if with_tail else None
+        if not isinstance(tree.tag, str):
+            if tree.tag is Comment and tail:
+                state.tags[-1].canvas.write(state.tags[-1], tail)
+            return state.canvas
+
+        if not self._start_tag(state, tree.tag, tree.attrib):
+            state.tags[-1].write(tail)
+            return state.canvas
+
+        state.tags[-1].write(tree.text)
+        stack = [(tree, iter(tree))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if limited and state.limit_reached:
+                    self._close_open_elements(state, [open_node for open_node, _ in stack])
+                    return state.canvas
+
+                if isinstance(child.tag, str):
+                    if self._start_tag(state, child.tag, child.attrib):
+                        state.tags[-1].write(child.text)
+                        stack.append((child, iter(child)))
+                        break
+
+                    # skip the content of hidden elements
+                    state.tags[-1].write(child.tail)
+
+                if child.tag is Comment and child.tail:
+                    state.tags[-1].canvas.write(state.tags[-1], child.tail)
+            else:
+                # all children have been processed => handle the endtag
+                stack.pop()
+                self._end_tag(state, node.tag)
+
+                # write the tail text to the element's container
+                state.tags[-1].write(node.tail if stack else tail)
 
         return state.canvas
 
@@ -134,3 +214,436 @@ class Inscriptis:
     def get_annotations(self) -> list[Annotation]:
         """Return the annotations extracted from the HTML page."""
         return self.canvas.annotations
+
+    def get_result(self) -> ConversionResult:
+        """Return the :class:`~inscriptis.result.ConversionResult` of the HTML page.
+
+        The result's projections (e.g., the text, lines or annotations) are
+        only computed on first access. Streams need to keep their text (see
+        :class:`InscriptisStream`) for obtaining the complete result.
+        """
+        return ConversionResult(self.canvas, frozenset(self.fired_guards))
+
+
+class InscriptisRenderer(Inscriptis):
+    """Render several HTML trees with the same configuration.
+
+    In contrast to :class:`Inscriptis`, the renderer is created once and
+    reuses its document state for every rendered tree. Only the document
+    specific parts of the state are reset between two trees. Renderers are
+    not thread-safe.
+
+    Args:
+      config: an optional ParserConfig configuration object.
+
+    Example::
+
+      from lxml.html import fromstring
+      from inscriptis.html_engine import InscriptisRenderer
+
+      renderer = InscriptisRenderer()
+      for html_content in ("<h1>First</h1>", "<h1>Second</h1>"):
+          print(renderer.render(fromstring(html_content)).get_text())
+
+    """
+
+    def __init__(self, config: ParserConfig | None = None) -> None:
+        # use the default configuration, if no config object is provided
+        self.state = HtmlDocumentState(config or get_default_config())
+        self.canvas = self.state.canvas
+        self.fired_guards = self.state.fired_guards
+
+    def render(self, html_tree: lxml.html.HtmlElement) -> InscriptisRenderer:
+        """Render the given HTML tree.
+
+        Returns:
+            The renderer, which provides the tree's text and annotations.
+
+        """
+        self.state.reset()
+        self._render(self.state, html_tree)
+        return self
+
+
+class InscriptisStream(Inscriptis):
+    """Incrementally translate HTML content to its text representation.
+
+    The HTML content is fed chunk by chunk into lxml's pull parser and every
+    parsed element is rendered as soon as the parser reports it. Rendered
+    elements and their preceding siblings are removed afterwards, so that
+    the parse tree never holds more than the currently open elements and
+    their content.
+
+    Converting large documents with `keep_text` disabled also discards the
+    text returned by :meth:`feed` and :meth:`close`. The memory required
+    for the conversion, therefore, depends on the document's nesting depth
+    and the size of its largest table, but not on the document's size.
+
+    The stream stops parsing the document as soon as the configuration's
+    `max_chars` or `max_blocks` limit has been reached (see :attr:`finished`).
+    Content selectors are not supported, since they require the complete
+    HTML tree.
+
+    Args:
+      config: an optional ParserConfig configuration object.
+      keep_text: whether to keep the returned text, so that
+        :meth:`get_text` provides the complete text output.
+      encoding: an optional encoding of byte chunks, which overrides the
+        encoding detected by lxml.
+
+    Example::
+
+      from inscriptis.html_engine import InscriptisStream
+
+      stream = InscriptisStream()
+      for chunk in ("<html><body><h1>Te", "st</h1><p>Welcome", "</p></body></html>"):
+          print(stream.feed(chunk), end="")
+      print(stream.close())
+
+    .. note::
+        The stream renders the document as parsed by lxml's document parser
+        (i.e., HTML fragments are wrapped into a `<body>` element), which
+        corresponds to the output of :func:`inscriptis.get_text` for complete
+        HTML documents. The rules of the document's style sheets only apply
+        to the elements following the `<style>` element, since preceding
+        elements have already been rendered.
+
+    """
+
+    def __init__(
+        self,
+        config: ParserConfig | None = None,
+        keep_text: bool = True,
+        encoding: str | None = None,
+    ) -> None:
+        # use the default configuration, if no config object is provided
+        config = config or get_default_config()
+        _check_content_selectors(config, "InscriptisStream")
+
+        self.state = HtmlDocumentState(config)
+        self.canvas = self.state.canvas
+        self.fired_guards = self.state.fired_guards
+        self._keep_text = keep_text
+        # the open elements, which are closed once the output limit is reached
+        self._limited = config.max_chars is not None or config.max_blocks is not None
+        self._open_tags: list[str] = []
+        self._finished = False
+        # number of characters returned so far (only tracked for limited output)
+        self._returned_chars = 0
+        self._parser = HTMLPullParser(events=("start", "end", "comment"), encoding=encoding)
+        # the node whose text (or tail) has not been written yet
+        self._pending_node = None
+        self._pending_tail = False
+        # nesting level within a hidden element
+        self._hidden_depth = 0
+        # number of canvas blocks already returned by feed() and close()
+        self._returned_blocks = 0
+        self._returned_text = False
+
+    def feed(self, data: str | bytes) -> str:
+        """Feed the next chunk of HTML content into the converter.
+
+        Args:
+            data: the HTML content chunk.
+
+        Returns:
+            The text of all lines that have been completed by the given chunk.
+
+        """
+        # the remaining content is neither parsed nor rendered, once the output limit is reached
+        if not self._finished:
+            self._parser.feed(data)
+            self._process_events()
+        return self._get_new_text()
+
+    def close(self) -> str:
+        """Terminate the conversion.
+
+        Returns:
+            The text of all remaining lines.
+
+        """
+        if not self._finished:
+            self._parser.close()
+            self._process_events()
+            self._write_pending_text()
+        self.canvas.flush_inline()
+        if self._limited:
+            self.canvas.truncate()
+        return self._get_new_text()
+
+    def _process_events(self) -> None:
+        """Render all parser events that are available so far."""
+        state = self.state
+        for event, node in self._parser.read_events():
+            # skip the content of hidden elements
+            if self._hidden_depth:
+                self._process_hidden_event(event, node)
+                continue
+
+            # ignore comments outside the root element
+            if event == "comment" and node.getparent() is None:
+                continue
+
+            # the text preceding the current node is complete now
+            self._write_pending_text()
+            if self._limited and event != "end" and self._check_limit():
+                return
+
+            if event == "start":
+                if not self._start_tag(state, node.tag, node.attrib):
+                    self._hidden_depth = 1
+                    continue
+                if self._limited:
+                    self._open_tags.append(node.tag)
+                self._pending_tail = False
+            else:
+                if event == "end":
+                    self._end_tag(state, node.tag)
+                    self._free_node(node)
+                    if self._limited:
+                        self._open_tags.pop()
+                self._pending_tail = True
+            self._pending_node = node
+
+    @property
+    def finished(self) -> bool:
+        """Whether the output limit has been reached, so that further content is ignored."""
+        return self._finished
+
+    def _check_limit(self) -> bool:
+        """Close all open elements, if the output limit has been reached.
+
+        Returns:
+            True, if the output limit has been reached.
+
+        """
+        if not self.state.limit_reached:
+            return False
+
+        for tag in reversed(self._open_tags):
+            self._end_tag(self.state, tag)
+        self._open_tags.clear()
+        self._pending_node = None
+        self._finished = True
+        return True
+
+    def _process_hidden_event(self, event: str, node) -> None:
+        """Process an event within a hidden element, which only collects style sheets."""
+        if event == "start":
+            self._hidden_depth += 1
+        elif event == "end":
+            self._hidden_depth -= 1
+            if node.tag == "style" and self.state.style_sheet is not None:
+                self.state.style_sheet.add_style_element(node.attrib, node.text)
+            if not self._hidden_depth:
+                self._free_node(node)
+                self._pending_node = node
+                self._pending_tail = True
+
+    @staticmethod
+    def _free_node(node) -> None:
+        """Free the rendered node's content and its preceding siblings.
+
+        The node itself is kept, since its tail has not been written yet.
+        """
+        node.clear(keep_tail=True)
+        if (parent := node.getparent()) is not None:
+            while node.getprevious() is not None:
+                del parent[0]
+
+    def _write_pending_text(self) -> None:
+        """Write the text or tail of the last node, once it is complete."""
+        node = self._pending_node
+        if node is None:
+            return
+
+        if not self._pending_tail:
+            self.state.tags[-1].write(node.text)
+        elif node.tag is Comment:
+            if node.tail:
+                self.state.tags[-1].canvas.write(self.state.tags[-1], node.tail)
+        else:
+            self.state.tags[-1].write(node.tail)
+        self._pending_node = None
+
+    def _get_new_text(self) -> str:
+        """Return the text of the lines added since the last call."""
+        if self._limited:
+            return self._get_new_limited_text()
+
+        blocks = self.canvas.blocks
+        if len(blocks) == self._returned_blocks:
+            return ""
+
+        text = "\n".join(blocks[self._returned_blocks :])
+        if self._returned_text:
+            text = "\n" + text
+        self._returned_text = True
+        if self._keep_text:
+            self._returned_blocks = len(blocks)
+        else:
+            blocks.clear()
+        return text
+
+    def _get_new_limited_text(self) -> str:
+        """Return the text of the lines added since the last call without exceeding the output limit.
+
+        The canvas' blocks are kept, since the limit also bounds their size.
+        """
+        canvas = self.canvas
+        blocks = canvas.blocks if canvas.max_blocks is None else canvas.blocks[: canvas.max_blocks]
+        text = "\n".join(blocks)
+        if canvas.max_chars is not None:
+            text = text[: canvas.max_chars]
+        text = text[self._returned_chars :]
+        self._returned_chars += len(text)
+        return text
+
+
+class InscriptisTarget(Inscriptis):
+    """Translate HTML to text with lxml's parser target interface.
+
+    The target receives the start, end, data and comment callbacks of lxml's
+    :class:`~lxml.etree.HTMLParser` and renders them directly, without
+    building an HTML tree first. The output is identical to the one
+    obtained by :class:`Inscriptis` for the corresponding HTML tree.
+
+    Args:
+      config: an optional ParserConfig configuration object.
+
+    Example::
+
+      from lxml.etree import HTMLParser, fromstring
+      from inscriptis.html_engine import InscriptisTarget
+
+      html_content = "<html><body><h1>Test</h1></body></html>"
+
+      # parsing the content returns the result of InscriptisTarget.close()
+      parser = fromstring(html_content, HTMLParser(target=InscriptisTarget()))
+      text = parser.get_text()
+
+    Raises:
+      ValueError: if the configuration specifies content selectors, which
+        require the complete HTML tree.
+
+    .. note::
+        Similar to :class:`InscriptisStream`, HTML fragments are rendered as
+        parsed by lxml's document parser (i.e., wrapped into a `<body>`
+        element). The rules of the document's style sheets (see
+        :attr:`ParserConfig.parse_style_sheets
+        <inscriptis.model.config.ParserConfig.parse_style_sheets>`) only
+        apply to the elements following the `<style>` element, since
+        preceding elements have already been rendered.
+
+    """
+
+    def __init__(self, config: ParserConfig | None = None) -> None:
+        # use the default configuration, if no config object is provided
+        config = config or get_default_config()
+        _check_content_selectors(config, "InscriptisTarget")
+
+        self.state = HtmlDocumentState(config)
+        self.canvas = self.state.canvas
+        self.fired_guards = self.state.fired_guards
+        # lxml might split text into multiple data events
+        self._data: list[str] = []
+        self._depth = 0
+        # nesting level within a hidden element and its attributes
+        self._hidden_depth = 0
+        self._hidden_attrib: dict = {}
+        # the text following a comment corresponds to the comment's tail
+        self._comment_tail = False
+        # the open elements, which are closed once the output limit is reached
+        self._limited = config.max_chars is not None or config.max_blocks is not None
+        self._open_tags: list[str] = []
+        self._finished = False
+
+    def start(self, tag: str, attrib: dict) -> None:
+        if self._finished:
+            return
+        if self._hidden_depth:
+            self._hidden_depth += 1
+            if tag == "style":
+                self._data.clear()
+                self._hidden_attrib = attrib
+            return
+
+        self._write_data()
+        if self._limited and self._check_limit():
+            return
+        self._depth += 1
+        if not self._start_tag(self.state, tag, attrib):
+            self._hidden_depth = 1
+            self._hidden_attrib = attrib
+        elif self._limited:
+            self._open_tags.append(tag)
+
+    def end(self, tag: str) -> None:
+        if self._finished:
+            return
+        if self._hidden_depth:
+            # discard the hidden element's content
+            self._hidden_depth -= 1
+            if not self._hidden_depth:
+                self._depth -= 1
+            if tag == "style" and self.state.style_sheet is not None:
+                self.state.style_sheet.add_style_element(self._hidden_attrib, "".join(self._data))
+            self._data.clear()
+            return
+
+        self._write_data()
+        self._depth -= 1
+        self._end_tag(self.state, tag)
+        if self._limited:
+            self._open_tags.pop()
+
+    def data(self, data: str) -> None:
+        if not self._finished:
+            self._data.append(data)
+
+    def comment(self, _: str) -> None:
+        if self._hidden_depth or self._finished:
+            return
+
+        self._write_data()
+        if self._limited and self._check_limit():
+            return
+        self._comment_tail = True
+
+    def close(self) -> InscriptisTarget:
+        self._write_data()
+        if self._limited:
+            self.canvas.truncate()
+        return self
+
+    def _check_limit(self) -> bool:
+        """Close all open elements, if the output limit has been reached.
+
+        Returns:
+            True, if the output limit has been reached.
+
+        """
+        if not self.state.limit_reached:
+            return False
+
+        for tag in reversed(self._open_tags):
+            self._end_tag(self.state, tag)
+        self._open_tags.clear()
+        self._finished = True
+        return True
+
+    def _write_data(self) -> None:
+        """Write the text collected since the last start, end or comment event."""
+        if not self._data:
+            self._comment_tail = False
+            return
+
+        text = "".join(self._data)
+        self._data.clear()
+        if not self._comment_tail:
+            self.state.tags[-1].write(text)
+        elif self._depth:
+            # comments outside the root element are not rendered
+            self.state.tags[-1].canvas.write(self.state.tags[-1], text)
+        self._comment_tail = False
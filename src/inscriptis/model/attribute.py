@@ -2,7 +2,7 @@
 
 """HTML attribute handling."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from copy import copy
 
 from inscriptis.annotation.parser import ApplyAnnotation
@@ -38,6 +38,21 @@ def merge_function(func1: AttributeHandler, func2: AttributeHandler) -> Attribut
     return merged
 
 
+def get_handled_attributes(
+    attribute_mapping: Mapping[str, AttributeHandler],
+) -> tuple[tuple[str, AttributeHandler], ...]:
+    """Return the attribute handlers in the order in which they are applied.
+
+    The `style` attribute is handled last, so that inline styles take
+    precedence over presentational attributes such as `align` and `valign`.
+
+    Args:
+        attribute_mapping: a mapping of attributes to their handlers.
+
+    """
+    return tuple(sorted(attribute_mapping.items(), key=lambda item: item[0] == "style"))
+
+
 class Attribute:
     """Handle HTML attributes such as `align`, and `valign`.
 
@@ -51,7 +66,8 @@ class Attribute:
     """
 
     def __init__(self):
-        self.attribute_mapping: dict[str, AttributeHandler] = DEFAULT_ATTRIBUTE_MAP
+        # a private copy, so that changes do not affect other configurations
+        self.attribute_mapping: dict[str, AttributeHandler] = dict(DEFAULT_ATTRIBUTE_MAP)
 
     def apply_attributes(self, attributes: dict[str, str], html_element: HtmlElement) -> HtmlElement:
         """Apply the attributes to the given HTML element.
@@ -61,9 +77,10 @@ class Attribute:
             html_element: the HTML element for which the attributes are parsed
 
         """
-        for attr_name, attr_value in attributes.items():
-            if attr_name in self.attribute_mapping:
-                self.attribute_mapping[attr_name](attr_value, html_element)
+        for attr_name, attribute_handler in get_handled_attributes(self.attribute_mapping):
+            attr_value = attributes.get(attr_name)
+            if attr_value is not None:
+                attribute_handler(attr_value, html_element)
         return html_element
 
     def merge_attribute_map(self, annotations: list[ApplyAnnotation]) -> None:
@@ -6,7 +6,8 @@ Every parsed :class:`~inscriptis.model.html_element.HtmlElement` writes its
 textual content to the canvas which is managed by the following three classes:
 
   - :class:`Canvas` provides the drawing board on which the HTML page is
-    serialized and annotations are recorded.
+    serialized and annotations are recorded (or :class:`TextCanvas` for
+    conversions without annotations).
   - :class:`~inscriptis.model.canvas.block.Block` contains the current line to
     which text is written.
   - :class:`~inscriptis.model.canvas.prefix.Prefix` handles indentation
@@ -33,6 +34,8 @@ class Canvas:
             text lines). Each block spawns at least one line.
         annotations: the list of recorded
             :class:`~inscriptis.annotation.Annotation`\s.
+        max_chars: an optional maximum number of characters of the text.
+        max_blocks: an optional maximum number of blocks of the text.
         _open_annotations: a map of open tags that contain annotations.
 
     """
@@ -43,13 +46,17 @@ class Canvas:
         "blocks",
         "current_block",
         "margin",
+        "max_blocks",
+        "max_chars",
     )
 
-    def __init__(self):
+    def __init__(self, max_chars: int | None = None, max_blocks: int | None = None):
         self.margin = 1000  # margin to the previous block
         self.current_block = Block(0, Prefix())
         self.blocks = []
         self.annotations = []
+        self.max_chars = max_chars
+        self.max_blocks = max_blocks
         self._open_annotations = {}
 
     def open_tag(self, tag: HtmlElement) -> None:
@@ -134,6 +141,40 @@ class Canvas:
             self.blocks.append("")
             self.current_block = self.current_block.new_block()
 
+    @property
+    def limit_reached(self) -> bool:
+        """Indicate whether the canvas has reached its maximum size.
+
+        The first `max_chars` characters are only final, once the canvas
+        exceeds them, since trailing whitespace might still be removed and
+        the newline separating two blocks is only written with the next
+        block.
+        """
+        return (self.max_chars is not None and self.current_block.idx > self.max_chars) or (
+            self.max_blocks is not None and len(self.blocks) >= self.max_blocks
+        )
+
+    def truncate(self) -> None:
+        """Truncate the text and its annotations to the canvas' maximum size.
+
+        Annotations that start after the end of the truncated text are
+        removed and annotations that exceed it are shortened accordingly.
+        """
+        self.flush_inline()
+        if self.max_blocks is not None:
+            del self.blocks[self.max_blocks :]
+        text = "\n".join(self.blocks)
+        if self.max_chars is not None and len(text) > self.max_chars:
+            text = text[: self.max_chars]
+            self.blocks = [text]
+
+        text_len = len(text)
+        self.annotations = [
+            a if a.end <= text_len else Annotation(a.start, text_len, a.metadata)
+            for a in self.annotations
+            if a.start < text_len
+        ]
+
     def get_text(self) -> str:
         """Provide a text representation of the Canvas."""
         self.flush_inline()
@@ -164,3 +205,39 @@ class Canvas:
     def left_margin(self) -> int:
         """Return the length of the current line's left margin."""
         return self.current_block.prefix.current_padding
+
+
+class TextCanvas(Canvas):
+    """A Canvas for plain text conversions, which does not record annotations.
+
+    The HTML engine uses text canvases for configurations without any
+    annotations (see :attr:`RenderPlan.annotated
+    <inscriptis.model.render_plan.RenderPlan.annotated>`), which saves the
+    annotation bookkeeping for every opened and closed tag.
+    """
+
+    __slots__ = ()
+
+    def open_tag(self, tag: HtmlElement) -> None:
+        """Register that a tag is opened.
+
+        Args:
+            tag: the tag to open.
+
+        """
+        if tag.display == Display.block:
+            self.open_block(tag)
+
+    def close_tag(self, tag: HtmlElement) -> None:
+        """Register that the given tag tag is closed.
+
+        Args:
+            tag: the tag to close.
+
+        """
+        if tag.display == Display.block:
+            # write missing bullets, if no content has been written so far.
+            if not self.flush_inline() and tag.list_bullet:
+                self.write_unconsumed_bullet()
+            self.current_block.prefix.remove_last_prefix()
+            self.close_block(tag)
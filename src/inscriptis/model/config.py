@@ -3,16 +3,38 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from inscriptis.annotation.parser import AnnotationModel
+from inscriptis.backend import DEFAULT_PARSER_BACKEND
 from inscriptis.css_profiles import CSS_PROFILES
 from inscriptis.model.attribute import Attribute
+from inscriptis.model.frozen_config import FrozenParserConfig
+from inscriptis.model.render_plan import RenderPlan
 
 DEFAULT_CSS_PROFILE_NAME = "relaxed"
+# number of configurations cached by thaw_config
+FROZEN_CONFIG_CACHE_SIZE = 32
+# elements which rarely contribute to a page's textual content
+NON_CONTENT_ELEMENTS = ("svg", "math", "noscript", "template", "iframe", "nav", "form")
+# options from which the render plan is compiled
+RENDER_PLAN_OPTIONS = frozenset(
+    (
+        "css",
+        "display_images",
+        "display_links",
+        "display_anchors",
+        "annotation_rules",
+        "attribute_handler",
+        "custom_html_tag_handler_mapping",
+    )
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from inscriptis.cancellation import CancellationToken
     from inscriptis.model.html_element import HtmlElement
     from inscriptis.model.tag import CustomHtmlTagHandlerMapping
 
@@ -28,6 +50,9 @@ class ParserConfig:
 
     Attributes:
             css: An optional custom CSS definition.
+            base_css: The CSS definition prior to adding the annotation
+                      rules' annotations (updated, whenever `css` is
+                      assigned).
             display_images: Whether to include image tiles/alt texts.
             deduplicate_captions: Whether to deduplicate captions such as image
                 titles (many newspaper include images and video previews with
@@ -39,6 +64,32 @@ class ParserConfig:
                               specify tags and attributes to annotation.
             table_cell_separator: Separator to use between table cells.
             custom_html_tag_handler_mapping: An optional CustomHtmlTagHandler.
+            parser_backend: The name of the parser backend used by
+                            :func:`inscriptis.get_text` and
+                            :func:`inscriptis.get_annotated_text` (see
+                            :mod:`inscriptis.backend`).
+            drop_elements: Tag names or XPath expressions of elements which
+                           are removed together with their content (but not
+                           their tails) before the HTML tree is rendered.
+            content_selectors: XPath expressions or CSS selectors of the
+                               elements to render (see
+                               :mod:`inscriptis.selector`). If set, only the
+                               matching subtrees are rendered.
+            max_chars: An optional maximum number of characters of the text
+                       output. The conversion stops, once it is reached.
+            max_blocks: An optional maximum number of blocks (i.e., lines
+                        or tables) of the text output.
+            timeout: An optional time budget in seconds for rendering a
+                     single document.
+            cancellation_token: An optional token for cancelling running
+                                conversions.
+            max_elements: An optional maximum number of elements to lay out.
+            max_depth: An optional maximum nesting depth of the elements to
+                       lay out.
+            max_table_cells: An optional maximum number of cells (rows x
+                             columns) per table.
+            parse_style_sheets: Whether to apply the rules of the document's
+                                `<style>` sheets.
 
 
     The following example demonstrates how ParserConfig is used to
@@ -69,6 +120,17 @@ class ParserConfig:
         annotation_rules: dict[str, list[str]] | None = None,
         table_cell_separator: str = "  ",
         custom_html_tag_handler_mapping: CustomHtmlTagHandlerMapping | None = None,
+        parser_backend: str = DEFAULT_PARSER_BACKEND,
+        drop_elements: Sequence[str] = (),
+        content_selectors: Sequence[str] = (),
+        max_chars: int | None = None,
+        max_blocks: int | None = None,
+        timeout: float | None = None,
+        cancellation_token: CancellationToken | None = None,
+        max_elements: int | None = None,
+        max_depth: int | None = None,
+        max_table_cells: int | None = None,
+        parse_style_sheets: bool = False,
     ):
         """Create a ParserConfig configuration.
 
@@ -85,26 +147,127 @@ class ParserConfig:
                               specify tags and attributes to annotation.
             table_cell_separator: separator to use between table cells.
             custom_html_tag_handler_mapping: an optional CustomHtmlTagHandler
+            parser_backend: the name of the parser backend to use (`lxml`,
+                            `html5lib` or `selectolax`).
+            drop_elements: tag names (e.g. `svg`) or XPath expressions (e.g.
+                           `//div[@role="navigation"]`) of elements to drop
+                           prior to rendering (e.g.
+                           :data:`NON_CONTENT_ELEMENTS`).
+            content_selectors: XPath expressions (e.g. `//article`) or CSS
+                               selectors (e.g. `#content`) of the elements
+                               to render in document order. All other content
+                               is skipped.
+            max_chars: an optional maximum number of characters of the text
+                       output. The conversion stops as soon as the limit
+                       has been exceeded and the text is truncated
+                       accordingly, i.e. it corresponds to the start of the
+                       full text. Only tables cut off by the limit may
+                       differ, since their column widths only depend on the
+                       rendered rows.
+            max_blocks: an optional maximum number of blocks (i.e., lines or
+                        tables) of the text output.
+            timeout: an optional time budget in seconds for rendering a
+                     document. Conversions exceeding it raise a
+                     :class:`~inscriptis.cancellation.ConversionTimeout`.
+            cancellation_token: an optional
+                                :class:`~inscriptis.cancellation.CancellationToken`.
+                                Conversions raise a
+                                :class:`~inscriptis.cancellation.ConversionCancelled`
+                                exception, once it has been cancelled.
+            max_elements: an optional maximum number of elements that are
+                          laid out. All subsequent elements are flattened
+                          to inline text.
+            max_depth: an optional maximum nesting depth. Elements nested
+                       more deeply are flattened to inline text.
+            max_table_cells: an optional maximum number of cells (i.e., rows
+                             times columns) per table. Rows and cells
+                             exceeding it are flattened into the table's
+                             last cell.
+            parse_style_sheets: whether to apply the rules of the document's
+                                `<style>` sheets (see
+                                :mod:`inscriptis.model.style_sheet`), so
+                                that, for instance, content hidden with
+                                `.hidden { display: none }` is skipped.
 
         """
         self.display_images = display_images
         self.deduplicate_captions = deduplicate_captions
         self.display_links = display_links
         self.display_anchors = display_anchors
+        # also sets the CSS definitions prior to adding annotations (base_css)
         self.css = css or CSS_PROFILES[DEFAULT_CSS_PROFILE_NAME]
+        self.annotation_rules = annotation_rules
         self.attribute_handler = Attribute()
         self.table_cell_separator = table_cell_separator
         self.custom_html_tag_handler_mapping = custom_html_tag_handler_mapping
+        self.parser_backend = parser_backend
+        self.drop_elements = tuple(drop_elements)
+        self.content_selectors = tuple(content_selectors)
+        self.max_chars = max_chars
+        self.max_blocks = max_blocks
+        self.timeout = timeout
+        self.cancellation_token = cancellation_token
+        self.max_elements = max_elements
+        self.max_depth = max_depth
+        self.max_table_cells = max_table_cells
+        self.parse_style_sheets = parse_style_sheets
+        self._render_plan = None
 
         if annotation_rules:
-            # ensure that we do not modify the original model or its
-            # members.
-            annotation_model = AnnotationModel(deepcopy(self.css), annotation_rules)
-            # css with annotation support
+            # the annotation model does not modify the (shared) CSS profile
+            annotation_model = AnnotationModel(self.css, annotation_rules)
+            # css with annotation support (which keeps the unannotated base_css)
+            base_css = self.base_css
             self.css = annotation_model.css
+            self.base_css = base_css
             # attribute handler with annotation support
             self.attribute_handler.merge_attribute_map(annotation_model.css_attr)
 
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        # frozen configurations refer to the CSS definitions assigned last
+        if name == "css":
+            super().__setattr__("base_css", value)
+        # recompile the render plan, once one of its options has changed
+        if name in RENDER_PLAN_OPTIONS:
+            super().__setattr__("_render_plan", None)
+
+    def __getstate__(self) -> dict:
+        """Return the configuration's state without the compiled render plan.
+
+        The render plan is recompiled by copies and unpickled configurations.
+        """
+        state = self.__dict__.copy()
+        state["_render_plan"] = None
+        return state
+
+    @property
+    def render_plan(self) -> RenderPlan:
+        """The :class:`~inscriptis.model.render_plan.RenderPlan` compiled from this configuration.
+
+        The plan is compiled on first use and shared by all subsequent
+        conversions. Assigning one of the :data:`RENDER_PLAN_OPTIONS` causes
+        a recompilation, whereas in-place changes to the CSS definitions,
+        attribute handlers or tag handlers do not take effect. Threads that
+        concurrently use a fresh configuration might compile equivalent
+        plans, one of which is kept.
+        """
+        if self._render_plan is None:
+            self._render_plan = RenderPlan(self)
+        return self._render_plan
+
+    def freeze(self) -> FrozenParserConfig:
+        """Return the immutable and hashable form of this configuration.
+
+        See :mod:`inscriptis.model.frozen_config` for details.
+        """
+        return FrozenParserConfig.from_config(self)
+
+    @property
+    def fingerprint(self) -> str:
+        """A stable fingerprint of the configuration's content (see :meth:`freeze`)."""
+        return self.freeze().fingerprint
+
     def parse_a(self) -> bool:
         """Indicate whether the text output should contain links or anchors.
 
@@ -113,3 +276,25 @@ class ParserConfig:
 
         """
         return self.display_links or self.display_anchors
+
+
+@lru_cache(maxsize=1)
+def get_default_config() -> ParserConfig:
+    """Return the shared default configuration.
+
+    The default configuration is used by all conversions without an explicit
+    configuration, so that its render plan is only compiled once. It must,
+    therefore, neither be modified nor handed out to callers.
+    """
+    return ParserConfig()
+
+
+@lru_cache(maxsize=FROZEN_CONFIG_CACHE_SIZE)
+def thaw_config(frozen_config: FrozenParserConfig) -> ParserConfig:
+    """Return the ParserConfig corresponding to the given frozen configuration.
+
+    The configurations are cached, so that worker processes only rebuild
+    them (and compile their render plans) once. The returned configuration
+    is shared and must, therefore, not be modified.
+    """
+    return ParserConfig(**frozen_config.get_config_arguments())
@@ -6,7 +6,9 @@
   corresponding HtmlElements used by Inscriptis for rendering HTML pages.
 """
 
+from collections.abc import Callable
 from contextlib import suppress
+from functools import lru_cache, partial
 from re import compile as re_compile
 
 from inscriptis.html_properties import (
@@ -17,6 +19,9 @@ from inscriptis.html_properties import (
 )
 from inscriptis.model.html_element import HtmlElement
 
+# number of distinct style attributes and lengths cached by CssParse
+STYLE_CACHE_SIZE = 1024
+
 
 class CssParse:
     """Parse CSS specifications and applies them to HtmlElements.
@@ -38,18 +43,40 @@ class CssParse:
           html_element: The HtmlElement to which the given style is applied.
 
         """
+        for apply_style in CssParse.compile_style(style_attribute):
+            apply_style(html_element)
+
+    @staticmethod
+    @lru_cache(maxsize=STYLE_CACHE_SIZE)
+    def compile_style(style_attribute: str) -> tuple[Callable[[HtmlElement], None], ...]:
+        """Compile the provided style attributes into property setters.
+
+        Compiled styles are kept in a least recently used cache, which holds
+        up to :data:`STYLE_CACHE_SIZE` style attributes. Its statistics are
+        available via `CssParse.compile_style.cache_info()`.
+
+        Args:
+          style_attribute: The attribute value of the given style sheet.
+                           Example: display: none
+
+        Returns:
+            A tuple of functions which apply the style's supported
+            properties to a given HtmlElement.
+
+        """
+        setters = []
         for style_directive in style_attribute.lower().split(";"):
             if ":" not in style_directive:
                 continue
             key, value = (s.strip() for s in style_directive.split(":", 1))
 
-            try:
-                apply_style = getattr(CssParse, "attr_" + key.replace("-webkit-", "").replace("-", "_"))
-                apply_style(value, html_element)
-            except AttributeError:
-                pass
+            apply_style = getattr(CssParse, "attr_" + key.replace("-webkit-", "").replace("-", "_"), None)
+            if apply_style is not None:
+                setters.append(partial(apply_style, value))
+        return tuple(setters)
 
     @staticmethod
+    @lru_cache(maxsize=STYLE_CACHE_SIZE)
     def _get_em(length: str) -> int:
         """Convert length specifications into em.
 
@@ -62,8 +89,14 @@ class CssParse:
         Returns:
             the length in em.
 
+        Raises:
+            ValueError: if the length specification is invalid.
+
         """
         _m = CssParse.RE_UNIT.search(length)
+        if not _m:
+            msg = f"Invalid length specification: {length}."
+            raise ValueError(msg)
         value = float(_m.group(1))
         unit = _m.group(2)
 
@@ -0,0 +1,211 @@
+"""An immutable, hashable and compactly serialisable form of ParserConfig.
+
+:class:`FrozenParserConfig` describes a
+:class:`~inscriptis.model.config.ParserConfig` solely by strings, numbers
+and tuples:
+
+- the CSS definitions are referenced by the name of the corresponding
+  profile in :data:`inscriptis.css_profiles.CSS_PROFILES` (or stored
+  element by element for custom definitions),
+- custom tag handlers are referenced by their import path (e.g.,
+  `mypackage.handlers:table_start_handler`).
+
+Frozen configurations may, therefore, serve as cache keys, provide a stable
+:attr:`~FrozenParserConfig.fingerprint` and are cheaply sent to worker
+processes, which rebuild (and cache) the corresponding ParserConfig with
+:func:`~inscriptis.model.config.thaw_config`.
+
+Example::
+
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    from inscriptis import get_text
+    from inscriptis.model.config import ParserConfig, thaw_config
+
+    def convert(frozen_config, html):
+        return get_text(html, thaw_config(frozen_config))
+
+    frozen_config = ParserConfig(display_links=True).freeze()
+    with ProcessPoolExecutor() as executor:
+        texts = list(executor.map(partial(convert, frozen_config), documents))
+"""
+
+from __future__ import annotations
+
+from hashlib import sha256
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.html_properties import Display, HorizontalAlignment, VerticalAlignment, WhiteSpace
+from inscriptis.model.html_element import HtmlElement
+from inscriptis.model.tag import CustomHtmlTagHandlerMapping
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from inscriptis.model.config import ParserConfig
+
+# the ParserConfig options which are stored verbatim
+FROZEN_OPTIONS = (
+    "display_images",
+    "deduplicate_captions",
+    "display_links",
+    "display_anchors",
+    "table_cell_separator",
+    "parser_backend",
+    "drop_elements",
+    "content_selectors",
+    "max_chars",
+    "max_blocks",
+    "timeout",
+    "max_elements",
+    "max_depth",
+    "max_table_cells",
+    "parse_style_sheets",
+)
+FrozenElement = tuple[str, str, str, str, int, int, int, str, "str | None", bool, str, str, tuple[str, ...]]
+
+
+def get_import_path(handler: Callable) -> str:
+    """Return the import path (`module:qualified_name`) of the given handler.
+
+    Raises:
+        ValueError: if the handler cannot be imported by its path (e.g., for
+            lambdas and nested functions).
+
+    """
+    module = getattr(handler, "__module__", None)
+    qualname = getattr(handler, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        msg = f"The handler {handler!r} cannot be referenced by its import path."
+        raise ValueError(msg)
+    return f"{module}:{qualname}"
+
+
+def resolve_import_path(path: str) -> Callable:
+    """Return the handler referenced by the given import path."""
+    module, qualname = path.split(":", 1)
+    handler = import_module(module)
+    for name in qualname.split("."):
+        handler = getattr(handler, name)
+    return handler
+
+
+def _freeze_handlers(handlers: dict[str, Callable]) -> tuple[tuple[str, str], ...]:
+    """Return the tags and import paths of the given tag handlers."""
+    return tuple((tag, get_import_path(handler)) for tag, handler in handlers.items())
+
+
+def freeze_element(html_element: HtmlElement) -> FrozenElement:
+    """Return the given HtmlElement's properties as a tuple."""
+    return (
+        html_element.tag,
+        html_element.prefix,
+        html_element.suffix,
+        html_element.display.name,
+        html_element.margin_before,
+        html_element.margin_after,
+        html_element.padding_inline,
+        html_element.list_bullet,
+        html_element.whitespace.name if html_element.whitespace else None,
+        html_element.limit_whitespace_affixes,
+        html_element.align.name,
+        html_element.valign.name,
+        tuple(html_element.annotation),
+    )
+
+
+def thaw_element(frozen_element: FrozenElement) -> HtmlElement:
+    """Return the HtmlElement described by the given tuple."""
+    tag, prefix, suffix, display, margin_before, margin_after, padding_inline, list_bullet, *rest = frozen_element
+    whitespace, limit_whitespace_affixes, align, valign, annotation = rest
+    return HtmlElement(
+        tag=tag,
+        prefix=prefix,
+        suffix=suffix,
+        display=Display[display],
+        margin_before=margin_before,
+        margin_after=margin_after,
+        padding_inline=padding_inline,
+        list_bullet=list_bullet,
+        whitespace=WhiteSpace[whitespace] if whitespace else None,
+        limit_whitespace_affixes=limit_whitespace_affixes,
+        align=HorizontalAlignment[align],
+        valign=VerticalAlignment[valign],
+        annotation=annotation,
+    )
+
+
+class FrozenParserConfig(NamedTuple):
+    """The immutable and hashable form of a ParserConfig.
+
+    Frozen configurations are created with
+    :meth:`ParserConfig.freeze() <inscriptis.model.config.ParserConfig.freeze>`.
+
+    Attributes:
+        options: the names and values of the :data:`FROZEN_OPTIONS`.
+        css: the name of the CSS profile or the frozen CSS definitions.
+        annotation_rules: the annotation rules.
+        start_tag_handlers: the import paths of custom start tag handlers.
+        end_tag_handlers: the import paths of custom end tag handlers.
+
+    """
+
+    options: tuple[tuple[str, Any], ...]
+    css: str | tuple[tuple[str, FrozenElement], ...]
+    annotation_rules: tuple[tuple[str, tuple[str, ...]], ...]
+    start_tag_handlers: tuple[tuple[str, str], ...]
+    end_tag_handlers: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_config(cls, config: ParserConfig) -> FrozenParserConfig:
+        """Create the frozen form of the given configuration.
+
+        Raises:
+            ValueError: if the configuration uses a cancellation token (which
+                only applies to a single process) or custom tag handlers
+                that cannot be referenced by their import path.
+
+        """
+        if config.cancellation_token is not None:
+            msg = "Configurations with a cancellation token cannot be frozen."
+            raise ValueError(msg)
+
+        css = next((name for name, profile in CSS_PROFILES.items() if profile is config.base_css), None)
+        mapping = config.custom_html_tag_handler_mapping
+        return cls(
+            options=tuple((name, getattr(config, name)) for name in FROZEN_OPTIONS),
+            css=css or tuple(sorted((tag, freeze_element(element)) for tag, element in config.base_css.items())),
+            # sorted, so that the fingerprint does not depend on the rules' order
+            annotation_rules=tuple(
+                sorted((key, tuple(annotations)) for key, annotations in (config.annotation_rules or {}).items())
+            ),
+            start_tag_handlers=_freeze_handlers(mapping.start_tag_mapping if mapping else {}),
+            end_tag_handlers=_freeze_handlers(mapping.end_tag_mapping if mapping else {}),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """A stable hex digest of the configuration, which does not depend on the Python process."""
+        return sha256(repr(tuple(self)).encode("utf-8")).hexdigest()
+
+    def get_config_arguments(self) -> dict[str, Any]:
+        """Return the keyword arguments for creating the corresponding ParserConfig."""
+        if isinstance(self.css, str):
+            css = CSS_PROFILES[self.css]
+        else:
+            css = {tag: thaw_element(frozen_element) for tag, frozen_element in self.css}
+        mapping = None
+        if self.start_tag_handlers or self.end_tag_handlers:
+            mapping = CustomHtmlTagHandlerMapping(
+                start_tag_mapping={tag: resolve_import_path(path) for tag, path in self.start_tag_handlers},
+                end_tag_mapping={tag: resolve_import_path(path) for tag, path in self.end_tag_handlers},
+            )
+        return {
+            "css": css,
+            "annotation_rules": {key: list(annotations) for key, annotations in self.annotation_rules} or None,
+            "custom_html_tag_handler_mapping": mapping,
+            **dict(self.options),
+        }
@@ -6,13 +6,25 @@ representing the current state of the HTML to text conversion.
 
 from __future__ import annotations
 
+from time import monotonic
 from typing import TYPE_CHECKING
 
-from inscriptis.model.canvas import Canvas
-from inscriptis.model.html_element import DEFAULT_HTML_ELEMENT
+from inscriptis.cancellation import ConversionCancelled, ConversionTimeout
+from inscriptis.html_properties import Display
+from inscriptis.model.canvas import Canvas, TextCanvas
+from inscriptis.model.style_sheet import StyleSheet
+from inscriptis.model.table import Table, TableCell, TextTable, TextTableCell
 
 if TYPE_CHECKING:
     from inscriptis import ParserConfig
+    from inscriptis.model.html_element import HtmlElement
+    from inscriptis.model.render_plan import TagPlan
+
+# flattened elements which are separated from the surrounding text
+FLAT_SEPARATED_TAGS = frozenset(("br", "table", "tr", "td", "th"))
+TABLE_LAYOUT_TAGS = frozenset(("tr", "td", "th"))
+# maximum number of shared elements cached per document
+MAX_SHARED_ELEMENTS = 256
 
 
 class HtmlDocumentState:
@@ -20,12 +32,30 @@ class HtmlDocumentState:
 
     def __init__(self, config: ParserConfig):
         # instance variables
-        self.canvas = Canvas()
         self.config = config
         self.css = config.css
-        self.apply_attributes = config.attribute_handler.apply_attributes
+        plan = config.render_plan
+        self.tag_plans = plan.tags
+        self.default_tag_plan = plan.default
+        self.handled_attributes = plan.handled_attributes
+        # plain text conversions do not require any annotation bookkeeping
+        if plan.annotated:
+            self.canvas_class, self.table_class, self.table_cell_class = Canvas, Table, TableCell
+        else:
+            self.canvas_class, self.table_class, self.table_cell_class = TextCanvas, TextTable, TextTableCell
+        self.cancellable = config.timeout is not None or config.cancellation_token is not None
+        self.guarded = (
+            config.max_elements is not None or config.max_depth is not None or config.max_table_cells is not None
+        )
+        self.fired_guards: set[str] = set()
+        self.reset()
 
-        self.tags = [self.css["body"].set_canvas(self.canvas)]
+    def reset(self) -> None:
+        """Reset the document specific state, so that the next document can be rendered."""
+        self.canvas = self.canvas_class(self.config.max_chars, self.config.max_blocks)
+        # copy the body element, since the css definitions are shared by
+        # all documents rendered with the same profile
+        self.tags = [self.css["body"].__copy__().set_canvas(self.canvas)]
         self.current_table = []
         self.li_counter = []
         self.last_caption = None
@@ -33,25 +63,175 @@ class HtmlDocumentState:
         # used if display_links is enabled
         self.link_target = ""
 
-    def apply_starttag_layout(self, tag, attrs):
+        # refined elements shared by all elements with the same tag and
+        # parent style, which are neither modified by attributes nor handlers
+        self.shared_elements: dict[tuple, HtmlElement] = {}
+        # the rules of the document's style sheets
+        self.style_sheet = StyleSheet() if self.config.parse_style_sheets else None
+
+        # used for cooperative cancellation
+        self.element_count = 0
+        self.deadline = monotonic() + self.config.timeout if self.config.timeout is not None else None
+
+        # used for the structural resource guards
+        self.fired_guards.clear()
+        # whether the open flattened elements are separated from their
+        # surroundings
+        self.flat_tags: list[bool] = []
+
+    def exceeds_guard(self, tag: str) -> bool:
+        """Indicate whether the current element exceeds a resource guard.
+
+        Fired guards are recorded in :attr:`fired_guards` by the name of the
+        corresponding :class:`~inscriptis.model.config.ParserConfig` option.
+
+        Args:
+            tag: the tag of the current (i.e., last opened) element.
+
+        """
+        config = self.config
+        guard = None
+        if config.max_elements is not None and self.element_count > config.max_elements:
+            guard = "max_elements"
+        elif config.max_depth is not None and len(self.tags) - 1 > config.max_depth:
+            guard = "max_depth"
+        elif config.max_table_cells is not None and tag in TABLE_LAYOUT_TAGS and self.current_table:
+            table = self.current_table[-1]
+            if tag == "tr":
+                cells = (len(table.rows) + 1) * max(table.column_count, 1)
+            else:
+                columns = len(table.rows[-1].columns) + 1 if table.rows else 1
+                cells = max(len(table.rows), 1) * max(table.column_count, columns)
+            if cells > config.max_table_cells:
+                guard = "max_table_cells"
+
+        if guard is None:
+            return False
+        self.fired_guards.add(guard)
+        return True
+
+    def open_flat_element(self, tag: str) -> None:
+        """Open the current element without layout (i.e., as inline text).
+
+        Flattened table rows and cells write their content to the table's
+        last cell, and block elements and tables are separated from the
+        surrounding text by a space.
+        """
+        # shared elements must not be modified
+        cur = self.tags[-1] = self.tags[-1].__copy__()
+        separated = cur.display == Display.block or tag in FLAT_SEPARATED_TAGS
+        cur.display = Display.inline
+        cur.padding_inline = 0
+        cur.list_bullet = ""
+        if not self.flat_tags and tag in TABLE_LAYOUT_TAGS and self.current_table:
+            table = self.current_table[-1]
+            if table.rows and table.rows[-1].columns:
+                cur.canvas = table.rows[-1].columns[-1]
+
+        self.flat_tags.append(separated)
+        if separated:
+            cur.canvas.write(cur, " ")
+        cur.canvas.open_tag(cur)
+
+    def close_flat_element(self) -> None:
+        """Close the current flattened element."""
+        prev = self.tags.pop()
+        prev.canvas.close_tag(prev)
+        if self.flat_tags.pop():
+            prev.canvas.write(prev, " ")
+
+    def check_cancellation(self) -> None:
+        """Abort the conversion, if it has been cancelled or timed out.
+
+        Raises:
+            ConversionCancelled: if the configured cancellation token has
+                been cancelled.
+            ConversionTimeout: if the configured timeout has been exceeded.
+
+        """
+        token = self.config.cancellation_token
+        if token is not None and token.cancelled:
+            msg = "The conversion has been cancelled."
+            raise ConversionCancelled(msg)
+        if self.deadline is not None and monotonic() > self.deadline:
+            msg = f"The conversion has exceeded its timeout of {self.config.timeout} seconds."
+            raise ConversionTimeout(msg)
+
+    @property
+    def limit_reached(self) -> bool:
+        """Indicate whether the output has reached the configured maximum size.
+
+        Tables are only written to the canvas once they have been closed.
+        The size of the outermost open table's completed rows, therefore,
+        counts towards the limit as well.
+        """
+        canvas = self.canvas
+        if canvas.limit_reached:
+            return True
+        if not self.current_table:
+            return False
+
+        table = self.current_table[0]
+        return (
+            canvas.max_chars is not None and canvas.current_block.idx + table.content_length > canvas.max_chars
+        ) or (canvas.max_blocks is not None and len(canvas.blocks) + len(table.rows) > canvas.max_blocks)
+
+    def apply_starttag_layout(self, tag, attrs) -> TagPlan:
         """Compute the layout of the tag.
 
         Compute the style of the current :class:`HtmlElement`, based on
 
-        1. the used :attr:`css`,
-        2. apply attributes and css with :meth:`~Attribute.apply_attributes`
-        3. add the `HtmlElement` to the list of open tags.
+        1. the tag's template in the config's
+           :class:`~inscriptis.model.render_plan.RenderPlan`,
+        2. apply the matching rules of the document's style sheets (if
+           enabled),
+        3. apply the plan's attribute handlers to the corresponding
+           attributes,
+        4. add the `HtmlElement` to the list of open tags.
+
+        The template is only copied, if the element is modified by a style
+        rule, an attribute handler or a tag handler (see
+        :attr:`~inscriptis.model.render_plan.TagPlan.shared`). All other
+        elements on the document's canvas with the same tag and parent style
+        share a single refined copy (copy-on-write), which must not be
+        modified.
 
         Args:
           tag: the HTML start tag to process.
           attrs: a dictionary of HTML attributes and their respective values.
 
+        Returns:
+            The tag's :class:`~inscriptis.model.render_plan.TagPlan`.
+
         """
-        # use the css to handle tags known to it :)
-        cur = self.tags[-1].get_refined_html_element(
-            self.apply_attributes(
-                attrs,
-                html_element=self.css.get(tag, DEFAULT_HTML_ELEMENT).__copy__().set_tag(tag),
-            ),
-        )
-        self.tags.append(cur)
+        tag_plan = self.tag_plans.get(tag, self.default_tag_plan)
+        parent = self.tags[-1]
+        html_element = None
+        if self.style_sheet and (setters := self.style_sheet.get_setters(tag, attrs)):
+            html_element = tag_plan.template.__copy__().set_tag(tag)
+            for setter in setters:
+                setter(html_element)
+
+        # only look up the (few) attributes with a handler, rather than
+        # dispatching every attribute of the element
+        for attr_name, attribute_handler in self.handled_attributes:
+            attr_value = attrs.get(attr_name)
+            if attr_value is not None:
+                if html_element is None:
+                    html_element = tag_plan.template.__copy__().set_tag(tag)
+                attribute_handler(attr_value, html_element)
+
+        if html_element is None and tag_plan.shared and parent.canvas is self.canvas:
+            key = (tag, parent.display, parent.whitespace, parent.margin_after)
+            html_element = self.shared_elements.get(key)
+            if html_element is None:
+                if len(self.shared_elements) >= MAX_SHARED_ELEMENTS:
+                    self.shared_elements.clear()
+                html_element = self.shared_elements[key] = parent.get_refined_html_element(
+                    tag_plan.template.__copy__().set_tag(tag)
+                )
+            self.tags.append(html_element)
+            return tag_plan
+
+        self.tags.append(parent.get_refined_html_element(html_element or tag_plan.template.__copy__().set_tag(tag)))
+        return tag_plan
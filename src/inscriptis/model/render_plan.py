@@ -0,0 +1,187 @@
+"""Compile a :class:`~inscriptis.model.config.ParserConfig` into a render plan.
+
+The render plan combines everything required for rendering a tag into a
+single :class:`TagPlan` record per tag, so that the HTML engine only needs
+one dictionary lookup per element rather than separate lookups in the CSS
+profile and the start and end tag handler tables.
+
+Render plans are immutable and shared by all conversions that use the same
+configuration (see :attr:`ParserConfig.render_plan
+<inscriptis.model.config.ParserConfig.render_plan>`).
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+from inscriptis.model.attribute import DEFAULT_ATTRIBUTE_MAP, get_handled_attributes
+from inscriptis.model.html_element import DEFAULT_HTML_ELEMENT, HtmlElement
+from inscriptis.model.tag.a_tag import a_end_handler, a_start_handler
+from inscriptis.model.tag.br_tag import br_start_handler
+from inscriptis.model.tag.img_tag import img_start_handler
+from inscriptis.model.tag.list_tag import (
+    li_start_handler,
+    ol_end_handler,
+    ol_start_handler,
+    ul_end_handler,
+    ul_start_handler,
+)
+from inscriptis.model.tag.table_tag import (
+    table_end_handler,
+    table_start_handler,
+    td_end_handler,
+    td_start_handler,
+    tr_start_handler,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from inscriptis.model.attribute import AttributeHandler
+    from inscriptis.model.config import ParserConfig
+    from inscriptis.model.html_document_state import HtmlDocumentState
+
+    StartTagHandler = Callable[[HtmlDocumentState, dict], None]
+    EndTagHandler = Callable[[HtmlDocumentState], None]
+
+
+# built-in tag handlers which do not modify the tag's HtmlElement
+SHAREABLE_TAG_HANDLERS = frozenset(
+    (
+        a_start_handler,
+        a_end_handler,
+        br_start_handler,
+        img_start_handler,
+        ol_start_handler,
+        ol_end_handler,
+        tr_start_handler,
+        ul_start_handler,
+        ul_end_handler,
+    )
+)
+
+
+class TagPlan(NamedTuple):
+    """The rendering instructions for a single tag.
+
+    Attributes:
+        template: the tag's :class:`~inscriptis.model.html_element.HtmlElement`
+                  template, which is copied for every rendered element.
+        attribute_handlers: a mapping of attribute names to the corresponding
+                            handler functions.
+        start_handler: an optional start tag handler.
+        end_handler: an optional end tag handler.
+        shared: whether elements without handled attributes may share a
+                single HtmlElement (i.e., the element is neither annotated
+                nor modified by the tag handlers).
+
+    """
+
+    template: HtmlElement
+    attribute_handlers: Mapping[str, AttributeHandler]
+    start_handler: StartTagHandler | None
+    end_handler: EndTagHandler | None
+    shared: bool = True
+
+
+def get_tag_handlers(config: ParserConfig) -> tuple[dict[str, StartTagHandler], dict[str, EndTagHandler]]:
+    """Return the start and end tag handlers used for the given configuration.
+
+    Returns:
+        A tuple of the start tag and end tag handler dictionaries.
+
+    """
+    start_tag_handlers = {
+        "table": table_start_handler,
+        "tr": tr_start_handler,
+        "td": td_start_handler,
+        "th": td_start_handler,
+        "ul": ul_start_handler,
+        "ol": ol_start_handler,
+        "li": li_start_handler,
+        "br": br_start_handler,
+    }
+    end_tag_handlers = {
+        "table": table_end_handler,
+        "ul": ul_end_handler,
+        "ol": ol_end_handler,
+        "td": td_end_handler,
+        "th": td_end_handler,
+    }
+    if config.parse_a():
+        start_tag_handlers["a"] = a_start_handler
+        end_tag_handlers["a"] = a_end_handler
+    if config.display_images:
+        start_tag_handlers["img"] = img_start_handler
+
+    if config.custom_html_tag_handler_mapping:
+        start_tag_handlers.update(config.custom_html_tag_handler_mapping.start_tag_mapping)
+        end_tag_handlers.update(config.custom_html_tag_handler_mapping.end_tag_mapping)
+    return start_tag_handlers, end_tag_handlers
+
+
+def _is_shareable(template: HtmlElement, *handlers: Callable | None) -> bool:
+    """Indicate whether the elements of a tag may share their HtmlElement.
+
+    Shared elements may be open several times at once, and must therefore
+    neither be annotated nor modified by the tag's handlers.
+    """
+    return not template.annotation and all(handler is None or handler in SHAREABLE_TAG_HANDLERS for handler in handlers)
+
+
+class RenderPlan:
+    """An immutable render plan compiled from a ParserConfig.
+
+    Args:
+        config: the configuration to compile.
+
+    Attributes:
+        tags: a read-only mapping of tag names to their :class:`TagPlan`.
+        default: the :class:`TagPlan` used for all other tags.
+        handled_attributes: the names of all attributes with an attribute
+                            handler and the corresponding handlers in the
+                            order in which they are applied (see
+                            :func:`~inscriptis.model.attribute.get_handled_attributes`).
+        annotated: whether the configuration annotates elements (i.e., uses
+                   annotation rules, annotated CSS definitions or custom
+                   attribute handlers). Otherwise, the document is rendered
+                   on a :class:`~inscriptis.model.canvas.TextCanvas`.
+
+    """
+
+    __slots__ = ("annotated", "default", "handled_attributes", "tags")
+
+    def __init__(self, config: ParserConfig):
+        start_tag_handlers, end_tag_handlers = get_tag_handlers(config)
+        attribute_handlers = MappingProxyType(dict(config.attribute_handler.attribute_mapping))
+        self.handled_attributes: tuple[tuple[str, AttributeHandler], ...] = get_handled_attributes(attribute_handlers)
+        self.default = TagPlan(DEFAULT_HTML_ELEMENT, attribute_handlers, None, None)
+        tags = {}
+        for tag in (*config.css, *start_tag_handlers, *end_tag_handlers):
+            template = config.css.get(tag, DEFAULT_HTML_ELEMENT).__copy__().set_tag(tag)
+            start_handler = start_tag_handlers.get(tag)
+            end_handler = end_tag_handlers.get(tag)
+            tags[tag] = TagPlan(
+                template,
+                attribute_handlers,
+                start_handler,
+                end_handler,
+                _is_shareable(template, start_handler, end_handler),
+            )
+        self.annotated = (
+            bool(config.annotation_rules)
+            or attribute_handlers != DEFAULT_ATTRIBUTE_MAP
+            or any(tag_plan.template.annotation for tag_plan in tags.values())
+        )
+        self.tags: Mapping[str, TagPlan] = MappingProxyType(tags)
+
+    def __setattr__(self, name: str, value) -> None:
+        if hasattr(self, "tags"):
+            msg = "RenderPlan objects are immutable."
+            raise AttributeError(msg)
+        super().__setattr__(name, value)
+
+    def get(self, tag: str) -> TagPlan:
+        """Return the :class:`TagPlan` for the given tag."""
+        return self.tags.get(tag, self.default)
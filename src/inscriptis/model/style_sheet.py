@@ -0,0 +1,213 @@
+"""Apply the rules of a document's `<style>` sheets to its elements.
+
+The :class:`StyleSheet` supports the CSS properties understood by
+:class:`~inscriptis.model.css.CssParse` and rules with simple selectors,
+i.e. a tag name, an id and class names (e.g., `div`, `.hidden`,
+`#content` or `p.note.important`). Rules with other selectors (e.g.,
+combinators, attribute selectors or pseudo-classes) and at-rules such as
+`@media` are ignored.
+
+Similar to browsers, the rules are indexed by their selector's id, first
+class name or tag, so that only the rules of the buckets corresponding to an
+element's id, classes and tag need to be checked, regardless of the total
+number of rules.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+from inscriptis.model.css import CssParse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from inscriptis.model.html_element import HtmlElement
+
+RE_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+RE_IMPORTANT = re.compile(r"!\s*important", re.IGNORECASE)
+RE_SIMPLE_SELECTOR = re.compile(r"(\*|[a-zA-Z][\w-]*)?((?:[.#][\w-]+)*)")
+RE_SELECTOR_PART = re.compile(r"([.#])([\w-]+)")
+# media types of style sheets that apply to the rendered text
+SCREEN_MEDIA = frozenset(("all", "screen"))
+
+
+class StyleRule(NamedTuple):
+    """A style rule with a simple selector.
+
+    Attributes:
+        tag: the selector's tag or None, if the rule applies to all tags.
+        id: the selector's id or None.
+        classes: the selector's class names.
+        priority: the rule's specificity followed by its position within the
+                  document's style sheets.
+        setters: the property setters of the rule's declarations.
+
+    """
+
+    tag: str | None
+    id: str | None
+    classes: frozenset[str]
+    priority: tuple[int, int, int, int]
+    setters: tuple[Callable[[HtmlElement], None], ...]
+
+    def matches(self, tag: str, element_id: str | None, classes: set[str]) -> bool:
+        """Indicate whether the rule applies to the given element."""
+        return (
+            (self.tag is None or self.tag == tag)
+            and (self.id is None or self.id == element_id)
+            and self.classes <= classes
+        )
+
+
+def is_screen_style(attrib: Mapping[str, str]) -> bool:
+    """Indicate whether a `<style>` element with the given attributes applies to screens."""
+    if attrib.get("type", "text/css").strip().lower() not in ("", "text/css"):
+        return False
+    media = attrib.get("media")
+    return media is None or any(medium.strip().lower() in SCREEN_MEDIA for medium in media.split(","))
+
+
+def _skip_block(css: str, block_start: int) -> int:
+    """Return the position following the (nested) block starting at the given position."""
+    depth = 0
+    for pos in range(block_start, len(css)):
+        if css[pos] == "{":
+            depth += 1
+        elif css[pos] == "}":
+            depth -= 1
+            if not depth:
+                return pos + 1
+    return len(css)
+
+
+def _iter_rule_sets(css: str):
+    """Yield the selectors and declarations of all rule sets outside of at-rules."""
+    css = RE_COMMENT.sub("", css)
+    pos = 0
+    while (block_start := css.find("{", pos)) != -1:
+        # at-rules without a block (e.g., `@import`) end with a semicolon
+        prelude = css[pos:block_start].rsplit(";", 1)[-1].strip()
+        if prelude.startswith("@"):
+            pos = _skip_block(css, block_start)
+            continue
+
+        block_end = css.find("}", block_start)
+        if block_end == -1:
+            block_end = len(css)
+        yield prelude, css[block_start + 1 : block_end]
+        pos = block_end + 1
+
+
+class StyleSheet:
+    """The rules of a document's style sheets, indexed by id, class and tag.
+
+    Attributes:
+        id_rules: rules whose selector contains an id.
+        class_rules: other rules whose selector contains a class name,
+                     indexed by the selector's first class name.
+        tag_rules: other rules whose selector consists of a tag.
+        universal_rules: rules which apply to all elements.
+
+    """
+
+    __slots__ = ("class_rules", "id_rules", "rule_count", "tag_rules", "universal_rules")
+
+    def __init__(self) -> None:
+        self.id_rules: dict[str, list[StyleRule]] = {}
+        self.class_rules: dict[str, list[StyleRule]] = {}
+        self.tag_rules: dict[str, list[StyleRule]] = {}
+        self.universal_rules: list[StyleRule] = []
+        self.rule_count = 0
+
+    def __bool__(self) -> bool:
+        return self.rule_count > 0
+
+    def add_style_element(self, attrib: Mapping[str, str], css: str | None) -> None:
+        """Add the style sheet of a `<style>` element, if it applies to screens.
+
+        Args:
+            attrib: the `<style>` element's attributes.
+            css: the element's content.
+
+        """
+        if css and is_screen_style(attrib):
+            self.add(css)
+
+    def add(self, css: str) -> None:
+        """Add the rules of the given style sheet.
+
+        Args:
+            css: the style sheet's content.
+
+        """
+        for selectors, declarations in _iter_rule_sets(css):
+            setters = CssParse.compile_style(RE_IMPORTANT.sub("", declarations))
+            if not setters:
+                continue
+            for selector in selectors.split(","):
+                if match := RE_SIMPLE_SELECTOR.fullmatch(selector.strip()):
+                    self._add_rule(match, setters)
+
+    def _add_rule(self, selector: re.Match, setters: tuple[Callable[[HtmlElement], None], ...]) -> None:
+        """Add a rule with the given simple selector to the matching bucket."""
+        tag, parts = selector.groups()
+        if not tag and not parts:
+            return
+        ids = []
+        classes = []
+        for kind, name in RE_SELECTOR_PART.findall(parts):
+            (ids if kind == "#" else classes).append(name)
+        # selectors such as `#a#b` never match
+        if len(set(ids)) > 1:
+            return
+
+        tag = tag.lower() if tag and tag != "*" else None
+        element_id = ids[0] if ids else None
+        rule = StyleRule(
+            tag,
+            element_id,
+            frozenset(classes),
+            (len(ids), len(classes), int(tag is not None), self.rule_count),
+            setters,
+        )
+        self.rule_count += 1
+        if element_id is not None:
+            self.id_rules.setdefault(element_id, []).append(rule)
+        elif classes:
+            self.class_rules.setdefault(classes[0], []).append(rule)
+        elif tag is not None:
+            self.tag_rules.setdefault(tag, []).append(rule)
+        else:
+            self.universal_rules.append(rule)
+
+    def get_setters(self, tag: str, attrs: Mapping[str, str]) -> list[Callable[[HtmlElement], None]]:
+        """Return the property setters of all rules applying to the given element.
+
+        The setters are ordered by their rules' specificity and position, and
+        only the setter of the winning declaration is returned per property.
+
+        Args:
+            tag: the element's tag.
+            attrs: the element's attributes.
+
+        """
+        candidates = [*self.universal_rules, *self.tag_rules.get(tag, ())]
+        element_id = attrs.get("id")
+        if element_id is not None and self.id_rules:
+            candidates.extend(self.id_rules.get(element_id, ()))
+        class_attribute = attrs.get("class")
+        classes = set(class_attribute.split()) if class_attribute else set()
+        if self.class_rules:
+            for class_name in classes:
+                candidates.extend(self.class_rules.get(class_name, ()))
+        if not candidates:
+            return []
+
+        setters = {}
+        for rule in sorted(candidates, key=lambda rule: rule.priority):
+            if rule.matches(tag, element_id, classes):
+                for setter in rule.setters:
+                    setters[setter.func] = setter
+        return list(setters.values())
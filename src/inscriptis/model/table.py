@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """Classes used for representing Tables, TableRows and TableCells."""
 
+from collections.abc import Callable, Iterator
 from itertools import accumulate, chain
 
 from inscriptis.annotation import Annotation, horizontal_shift
+from inscriptis.cancellation import ROW_CHECK_INTERVAL
 from inscriptis.html_properties import HorizontalAlignment, VerticalAlignment
-from inscriptis.model.canvas import Canvas
+from inscriptis.model.canvas import Canvas, TextCanvas
 
 
 class TableCell(Canvas):
@@ -86,8 +88,15 @@ class TableCell(Canvas):
         """
         # save the original line widths before reformatting
         self.line_width = [len(block) for block in self.blocks]
+        self.format_width(width)
 
-        # record new width and start reformatting
+    def format_width(self, width: int) -> None:
+        """Record the cell's width and apply its horizontal formatting.
+
+        Args:
+            width: The cell's expected width.
+
+        """
         self._width = width
         format_spec = f"{{:{self.align.value}{width}}}"
         self.blocks = [format_spec.format(b) for b in self.blocks]
@@ -153,6 +162,19 @@ class TableCell(Canvas):
         return result
 
 
+class TextTableCell(TextCanvas, TableCell):
+    """A table cell for plain text conversions, which does not record annotations."""
+
+    __slots__ = ()
+
+    # the original line widths are only required for adjusting annotations
+    width = TableCell.width.setter(TableCell.format_width)
+
+    def get_annotations(self, idx: int, row_width: int) -> list[Annotation]:
+        """Return an empty list, since plain text cells do not contain annotations."""
+        return []
+
+
 class TableRow:
     """A single row within a table.
 
@@ -194,18 +216,35 @@ class Table:
         rows: the table's rows.
         left_margin_len: length of the left margin before the table.
         cell_separator: string used for separating cells from each other.
+        content_length: the number of characters written to the cells of all
+                        but the last row.
+        column_count: the number of columns of the table's widest row.
+        check_cancellation: an optional callable, which is invoked every
+                            :data:`~inscriptis.cancellation.ROW_CHECK_INTERVAL`
+                            rows while rendering the table and raises an
+                            exception, if the conversion has to be aborted.
 
     """
 
-    __slots__ = ("cell_separator", "left_margin_len", "rows")
+    __slots__ = ("cell_separator", "check_cancellation", "column_count", "content_length", "left_margin_len", "rows")
 
-    def __init__(self, left_margin_len: int, cell_separator: str):
+    def __init__(
+        self,
+        left_margin_len: int,
+        cell_separator: str,
+        check_cancellation: Callable[[], None] | None = None,
+    ):
         self.rows = []
         self.left_margin_len = left_margin_len
         self.cell_separator = cell_separator
+        self.content_length = 0
+        self.column_count = 0
+        self.check_cancellation = check_cancellation
 
     def add_row(self):
         """Add an empty :class:`TableRow` to the table."""
+        if self.rows:
+            self.content_length += sum(cell.current_block.idx for cell in self.rows[-1].columns)
         self.rows.append(TableRow(self.cell_separator))
 
     def add_cell(self, table_cell: TableCell):
@@ -217,10 +256,22 @@ class Table:
         if not self.rows:
             self.add_row()
         self.rows[-1].columns.append(table_cell)
+        self.column_count = max(self.column_count, len(self.rows[-1].columns))
+
+    def _iter_rows(self) -> Iterator[TableRow]:
+        """Iterate over the table's rows and periodically check for cancellation."""
+        if self.check_cancellation is None:
+            yield from self.rows
+            return
+
+        for no, row in enumerate(self.rows):
+            if not no % ROW_CHECK_INTERVAL:
+                self.check_cancellation()
+            yield row
 
     def _set_row_height(self):
         """Set the cell height for all :class:`TableCell`s in the table."""
-        for row in self.rows:
+        for row in self._iter_rows():
             max_row_height = max(cell.normalize_blocks() for cell in row.columns) if row.columns else 0
             for cell in row.columns:
                 cell.height = max_row_height
@@ -246,7 +297,7 @@ class Table:
 
         self._set_row_height()
         self._set_column_width()
-        return "\n".join(row.get_text() for row in self.rows) + "\n"
+        return "\n".join(row.get_text() for row in self._iter_rows()) + "\n"
 
     def get_annotations(self, idx: int, left_margin_len: int) -> list[Annotation]:
         r"""Return all annotations in the given table.
@@ -280,3 +331,13 @@ class Table:
             idx += (row_width + 1) * row_height  # linebreak
 
         return annotations
+
+
+class TextTable(Table):
+    """An HTML table for plain text conversions, which does not record annotations."""
+
+    __slots__ = ()
+
+    def get_annotations(self, idx: int, left_margin_len: int) -> list[Annotation]:
+        """Return an empty list, since plain text tables do not contain annotations."""
+        return []
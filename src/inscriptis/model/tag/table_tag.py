@@ -1,16 +1,14 @@
 """Handle the <table>, <tr> and <td> tags."""
 
 from inscriptis.annotation import Annotation
-from inscriptis.model.canvas import Canvas
 from inscriptis.model.html_document_state import HtmlDocumentState
-from inscriptis.model.table import Table, TableCell
 
 
 def td_start_handler(state: HtmlDocumentState, _: dict) -> None:
     """Handle the <td> tag."""
     if state.current_table:
         # open td tag
-        table_cell = TableCell(align=state.tags[-1].align, valign=state.tags[-1].valign)
+        table_cell = state.table_cell_class(align=state.tags[-1].align, valign=state.tags[-1].valign)
         state.tags[-1].canvas = table_cell
         state.current_table[-1].add_cell(table_cell)
 
@@ -23,11 +21,12 @@ def tr_start_handler(state: HtmlDocumentState, _: dict) -> None:
 
 def table_start_handler(state: HtmlDocumentState, _: dict) -> None:
     """Handle the <table> tag."""
-    state.tags[-1].set_canvas(Canvas())
+    state.tags[-1].set_canvas(state.canvas_class())
     state.current_table.append(
-        Table(
+        state.table_class(
             left_margin_len=state.tags[-1].canvas.left_margin,
             cell_separator=state.config.table_cell_separator,
+            check_cancellation=state.check_cancellation if state.cancellable else None,
         ),
     )
 
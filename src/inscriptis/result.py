@@ -0,0 +1,106 @@
+"""Lazily computed projections of a conversion's result.
+
+A :class:`ConversionResult` holds the canvas of a finished conversion and
+computes its projections (i.e., the text, lines, blocks, annotations, labels
+and surface forms) only when they are accessed for the first time. Every
+projection is computed at most once and cached afterwards, so that callers
+only pay for the projections they actually use.
+
+Example::
+
+    from inscriptis import get_result
+    from inscriptis.model.config import ParserConfig
+
+    result = get_result(html, ParserConfig(annotation_rules={"h1": ["heading"]}))
+    print(result.head(3))  # only splits the blocks required for three lines
+    print(result.labels)  # does not join the text
+    print(result.surfaces)  # joins the text once and reuses it afterwards
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from inscriptis.annotation import Annotation
+    from inscriptis.model.canvas import Canvas
+
+
+class ConversionResult:
+    """The result of a conversion, whose projections are computed on first access.
+
+    Args:
+        canvas: the canvas of the finished conversion, which must not be
+                modified afterwards.
+        fired_guards: the names of the resource guards which fired during
+                the conversion.
+
+    Attributes:
+        canvas: the conversion's canvas.
+        fired_guards: the names of the resource guards (i.e., `max_elements`,
+            `max_depth` or `max_table_cells`) which caused the flattening of
+            elements.
+
+    """
+
+    def __init__(self, canvas: Canvas, fired_guards: frozenset[str] = frozenset()) -> None:
+        # complete the canvas' last line
+        canvas.flush_inline()
+        self.canvas = canvas
+        self.fired_guards = fired_guards
+
+    @cached_property
+    def blocks(self) -> tuple[str, ...]:
+        """The text blocks written to the canvas, each of which spans at least one line."""
+        return tuple(self.canvas.blocks)
+
+    @cached_property
+    def text(self) -> str:
+        """The text representation of the HTML content."""
+        return "\n".join(self.blocks)
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """The lines of the text (empty texts do not contain any lines)."""
+        return list(self._iter_lines())
+
+    @cached_property
+    def annotations(self) -> list[Annotation]:
+        """The annotations extracted from the HTML content."""
+        return self.canvas.annotations
+
+    @cached_property
+    def labels(self) -> list[tuple[int, int, str]]:
+        """The start index, end index and label of all annotations (see :func:`inscriptis.get_annotated_text`)."""
+        return [(a.start, a.end, a.metadata) for a in self.annotations]
+
+    @cached_property
+    def surfaces(self) -> list[tuple[str, str]]:
+        """The label and surface form of all annotations.
+
+        See :class:`~inscriptis.annotation.output.surface.SurfaceExtractor`.
+        """
+        text = self.text
+        return [(a.metadata, text[a.start : a.end]) for a in self.annotations]
+
+    def head(self, line_count: int) -> list[str]:
+        """Return the first lines of the text.
+
+        Only the blocks containing the requested lines are split, unless
+        all lines have already been computed.
+
+        Args:
+            line_count: the maximum number of lines to return.
+
+        """
+        if "lines" in self.__dict__:
+            return self.lines[:line_count]
+        return list(islice(self._iter_lines(), line_count))
+
+    def _iter_lines(self) -> Iterator[str]:
+        """Iterate over the lines of the text's blocks."""
+        return chain.from_iterable(block.split("\n") for block in self.blocks)
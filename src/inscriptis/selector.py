@@ -0,0 +1,82 @@
+"""Select the elements to render with XPath expressions or CSS selectors.
+
+Expressions starting with `/`, `./`, `../` or `(` are considered XPath
+expressions, all other expressions CSS selectors (e.g., `article`,
+`#content` or `.post-body`). CSS selectors require the optional
+`cssselect` package.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from lxml.etree import XPath
+
+if TYPE_CHECKING:
+    from lxml.etree import _Element
+
+XPATH_PREFIXES = ("/", "./", "../", "(")
+
+
+def is_xpath(expression: str) -> bool:
+    """Indicate whether the given expression is an XPath expression."""
+    return expression.lstrip().startswith(XPATH_PREFIXES)
+
+
+@lru_cache(maxsize=128)
+def compile_selectors(selectors: tuple[str, ...]) -> XPath:
+    """Compile the given selectors into a single XPath expression.
+
+    Args:
+        selectors: XPath expressions or CSS selectors.
+
+    Raises:
+        ImportError: for CSS selectors, if `cssselect` is not installed.
+
+    """
+    expressions = []
+    for selector in selectors:
+        if is_xpath(selector):
+            expressions.append(selector)
+            continue
+
+        try:
+            from cssselect import HTMLTranslator
+        except ImportError as e:
+            msg = "CSS selectors require the cssselect package (pip install inscriptis[cssselect])."
+            raise ImportError(msg) from e
+        expressions.append(HTMLTranslator().css_to_xpath(selector))
+    return XPath(" | ".join(expressions))
+
+
+def select_elements(html_tree: _Element, selectors: tuple[str, ...]) -> list[_Element]:
+    """Return the outermost elements matching any of the given selectors.
+
+    Args:
+        html_tree: the HTML tree to select the elements from.
+        selectors: XPath expressions or CSS selectors.
+
+    Returns:
+        The matching elements in document order. Matches within other
+        matching elements are omitted, since they are already covered by
+        their ancestor.
+
+    Raises:
+        ValueError: if the tree does not support XPath (e.g., trees created
+            by the selectolax backend).
+
+    """
+    if not hasattr(html_tree, "xpath"):
+        msg = "Content selectors require an lxml tree (e.g., from the lxml or html5lib backend)."
+        raise ValueError(msg)
+
+    selected = set()
+    elements = []
+    # XPath returns the elements in document order, i.e. ancestors first
+    for element in compile_selectors(selectors)(html_tree):
+        if not isinstance(getattr(element, "tag", None), str) or not selected.isdisjoint(element.iterancestors()):
+            continue
+        selected.add(element)
+        elements.append(element)
+    return elements
@@ -1,21 +1,41 @@
 #!/usr/bin/env python3
 """Inscriptis Web Service."""
 
-from fastapi import FastAPI, Request
+from functools import lru_cache
+
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from inscriptis import get_text
+from inscriptis.cancellation import ConversionTimeout
 from inscriptis.css_profiles import RELAXED_CSS_PROFILE
+from inscriptis.encoding import detect_encoding
 from inscriptis.metadata import __version__
 from inscriptis.model.config import ParserConfig
 
 app = FastAPI()
-CONFIG = ParserConfig(
-    css=RELAXED_CSS_PROFILE,
-    display_images=True,
-    deduplicate_captions=True,
-    display_links=False,
-)
+
+# number of configurations (i.e., distinct timeouts) whose render plans are kept
+CONFIG_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def get_config(timeout: float | None = None) -> ParserConfig:
+    """Return the Web service's configuration with the given conversion timeout.
+
+    The configurations are cached, so that their render plans are only
+    compiled once per timeout rather than for every request.
+    """
+    return ParserConfig(
+        css=RELAXED_CSS_PROFILE,
+        display_images=True,
+        deduplicate_captions=True,
+        display_links=False,
+        timeout=timeout,
+    )
+
+
+CONFIG = get_config()
 
 
 @app.get("/")
@@ -25,12 +45,19 @@ def index() -> PlainTextResponse:
 
 
 @app.post("/get_text", response_class=PlainTextResponse)
-async def get_text_call(request: Request) -> str:
-    """Return the text representation of the given HTML content."""
-    content_type = request.headers.get("Content-type", "")
-    encoding = content_type.split("; charset=")[1] if "; charset=" in content_type else "UTF-8"
+async def get_text_call(request: Request, timeout: float | None = None) -> str:
+    """Return the text representation of the given HTML content.
+
+    Conversions exceeding the optional `timeout` (in seconds) are aborted
+    with the status code 503.
+    """
     html_content = await request.body()
-    return get_text(html_content.decode(encoding, errors="ignore"), CONFIG)
+    encoding = detect_encoding(html_content, request.headers.get("Content-type"))
+    config = get_config(timeout)
+    try:
+        return get_text(html_content, config, encoding)
+    except ConversionTimeout as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
 
 
 @app.get("/version", response_class=PlainTextResponse)
@@ -0,0 +1,65 @@
+"""Test timeouts and the cooperative cancellation of conversions."""
+
+from io import BytesIO
+
+import pytest
+from lxml.etree import HTMLParser, fromstring
+
+from inscriptis import get_text, iter_text, render_many
+from inscriptis.cancellation import (
+    ELEMENT_CHECK_INTERVAL,
+    ROW_CHECK_INTERVAL,
+    CancellationToken,
+    ConversionCancelled,
+    ConversionTimeout,
+)
+from inscriptis.html_engine import InscriptisTarget
+from inscriptis.html_properties import HorizontalAlignment, VerticalAlignment
+from inscriptis.model.config import ParserConfig
+from inscriptis.model.table import Table, TableCell
+
+HTML = "<html><body>" + "<p>Paragraph</p>" * (4 * ELEMENT_CHECK_INTERVAL) + "</body></html>"
+
+
+def test_timeout():
+    with pytest.raises(ConversionTimeout):
+        get_text(HTML, ParserConfig(timeout=0))
+    assert get_text(HTML, ParserConfig(timeout=60)) == get_text(HTML)
+
+
+def test_cancellation_token():
+    token = CancellationToken()
+    config = ParserConfig(cancellation_token=token)
+    assert get_text(HTML, config) == get_text(HTML)
+
+    token.cancel()
+    assert token.cancelled
+    with pytest.raises(ConversionCancelled):
+        get_text(HTML, config)
+    # small documents are completed before the first check
+    assert get_text("<b>Paragraph</b>", config) == "Paragraph"
+
+
+def test_cancellation_of_other_engines():
+    token = CancellationToken()
+    token.cancel()
+    config = ParserConfig(cancellation_token=token)
+
+    with pytest.raises(ConversionCancelled):
+        fromstring(HTML, HTMLParser(target=InscriptisTarget(config)))
+    with pytest.raises(ConversionCancelled):
+        "".join(iter_text(BytesIO(HTML.encode("utf8")), config))
+    with pytest.raises(ConversionCancelled):
+        render_many(HTML, [ParserConfig(), config])
+
+
+def test_table_cancellation():
+    checks = []
+    table = Table(left_margin_len=0, cell_separator="  ", check_cancellation=lambda: checks.append(True))
+    for _ in range(2 * ROW_CHECK_INTERVAL):
+        table.add_row()
+        cell = TableCell(HorizontalAlignment.left, VerticalAlignment.top)
+        table.add_cell(cell)
+    table.get_text()
+    # checked while computing the row heights and rendering the rows
+    assert len(checks) == 4
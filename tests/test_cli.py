@@ -2,7 +2,7 @@
 Tests the Inscriptis CLI client.
 """
 
-from io import StringIO
+from io import BytesIO, TextIOWrapper
 from json import loads
 from pathlib import Path
 from unittest.mock import Mock, call, mock_open, patch
@@ -18,7 +18,7 @@ def test_cli_read_from_stdin(monkeypatch, capsys):
     """Test converting HTML from standard input with the command line client."""
     # Use monkeypatch to replace the 'input' function
     monkeypatch.setattr("sys.argv", ["inscript"])
-    monkeypatch.setattr("sys.stdin", StringIO(INPUT_DATA))
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(INPUT_DATA.encode("utf8"))))
     cli()
 
     # Capture the printed output
@@ -31,7 +31,7 @@ def test_cli_read_from_stdin_write_to_file(monkeypatch, capsys):
     writing it to a file."""
     # Use monkeypatch to replace the 'input' function
     monkeypatch.setattr("sys.argv", ["inscript", "--output", "test.txt"])
-    monkeypatch.setattr("sys.stdin", StringIO(INPUT_DATA))
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(INPUT_DATA.encode("utf8"))))
     with patch("pathlib.Path.open", create=True) as mock_file:
         cli()
 
@@ -47,7 +47,7 @@ def test_cli_read_from_file(monkeypatch, capsys):
     # Use monkeypatch to replace the 'input' function
     monkeypatch.setattr("sys.argv", ["inscript", "test.html"])
     monkeypatch.setattr("pathlib.Path.is_file", lambda _: True)
-    monkeypatch.setattr("pathlib.Path.open", mock_open(read_data=INPUT_DATA))
+    monkeypatch.setattr("pathlib.Path.open", mock_open(read_data=INPUT_DATA.encode("utf8")))
     cli()
 
     # Capture the printed output
@@ -63,6 +63,7 @@ def test_cli_read_from_url(monkeypatch, capsys):
     mock_request = Mock()
     mock_request.content = INPUT_DATA.encode("utf8")
     mock_request.encoding = "utf-8"
+    mock_request.headers = {"Content-Type": "text/html"}
     monkeypatch.setattr("requests.get", lambda url, timeout=0: mock_request)
     cli()
 
@@ -71,6 +72,35 @@ def test_cli_read_from_url(monkeypatch, capsys):
     assert captured.out.strip() == "Hello World!"
 
 
+def test_cli_read_from_url_with_declared_encoding(monkeypatch, capsys):
+    """Test that the encoding declared by the document is used for decoding."""
+    monkeypatch.setattr("sys.argv", ["inscript", "https://www.fhgr.ch/test.html"])
+
+    mock_request = Mock()
+    mock_request.content = '<html><head><meta charset="iso-8859-1"></head><body>Grüße</body></html>'.encode("latin1")
+    mock_request.encoding = "utf-8"
+    mock_request.headers = {"Content-Type": "text/html"}
+    monkeypatch.setattr("requests.get", lambda url, timeout=0: mock_request)
+    cli()
+
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "Grüße"
+
+
+def test_cli_read_from_url_with_content_type(monkeypatch, capsys):
+    """Test that the charset of the Content-Type header takes precedence over the document."""
+    monkeypatch.setattr("sys.argv", ["inscript", "https://www.fhgr.ch/test.html"])
+
+    mock_request = Mock()
+    mock_request.content = '<html><head><meta charset="utf-8"></head><body>Grüße</body></html>'.encode("cp1252")
+    mock_request.headers = {"Content-Type": 'text/html; charset="windows-1252"'}
+    monkeypatch.setattr("requests.get", lambda url, timeout=0: mock_request)
+    cli()
+
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "Grüße"
+
+
 def test_cli_annotations(monkeypatch, capsys):
     """Test annotation handling in the command line client."""
     # Prepare input data for the test
@@ -78,7 +108,7 @@ def test_cli_annotations(monkeypatch, capsys):
 
     # Use monkeypatch to replace the 'input' function
     monkeypatch.setattr("sys.argv", ["inscript", "-p", "surface", "-r", str(annotation_rule_path)])
-    monkeypatch.setattr("sys.stdin", StringIO(INPUT_DATA))
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(INPUT_DATA.encode("utf8"))))
     cli()
 
     # Capture the printed json data and convert it to an object
@@ -113,10 +143,34 @@ def test_missing_input_file(monkeypatch, capsys):
 
 def test_missing_annotation_file(monkeypatch, capsys):
     monkeypatch.setattr("sys.argv", ["inscript", "--annotation-rules", "rules.json"])
-    monkeypatch.setattr("sys.stdin", StringIO(INPUT_DATA))
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(INPUT_DATA.encode("utf8"))))
     with pytest.raises(SystemExit) as exit_info:
         cli()
 
     captured = capsys.readouterr()
     assert exit_info.value.code == -1
     assert captured.out.strip().startswith("ERROR: Cannot open annotation rule file")
+
+
+def test_conversion_timeout(monkeypatch, capsys):
+    html_content = "<html><body>" + "<p>x</p>" * 1000 + "</body></html>"
+    monkeypatch.setattr("sys.argv", ["inscript", "--conversion-timeout", "0"])
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(html_content.encode("utf8"))))
+    with pytest.raises(SystemExit) as exit_info:
+        cli()
+
+    captured = capsys.readouterr()
+    assert exit_info.value.code == -1
+    assert captured.out.strip().startswith("ERROR: The conversion has exceeded its timeout")
+
+
+def test_parse_style_sheets(monkeypatch, capsys):
+    html_content = (
+        "<html><head><style>.hidden { display: none }</style></head><body>Hello<p class=hidden>World</p></body></html>"
+    )
+    monkeypatch.setattr("sys.argv", ["inscript", "--parse-style-sheets"])
+    monkeypatch.setattr("sys.stdin", TextIOWrapper(BytesIO(html_content.encode("utf8"))))
+    cli()
+
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "Hello"
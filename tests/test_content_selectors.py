@@ -0,0 +1,56 @@
+"""Test rendering only the content matching the configured selectors."""
+
+import pytest
+
+from inscriptis import get_annotated_text, get_text, render_many
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.model.config import ParserConfig
+
+HTML = (
+    "<html><body><nav>Menu</nav>"
+    "<article><h1>Title</h1><p>Some <b>bold</b> text.</p></article>between"
+    "<div class='post-body'><p>Post</p><article>Nested <b>article</b></article></div>"
+    "<footer>Footer</footer></body></html>"
+)
+
+
+def test_xpath_selector():
+    config = ParserConfig(css=CSS_PROFILES["strict"], content_selectors=["//article"])
+    assert get_text(HTML, config) == "Title\n\nSome bold text.\n\nNested article"
+
+
+def test_css_selectors():
+    pytest.importorskip("cssselect")
+    config = ParserConfig(css=CSS_PROFILES["strict"], content_selectors=[".post-body", "article"])
+    # matches are rendered in document order and nested matches only once
+    assert get_text(HTML, config) == "Title\n\nSome bold text.\n\nPost\n\nNested article"
+
+
+def test_selector_annotations():
+    config = ParserConfig(content_selectors=["//article"], annotation_rules={"h1": ["heading"], "b": ["bold"]})
+    result = get_annotated_text(HTML, config)
+    assert [(result["text"][start:end], label) for start, end, label in result["label"]] == [
+        ("Title\n\n", "heading"),
+        ("bold", "bold"),
+        ("article", "bold"),
+    ]
+
+
+def test_selector_without_matches():
+    assert get_text(HTML, ParserConfig(content_selectors=["//main"])) == ""
+
+
+def test_render_many_with_selectors():
+    configs = [
+        ParserConfig(content_selectors=["//article"]),
+        ParserConfig(content_selectors=["//article"], annotation_rules={"b": ["bold"]}),
+        ParserConfig(content_selectors=["//footer"]),
+        ParserConfig(),
+    ]
+    assert render_many(HTML, configs) == [get_annotated_text(HTML, config) for config in configs]
+
+
+def test_selectors_require_lxml_trees():
+    pytest.importorskip("selectolax")
+    with pytest.raises(ValueError):
+        get_text(HTML, ParserConfig(content_selectors=["//article"], parser_backend="selectolax"))
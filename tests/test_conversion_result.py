@@ -0,0 +1,56 @@
+"""Test the lazily computed ConversionResult."""
+
+from glob import glob
+from pathlib import Path
+
+from inscriptis import Converter, get_annotated_text, get_result, get_text
+from inscriptis.annotation.output.surface import SurfaceExtractor
+from inscriptis.model.config import ParserConfig
+
+TESTS_DIR = Path(__file__).parent
+DOCUMENTS = [Path(fname).read_text() for fname in sorted(glob(str(TESTS_DIR / "html" / "*.html")))]
+CONFIG = ParserConfig(annotation_rules={"h1": ["heading"], "b": ["emphasis"], "table": ["table"]})
+HTML = "<html><body><h1>Chur</h1><p>Chur is the <b>capital</b> of the Grisons.</p><pre>a\nb</pre></body></html>"
+
+
+def test_projections():
+    for html in DOCUMENTS:
+        result = get_result(html, CONFIG)
+        annotated_text = get_annotated_text(html, CONFIG)
+        assert result.text == get_text(html, CONFIG) == annotated_text["text"]
+        assert result.labels == annotated_text["label"]
+        assert result.lines == (result.text.split("\n") if result.text else [])
+        assert result.surfaces == SurfaceExtractor()(annotated_text)["surface"]
+        assert "\n".join(result.blocks) == result.text
+
+
+def test_projections_are_lazy():
+    result = get_result(HTML, CONFIG)
+    assert not vars(result).keys() - {"canvas", "fired_guards"}
+
+    assert result.labels == get_annotated_text(HTML, CONFIG)["label"]
+    assert "text" not in vars(result)
+    assert result.head(2) == ["Chur", ""]
+    assert "lines" not in vars(result)
+    assert "text" not in vars(result)
+
+    assert result.surfaces == [("heading", "Chur\n\n"), ("emphasis", "capital")]
+    assert result.text is result.text
+    assert result.lines[-2:] == ["a", "b"]
+    assert result.head(1) == ["Chur"]
+
+
+def test_empty_result():
+    for html in ("", " ", b""):
+        result = get_result(html)
+        assert (result.text, result.lines, result.labels, result.surfaces, result.blocks) == ("", [], [], [], ())
+        assert result.head(3) == []
+
+
+def test_converter_result():
+    converter = Converter(CONFIG)
+    first = converter.convert_result(HTML)
+    second = converter.convert_result("<h1>Second</h1>")
+    assert first.text == get_text(HTML, CONFIG)
+    assert second.labels == get_annotated_text("<h1>Second</h1>", CONFIG)["label"]
+    assert converter.convert_result("").text == ""
@@ -0,0 +1,63 @@
+"""Test the reusable Converter for batch conversions."""
+
+from glob import glob
+from pathlib import Path
+
+import pytest
+
+from inscriptis import Converter, get_annotated_text, get_text
+from inscriptis.cancellation import CancellationToken, ConversionCancelled
+from inscriptis.model.config import ParserConfig, get_default_config
+
+TESTS_DIR = Path(__file__).parent
+DOCUMENTS = [Path(fname).read_text() for fname in sorted(glob(str(TESTS_DIR / "html" / "*.html")))]
+RULES = {"h1": ["heading"], "b": ["emphasis"], "table": ["table"]}
+
+
+def test_convert():
+    converter = Converter()
+    for html in DOCUMENTS:
+        assert converter.convert(html) == get_text(html)
+    assert converter.convert("") == ""
+    assert converter.convert(DOCUMENTS[0].encode("utf8")) == get_text(DOCUMENTS[0])
+
+
+def test_convert_annotated():
+    config = ParserConfig(annotation_rules=RULES)
+    converter = Converter(config)
+    for html in DOCUMENTS:
+        assert converter.convert_annotated(html) == get_annotated_text(html, config)
+    assert converter.convert_annotated(" ") == {}
+
+
+def test_document_state_is_reset():
+    config = ParserConfig(max_chars=20, max_depth=3)
+    converter = Converter(config)
+    unclosed = "<html><body><table><tr><td><ul><li><b>open"
+    html = "<html><body><p>Short</p></body></html>"
+    converter.convert(unclosed)
+    assert converter.fired_guards == {"max_depth"}
+    assert converter.convert(html) == get_text(html, config)
+    assert not converter.fired_guards
+
+
+def test_conversion_after_cancellation():
+    token = CancellationToken()
+    converter = Converter(ParserConfig(cancellation_token=token))
+    html = "<html><body>" + "<p>Paragraph</p>" * 1000 + "</body></html>"
+    token.cancel()
+    with pytest.raises(ConversionCancelled):
+        converter.convert(html)
+    assert converter.convert("<html><body><h1>Title</h1></body></html>") == "Title\n"
+
+
+def test_default_config_is_shared():
+    assert get_default_config() is get_default_config()
+    assert Converter().config is not get_default_config()
+
+
+def test_converter_config_changes_are_private():
+    converter = Converter()
+    converter.config.display_links = True
+    assert get_text('<a href="x">y</a>') == "y"
+    assert Converter().convert('<a href="x">y</a>') == "y"
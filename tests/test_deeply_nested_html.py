@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+"""
+Tests the conversion of deeply nested HTML trees, which exceed both, Python's
+recursion limit and libxml2's maximum parsing depth.
+"""
+
+from lxml.html import HTMLParser, fromstring
+
+from inscriptis import Inscriptis
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.model.config import ParserConfig
+
+DEPTH = 100_000
+# libxml2 does not parse documents nested deeper than 2048 levels
+CHUNK_DEPTH = 2000
+
+
+def get_nested_tree(tag, depth, text):
+    """Create a tree of `depth` nested `tag` elements by grafting parsed chunks."""
+    root = fromstring("<html><body></body></html>")
+    leaf = root.find("body")
+    for _ in range(depth // CHUNK_DEPTH):
+        chunk = fromstring(f"<{tag}>" * CHUNK_DEPTH, parser=HTMLParser(huge_tree=True))
+        leaf.append(chunk)
+        while len(leaf):
+            leaf = leaf[0]
+    leaf.text = text
+    leaf.tail = "tail"
+    return root
+
+
+def get_depth(html_tree, tag):
+    # keep references to all visited elements, since lxml checks all
+    # ancestors when freeing an element proxy
+    path = [html_tree.find("body")]
+    while len(path[-1]) and path[-1][0].tag == tag:
+        path.append(path[-1][0])
+    return len(path) - 1
+
+
+def test_deeply_nested_inline_elements():
+    html_tree = get_nested_tree("span", DEPTH, "deep")
+    assert get_depth(html_tree, "span") == DEPTH
+    assert Inscriptis(html_tree).get_text() == "deep tail"
+
+
+def test_deeply_nested_block_elements():
+    html_tree = get_nested_tree("div", DEPTH, "deep")
+    assert get_depth(html_tree, "div") == DEPTH
+    config = ParserConfig(css=CSS_PROFILES["strict"])
+    assert Inscriptis(html_tree, config).get_text() == "deep\ntail"
+
+
+def test_deeply_nested_annotations():
+    html_tree = get_nested_tree("b", DEPTH, "deep")
+    config = ParserConfig(annotation_rules={"b": ["bold"]})
+    inscriptis = Inscriptis(html_tree, config)
+    assert inscriptis.get_text() == "deeptail"
+    assert len(inscriptis.get_annotations()) == DEPTH
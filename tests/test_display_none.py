@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+"""
+Tests the handling of elements which are not displayed (i.e., `display: none`).
+"""
+
+from lxml.etree import HTMLParser, fromstring
+
+from inscriptis import get_annotated_text, get_text
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.html_engine import InscriptisStream, InscriptisTarget
+from inscriptis.model.config import ParserConfig
+
+STRICT = ParserConfig(css=CSS_PROFILES["strict"])
+
+
+def assert_conversion(html, expected, config=STRICT):
+    html = f"<html><body>{html}</body></html>"
+    assert get_text(html, config) == expected
+    assert fromstring(html, HTMLParser(target=InscriptisTarget(config))).get_text() == expected
+
+    stream = InscriptisStream(config)
+    assert "".join(stream.feed(ch) for ch in html) + stream.close() == expected
+
+
+def test_hidden_content_keeps_tail():
+    assert_conversion('<div>a<script>var x="<b>";</script>b<span style="display:none">c<b>d</b></span>e</div>', "abe")
+
+
+def test_hidden_comments_and_line_breaks():
+    assert_conversion('<p>a</p><div style="display:none"><!-- x -->hidden<br>text</div><p>b</p>', "a\n\nb\n")
+
+
+def test_hidden_list_items_and_table_cells():
+    assert_conversion('<ol><li>one</li><li style="display:none">two</li><li>three</li></ol>', " 1. one\n 2. three")
+    assert_conversion(
+        '<table><tr><td>a</td><td style="display:none">b</td><td>c</td></tr></table>after', "a  c\n\nafter"
+    )
+
+
+def test_hidden_content_is_not_annotated():
+    html = '<html><body><b>shown</b><div style="display:none"><b>hidden</b></div></body></html>'
+    config = ParserConfig(annotation_rules={"b": ["bold"]})
+    assert get_annotated_text(html, config) == {"text": "shown", "label": [(0, 5, "bold")]}
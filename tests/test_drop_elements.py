@@ -0,0 +1,66 @@
+"""Test dropping elements prior to rendering."""
+
+import pytest
+from lxml.html import document_fromstring, tostring
+
+from inscriptis import get_annotated_text, get_text
+from inscriptis.backend import get_available_parser_backends
+from inscriptis.backend._tree import drop_elements_from_tree
+from inscriptis.model.config import NON_CONTENT_ELEMENTS, ParserConfig
+
+HTML = (
+    "<html><body><p>first<svg><text>icon</text></svg> paragraph</p>"
+    "<nav><a href='/'>home</a></nav>"
+    "<p class='ad'>buy now</p>"
+    "<p>second <b>paragraph</b></p></body></html>"
+)
+
+
+@pytest.mark.parametrize("backend", get_available_parser_backends())
+def test_drop_tags(backend):
+    config = ParserConfig(drop_elements=NON_CONTENT_ELEMENTS, parser_backend=backend)
+    assert get_text(HTML, config) == "first paragraph\n\nbuy now\n\nsecond paragraph\n"
+
+
+def test_drop_xpath():
+    config = ParserConfig(drop_elements=["svg", "//p[@class='ad']"])
+    assert get_text(HTML, config) == "first paragraph\n\nhome\n\nsecond paragraph\n"
+
+
+def test_drop_keeps_annotations_consistent():
+    config = ParserConfig(drop_elements=["svg", "nav"], annotation_rules={"b": ["bold"]})
+    result = get_annotated_text(HTML, config)
+    assert result["text"] == "first paragraph\n\nbuy now\n\nsecond paragraph\n"
+    assert [result["text"][start:end] for start, end, _ in result["label"]] == ["paragraph"]
+
+
+def test_drop_root():
+    assert get_text("<div>content</div>", ParserConfig(drop_elements=["div"])) == ""
+    assert get_text("<div>content</div>", ParserConfig(drop_elements=["//div"])) == ""
+
+
+def test_drop_ignores_non_element_results():
+    html = "<div><!-- c -->first <a href='/'>link</a> second</div>"
+    for expression in ("//comment()", "//a/text()", "//a/@href", "count(//a)"):
+        assert get_text(html, ParserConfig(drop_elements=[expression])) == get_text(html)
+
+
+def test_drop_outside_of_fragments():
+    html = "<div>first <b>bold</b> second</div>"
+    assert get_text(html, ParserConfig(drop_elements=["//body"])) == ""
+    assert get_text(html, ParserConfig(drop_elements=["//b"])) == "  first second"
+
+    html_tree = document_fromstring("<html><body><p>outside</p><div>inside<p>dropped</p> tail</div></body></html>")
+    div = html_tree.find("body/div")
+    assert tostring(drop_elements_from_tree(div, ["//p"]), with_tail=False) == b"<div>inside tail</div>"
+    assert html_tree.find("body/p").tag == "p"
+
+
+def test_drop_nothing():
+    assert get_text(HTML, ParserConfig(drop_elements=["table"])) == get_text(HTML)
+
+
+def test_selectolax_rejects_xpath():
+    pytest.importorskip("selectolax")
+    with pytest.raises(ValueError):
+        get_text(HTML, ParserConfig(drop_elements=["//div"], parser_backend="selectolax"))
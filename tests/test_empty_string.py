@@ -14,3 +14,9 @@ def test_empty_and_corrupt():
     assert get_text("") == ""
     # test for the behaviour of older and recent lxml versions.
     assert get_text("<<<").strip() in ("<<<", "<<", "")
+
+
+def test_documents_without_content():
+    assert get_text("<!-- comment -->\n  <!-- comment -->") == ""
+    assert get_text(b"<!DOCTYPE html>\n") == ""
+    assert get_text("</p>") == ""
@@ -0,0 +1,124 @@
+"""Test the encoding detection of raw HTML content."""
+
+from codecs import BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE
+
+import pytest
+
+from inscriptis import get_text
+from inscriptis.encoding import PRESCAN_LEN, decode, detect_encoding, get_content_type_charset, get_encoding, prescan
+from inscriptis.model.config import ParserConfig
+
+
+def test_get_encoding():
+    assert get_encoding(" UTF-8 ") == "utf-8"
+    # WHATWG decodes legacy CJK encodings with their supersets
+    assert get_encoding("Shift_JIS") == "cp932"
+    assert get_encoding("gb2312") == "gbk"
+    assert get_encoding("euc-kr") == "cp949"
+    assert get_encoding("x-sjis") == "cp932"
+    # WHATWG treats latin1 and ascii as windows-1252
+    assert get_encoding("ISO-8859-1") == "cp1252"
+    assert get_encoding("us-ascii") == "cp1252"
+    assert get_encoding("x-user-defined") == "cp1252"
+    assert get_encoding("unknown") is None
+
+
+@pytest.mark.parametrize(
+    ("content_type", "encoding"),
+    [
+        ("text/html; charset=UTF-8", "utf-8"),
+        ("text/html;charset=iso-8859-2", "iso8859-2"),
+        ('text/html; Charset="koi8-r"; foo=bar', "koi8-r"),
+        ("text/html; charset = gbk ; foo=bar", "gbk"),
+        ("text/html; foo=charset", None),
+        ("text/html; charset=unknown", None),
+        ("text/html", None),
+        (None, None),
+    ],
+)
+def test_get_content_type_charset(content_type, encoding):
+    assert get_content_type_charset(content_type) == encoding
+
+
+@pytest.mark.parametrize(
+    ("html_content", "encoding"),
+    [
+        (b'<meta charset="ISO-8859-2">', "iso8859-2"),
+        (b"<META\nCHARSET='Big5'>", "big5hkscs"),
+        (b"<meta/charset=windows-1251>", "cp1251"),
+        (b'<meta http-equiv="Content-Type" content="text/html; charset=Shift_JIS">', "cp932"),
+        (b"<meta content=\"text/html; charset='euc-jp'\" http-equiv=content-type>", "euc_jp"),
+        # content attributes are only considered together with http-equiv
+        (b'<meta content="text/html; charset=euc-jp">', None),
+        # comments and attribute values are skipped
+        (b"<!-- <meta charset=koi8-r> --><meta charset=utf-8>", "utf-8"),
+        (b'<div title="<meta charset=koi8-r>"><meta charset="gbk">', "gbk"),
+        # unknown encodings are ignored and UTF-16 declarations yield UTF-8
+        (b"<meta charset=unknown><meta charset=gbk>", "gbk"),
+        (b"<meta charset=utf-16>", "utf-8"),
+        (b"<meta charset=gbk", None),
+        (b"<p>" + b"x" * PRESCAN_LEN + b"<meta charset=gbk>", None),
+        # XML declarations are only considered without <meta> declarations
+        (b'<?xml version="1.0" encoding="ISO-8859-2"?>\n<html>', "iso8859-2"),
+        (b"<?xml version='1.0' encoding='iso-8859-2'?><meta charset=koi8-r>", "koi8-r"),
+        (b'<?xml version="1.0" encoding="utf-16"?>', "utf-8"),
+        (b'<?xml version="1.0"?><html>', None),
+    ],
+)
+def test_prescan(html_content, encoding):
+    assert prescan(html_content) == encoding
+
+
+def test_detect_encoding():
+    html_content = b'<meta charset="koi8-r">'
+    assert detect_encoding(html_content) == "koi8-r"
+    assert detect_encoding(html_content, "text/html; charset=gbk") == "gbk"
+    assert detect_encoding(BOM_UTF8 + html_content, "text/html; charset=gbk") == "utf-8"
+    assert detect_encoding(BOM_UTF16_LE + html_content) == "utf-16-le"
+    assert detect_encoding(BOM_UTF16_BE + html_content) == "utf-16-be"
+    assert detect_encoding(b"<p>Hello</p>", "text/html") is None
+
+
+def test_get_text_with_declared_encoding():
+    text = "日本語のテキスト"
+    # euc-jp is decoded by Python, since lxml uses a different name
+    html_content = f'<html><head><meta charset="euc-jp"></head><body>{text}</body></html>'.encode("euc-jp")
+    assert get_text(html_content) == text
+    html_content = f"<html><body>{text}</body></html>".encode("shift_jis")
+    assert get_text(html_content, encoding=detect_encoding(html_content, "text/html; charset=sjis")) == text
+
+
+@pytest.mark.parametrize("backend", ["lxml", "selectolax"])
+def test_get_text_with_xml_declaration(backend):
+    html_content = '<?xml version="1.0" encoding="iso-8859-2"?>\n<html><body><p>Łódź</p></body></html>'
+    assert get_text(html_content.encode("iso-8859-2"), ParserConfig(parser_backend=backend)) == "Łódź\n"
+
+
+@pytest.mark.parametrize(
+    ("charset", "text"),
+    [("gb2312", "中文 镕"), ("shift_jis", "①日本"), ("euc-kr", "똠 한국"), ("big5", "中文")],
+)
+def test_get_text_with_mislabelled_charset(charset, text):
+    # the texts contain characters, which are only supported by the WHATWG encodings
+    html_content = f'<html><head><meta charset="{charset}"></head><body><p>{text}</p></body></html>'
+    assert get_text(html_content.encode(get_encoding(charset))) == f"{text}\n"
+
+
+@pytest.mark.parametrize("backend", ["lxml", "html5lib", "selectolax"])
+def test_get_text_with_meta_charset(backend):
+    html_content = '<html><head><meta charset="iso-8859-1"></head><body><p>ä</p></body></html>'.encode("latin-1")
+    config = ParserConfig(parser_backend=backend)
+    assert get_text(html_content, config) == "ä\n"
+
+
+@pytest.mark.parametrize("backend", ["lxml", "html5lib", "selectolax"])
+@pytest.mark.parametrize(
+    ("bom", "encoding"),
+    [(BOM_UTF8, "utf-8"), (BOM_UTF16_LE, "utf-16-le"), (BOM_UTF16_BE, "utf-16-be")],
+)
+def test_get_text_with_bom(backend, bom, encoding):
+    html_content = bom + "<p>ä</p>".encode(encoding)
+    config = ParserConfig(parser_backend=backend)
+    assert get_text(html_content, config) == "ä\n"
+    assert get_text(html_content, config, detect_encoding(html_content)) == "ä\n"
+    assert decode(html_content, encoding) == "<p>ä</p>"
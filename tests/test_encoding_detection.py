@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+"""
+Tests the conversion of byte content with different encodings.
+"""
+
+from inscriptis import get_annotated_text, get_text
+from inscriptis.model.config import ParserConfig
+
+HTML = "<html><head>{meta}</head><body><h1>Grüße</h1> aus Chur</body></html>"
+
+
+def test_undeclared_encoding():
+    html = HTML.format(meta="")
+    assert get_text(html.encode("utf-8")) == get_text(html)
+    assert get_text(memoryview(html.encode("utf-8"))) == get_text(html)
+    assert get_text(html.encode("utf-16")) == get_text(html)
+
+
+def test_declared_encoding():
+    for meta in ('<meta charset="iso-8859-1">', '<meta http-equiv="Content-Type" content="text/html; charset=cp1252">'):
+        html = HTML.format(meta=meta)
+        assert get_text(html.encode("latin1")) == get_text(html)
+
+
+def test_encoding_override():
+    html = HTML.format(meta='<meta charset="utf-8">')
+    assert get_text(html.encode("latin1"), encoding="latin1") == get_text(html)
+
+
+def test_annotated_bytes():
+    html = HTML.format(meta='<meta charset="iso-8859-1">')
+    config = ParserConfig(annotation_rules={"h1": ["heading"]})
+    assert get_annotated_text(html.encode("latin1"), config) == get_annotated_text(html, config)
+    assert get_text(b"  ") == ""
+    assert get_text(b'<?xml version="1.0" encoding="UTF-8" ?> Hallo?>').strip() == "Hallo?>"
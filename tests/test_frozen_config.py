@@ -0,0 +1,107 @@
+"""Test the frozen form of ParserConfig."""
+
+import pickle
+from multiprocessing import get_context
+
+import pytest
+
+from inscriptis import get_annotated_text, get_text
+from inscriptis.cancellation import CancellationToken
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.model.config import ParserConfig, thaw_config
+from inscriptis.model.frozen_config import FrozenParserConfig, get_import_path, resolve_import_path
+from inscriptis.model.tag import CustomHtmlTagHandlerMapping
+from inscriptis.model.tag.br_tag import br_start_handler
+
+HTML = "<html><body><h1>Title</h1><p>Some <b>bold</b> text with a <a href='/link'>link</a></p></body></html>"
+
+
+def bold_start_handler(state, _):
+    state.tags[-1].write("**")
+
+
+def convert(frozen_config: FrozenParserConfig) -> dict:
+    return get_annotated_text(HTML, thaw_config(frozen_config))
+
+
+def test_freeze():
+    frozen_config = ParserConfig(display_links=True, max_chars=100).freeze()
+    assert frozen_config.css == "relaxed"
+    assert ("display_links", True) in frozen_config.options
+    assert ("max_chars", 100) in frozen_config.options
+    assert not frozen_config.annotation_rules
+    assert not frozen_config.start_tag_handlers
+
+    # frozen configurations are hashable and compare by content
+    assert frozen_config == ParserConfig(display_links=True, max_chars=100).freeze()
+    assert hash(frozen_config) == hash(ParserConfig(display_links=True, max_chars=100).freeze())
+    assert frozen_config != ParserConfig(display_links=False, max_chars=100).freeze()
+    assert frozen_config.fingerprint == ParserConfig(display_links=True, max_chars=100).fingerprint
+    assert len({frozen_config: 1, ParserConfig(display_links=True, max_chars=100).freeze(): 2}) == 1
+
+
+def test_fingerprint_ignores_rule_order():
+    rules = {"h1": ["heading"], "#class=note": ["note"], "b": ["bold"]}
+    reversed_rules = dict(reversed(rules.items()))
+    assert ParserConfig(annotation_rules=rules).freeze() == ParserConfig(annotation_rules=reversed_rules).freeze()
+    assert ParserConfig(annotation_rules=rules).fingerprint == ParserConfig(annotation_rules=reversed_rules).fingerprint
+
+
+def test_thaw_config():
+    mapping = CustomHtmlTagHandlerMapping(start_tag_mapping={"b": bold_start_handler}, end_tag_mapping={})
+    css = CSS_PROFILES["strict"].copy()
+    config = ParserConfig(
+        css=css,
+        display_links=True,
+        annotation_rules={"h1": ["heading"], "b": ["bold"]},
+        custom_html_tag_handler_mapping=mapping,
+    )
+    frozen_config = config.freeze()
+    assert isinstance(frozen_config.css, tuple)
+    assert frozen_config.start_tag_handlers == (("b", "tests.test_frozen_config:bold_start_handler"),)
+
+    thawed_config = thaw_config(pickle.loads(pickle.dumps(frozen_config)))  # noqa: S301
+    assert thawed_config is thaw_config(frozen_config)
+    assert thawed_config.freeze() == frozen_config
+    assert get_annotated_text(HTML, thawed_config) == get_annotated_text(HTML, config)
+    assert get_text(HTML, thawed_config) == "Title\n\nSome **bold text with a [link](/link)\n"
+
+
+def test_freeze_after_reassigning_css():
+    html = "<div>a <span>b</span></div><ul><li>c</li></ul>x"
+    config = ParserConfig()
+    config.css = CSS_PROFILES["strict"]
+    frozen_config = config.freeze()
+    assert frozen_config.css == "strict"
+    assert frozen_config.fingerprint != ParserConfig().freeze().fingerprint
+    assert get_text(html, thaw_config(frozen_config)) == get_text(html, config)
+
+    annotated = ParserConfig(css=CSS_PROFILES["strict"], annotation_rules={"b": ["bold"]})
+    assert annotated.freeze().css == "strict"
+
+
+def test_frozen_config_is_compact():
+    config = ParserConfig(annotation_rules={"h1": ["heading"], "#class=note": ["note"]})
+    assert len(pickle.dumps(config.freeze())) * 5 < len(pickle.dumps(config))
+    assert len(pickle.dumps(config.freeze())) < 1024
+
+
+def test_process_pool():
+    frozen_config = ParserConfig(annotation_rules={"h1": ["heading"], "b": ["bold"]}).freeze()
+    with get_context("spawn").Pool(1) as pool:
+        assert pool.map(convert, [frozen_config]) == [convert(frozen_config)]
+
+
+def test_freeze_errors():
+    with pytest.raises(ValueError, match="cancellation token"):
+        ParserConfig(cancellation_token=CancellationToken()).freeze()
+
+    mapping = CustomHtmlTagHandlerMapping(start_tag_mapping={"b": lambda *_: None}, end_tag_mapping={})
+    with pytest.raises(ValueError, match="import path"):
+        ParserConfig(custom_html_tag_handler_mapping=mapping).freeze()
+
+
+def test_import_path():
+    assert get_import_path(br_start_handler) == "inscriptis.model.tag.br_tag:br_start_handler"
+    assert resolve_import_path(get_import_path(br_start_handler)) is br_start_handler
+    assert resolve_import_path(get_import_path(ParserConfig.freeze)) is ParserConfig.freeze
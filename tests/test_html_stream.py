@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+"""
+Tests the incremental HTML to text conversion with InscriptisStream.
+"""
+
+import tracemalloc
+from glob import glob
+from io import StringIO
+from os.path import dirname, join
+
+import pytest
+from lxml.html import document_fromstring
+
+from inscriptis import Inscriptis, get_text, iter_text
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.html_engine import InscriptisStream
+from inscriptis.model.config import ParserConfig
+
+TESTCASE_PATTERN = join(dirname(__file__), "html/*.html")
+
+
+def convert_in_chunks(html, chunk_size, config=None):
+    stream = InscriptisStream(config)
+    text = "".join(stream.feed(html[i : i + chunk_size]) for i in range(0, len(html), chunk_size))
+    return stream, text + stream.close()
+
+
+def test_stream_matches_get_text():
+    config = ParserConfig(css=CSS_PROFILES["strict"])
+    for testcase in glob(TESTCASE_PATTERN):
+        with open(testcase) as f:
+            html = f"<html><body>{f.read()}</body></html>"
+
+        reference = get_text(html, config)
+        for chunk_size in (1, 13, len(html)):
+            stream, text = convert_in_chunks(html, chunk_size, config)
+            assert text == reference
+            assert stream.get_text() == reference
+
+
+def test_stream_annotations():
+    html = "<html><body><h1>Chur</h1><!-- c -->Chur is in <b>Grisons</b>.<table><tr><td><b>x</b></td></tr></table>"
+    config = ParserConfig(annotation_rules={"h1": ["heading"], "b": ["emphasis"]})
+    stream, text = convert_in_chunks(html, 3, config)
+
+    inscriptis = Inscriptis(document_fromstring(html), config)
+    assert text == inscriptis.get_text()
+    assert stream.get_annotations() == inscriptis.get_annotations()
+
+
+def test_stream_returns_completed_lines():
+    stream = InscriptisStream()
+    assert stream.feed("<html><body><p>first</p><p>sec") == "first\n"
+    assert stream.feed("ond</p><p>th") == "\nsecond\n"
+    assert stream.feed("ird</p>") == "\nthird\n"
+    assert stream.close() == ""
+
+
+def test_stream_clears_rendered_elements():
+    stream = InscriptisStream()
+    stream.feed("<html><body><div><p>first <b>paragraph</b></p><p>second</p>")
+    div = stream._parser.close().find("body/div")
+    assert all(len(p) == 0 and not p.text for p in div)
+
+
+def test_stream_output_limits():
+    html = "".join(generate_large_document(20))
+    for limits in ({"max_chars": 1}, {"max_chars": 100}, {"max_blocks": 7}, {"max_chars": 500, "max_blocks": 30}):
+        config = ParserConfig(**limits)
+        reference = get_text(html, config)
+        for chunk_size in (1, 13, len(html)):
+            stream, text = convert_in_chunks(html, chunk_size, config)
+            assert text == reference
+            assert stream.get_text() == reference
+        assert "".join(iter_text(StringIO(html), config)) == reference
+
+
+def test_stream_stops_parsing_at_output_limit():
+    stream = InscriptisStream(ParserConfig(max_chars=5))
+    assert stream.feed("<html><body><p>first</p><p>") == "first"
+    stream.feed("second</p>")
+    assert stream.finished
+    assert stream.feed("<p>third</p>") == ""
+    assert stream.close() == ""
+
+
+def test_iter_text_stops_reading_at_output_limit():
+    source = StringIO("".join(generate_large_document(1000)))
+    text = "".join(iter_text(source, ParserConfig(max_blocks=3), chunk_size=100))
+    assert text == "Section 0\n\nParagraph with bold text."
+    assert source.tell() < 1000
+
+
+def test_stream_rejects_content_selectors():
+    config = ParserConfig(content_selectors=["//article"])
+    with pytest.raises(ValueError, match="content selectors"):
+        InscriptisStream(config)
+    with pytest.raises(ValueError, match="content selectors"):
+        list(iter_text(StringIO("<article>a</article>"), config))
+
+
+def generate_large_document(sections):
+    yield "<html><body>"
+    for no in range(sections):
+        yield f"<h2>Section {no}</h2><p>Paragraph with <b>bold</b> text.</p>"
+        yield f"<table><tr><td>{no}</td><td>cell</td></tr></table><!-- comment -->"
+    yield "</body></html>"
+
+
+class LargeDocument:
+    """A file-like object that generates a document with the given number of sections."""
+
+    def __init__(self, sections):
+        self._parts = generate_large_document(sections)
+
+    def read(self, _):
+        return next(self._parts, "")
+
+
+def get_peak_memory(sections):
+    tracemalloc.start()
+    length = sum(len(text) for text in iter_text(LargeDocument(sections)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return length, peak
+
+
+def test_iter_text_matches_get_text():
+    html = "".join(generate_large_document(20))
+    assert "".join(iter_text(LargeDocument(20))) == get_text(html)
+    assert "".join(iter_text(StringIO(html), chunk_size=7)) == get_text(html)
+
+
+def test_iter_text_memory_does_not_depend_on_document_size():
+    small_length, small_peak = get_peak_memory(100)
+    large_length, large_peak = get_peak_memory(2000)
+    assert large_length > 15 * small_length
+    assert large_peak < 2 * small_peak
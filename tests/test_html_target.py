@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""
+Tests the tree-less HTML to text conversion with InscriptisTarget.
+"""
+
+from glob import glob
+from os.path import dirname, join
+
+import pytest
+from lxml.etree import HTMLParser, fromstring
+from lxml.html import document_fromstring
+
+from inscriptis import Inscriptis
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.html_engine import InscriptisTarget
+from inscriptis.model.config import ParserConfig
+
+TESTCASE_PATTERN = join(dirname(__file__), "html/*.html")
+
+
+def convert(html, config=None):
+    tree_engine = Inscriptis(document_fromstring(html), config)
+    sax_engine = fromstring(html, HTMLParser(target=InscriptisTarget(config)))
+    return tree_engine, sax_engine
+
+
+def test_target_matches_tree_walker():
+    configs = (
+        ParserConfig(css=CSS_PROFILES["strict"]),
+        ParserConfig(display_links=True, display_images=True, annotation_rules={"b": ["bold"], "td": ["cell"]}),
+    )
+    for testcase in glob(TESTCASE_PATTERN):
+        with open(testcase) as f:
+            html = f"<html><body>{f.read()}</body></html>"
+
+        for config in configs:
+            tree_engine, sax_engine = convert(html, config)
+            assert sax_engine.get_text() == tree_engine.get_text()
+            assert sax_engine.get_annotations() == tree_engine.get_annotations()
+
+
+def test_target_comments_and_entities():
+    html = (
+        "<!-- outside --><html><body><span>a &amp; b</span><!-- c -->"
+        "comment  tail<div>x<!-- c --> y </div></body></html><!-- outside -->"
+    )
+    tree_engine, sax_engine = convert(html)
+    assert sax_engine.get_text() == tree_engine.get_text()
+
+
+def test_target_rejects_content_selectors():
+    with pytest.raises(ValueError, match="content selectors"):
+        InscriptisTarget(ParserConfig(content_selectors=["//article"]))
@@ -0,0 +1,46 @@
+"""Test the max_chars and max_blocks output limits."""
+
+from inscriptis import get_annotated_text, get_text, render_many
+from inscriptis.model.config import ParserConfig
+
+HTML = (
+    "<html><body><h1>Title</h1><p>First <b>bold paragraph</b> text.</p>"
+    "<table><tr><td>a</td><td><b>b</b></td></tr><tr><td>c</td><td>d</td></tr>"
+    "<tr><td>e</td><td>f</td></tr></table><p>Last</p></body></html>"
+)
+RULES = {"h1": ["heading"], "b": ["bold"]}
+
+
+def test_max_chars():
+    full_text = get_text(HTML)
+    # includes limits at block boundaries (e.g., 7 and 13) and within margins
+    for max_chars in range(len(full_text) + 2):
+        text = get_text(HTML, ParserConfig(max_chars=max_chars))
+        assert text == full_text[:max_chars]
+    assert get_text(HTML, ParserConfig(max_chars=1000)) == full_text
+
+
+def test_max_chars_annotations():
+    result = get_annotated_text(HTML, ParserConfig(max_chars=18, annotation_rules=RULES))
+    assert result["text"] == "Title\n\nFirst bold "
+    assert result["label"] == [(0, 7, "heading"), (13, 18, "bold")]
+
+
+def test_max_blocks():
+    assert get_text(HTML, ParserConfig(max_blocks=1)) == "Title"
+    assert get_text(HTML, ParserConfig(max_blocks=4)) == "Title\n\nFirst bold paragraph text.\n"
+    # the open table is closed after its second row
+    assert get_text(HTML, ParserConfig(max_blocks=6)) == "Title\n\nFirst bold paragraph text.\n\na  b\nc  d\n\n"
+
+
+def test_limits_stop_traversal_in_large_tables():
+    rows = "".join(f"<tr><td>{no}</td><td>cell</td></tr>" for no in range(1000))
+    html = f"<html><body><table>{rows}</table></body></html>"
+    text = get_text(html, ParserConfig(max_chars=50))
+    # only the rendered rows (i.e., less than 100) determine the column widths
+    assert text == "\n".join(f"{no:<2}  cell" for no in range(8))[:50]
+
+
+def test_render_many_limits():
+    configs = [ParserConfig(max_chars=30), ParserConfig(max_blocks=6, annotation_rules=RULES), ParserConfig()]
+    assert render_many(HTML, configs) == [get_annotated_text(HTML, config) for config in configs]
@@ -6,6 +6,7 @@ Tests HtmlElement and the parsing of CSS style definitiosn
 
 from copy import copy
 
+from inscriptis import get_text
 from inscriptis.css_profiles import CSS_PROFILES
 from inscriptis.html_properties import (
     Display,
@@ -13,6 +14,7 @@ from inscriptis.html_properties import (
     VerticalAlignment,
     WhiteSpace,
 )
+from inscriptis.model.attribute import Attribute
 from inscriptis.model.css import CssParse
 from inscriptis.model.html_element import HtmlElement
 
@@ -63,3 +65,15 @@ def test_parse_horizontal_align():
     # invalid value
     CssParse.attr_horizontal_align("unknown", html_element)
     assert html_element.align == HorizontalAlignment.center
+
+
+def test_inline_style_overrides_presentational_attributes():
+    for cell in (
+        '<td valign="top" style="vertical-align: bottom">a</td>',
+        '<td style="vertical-align: bottom" valign="top">a</td>',
+    ):
+        html = f"<table><tr>{cell}<td>b<br>c<br>d</td></tr></table>"
+        assert get_text(html) == "   b\n   c\na  d\n"
+
+    html_element = Attribute().apply_attributes({"style": "vertical-align: middle", "valign": "top"}, HtmlElement())
+    assert html_element.valign == VerticalAlignment.middle
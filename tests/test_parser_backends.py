@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""
+Tests the pluggable HTML parser backends.
+"""
+
+import pytest
+
+from inscriptis import get_annotated_text, get_text
+from inscriptis.backend import PARSER_BACKENDS, ParserBackend, get_available_parser_backends, get_parser_backend
+from inscriptis.model.config import ParserConfig
+
+HTML = (
+    "<html><head><title>Title</title></head><body><h1>Chur</h1><!-- comment -->"
+    '<p class="intro">Chur is the <b>capital</b> of the Grisons.</p>'
+    "<ul><li>first</li><li>second</li></ul><table><tr><td>1</td><td>2</td></tr></table></body></html>"
+)
+
+
+@pytest.fixture(params=PARSER_BACKENDS)
+def backend(request):
+    pytest.importorskip(request.param)
+    return request.param
+
+
+def test_backend_output(backend):
+    config = ParserConfig(parser_backend=backend, annotation_rules={"b": ["bold"], "#class=intro": ["intro"]})
+    reference = get_annotated_text(HTML, ParserConfig(annotation_rules={"b": ["bold"], "#class=intro": ["intro"]}))
+    assert get_annotated_text(HTML, config) == reference
+    assert get_annotated_text(HTML.encode("utf-8"), config) == reference
+
+
+def test_backend_empty_content(backend):
+    assert get_text("  ", ParserConfig(parser_backend=backend)) == ""
+    assert get_parser_backend(backend).parse(b"") is None
+
+
+def test_available_backends():
+    assert get_available_parser_backends()[0] == "lxml"
+    with pytest.raises(ValueError):
+        get_parser_backend("unknown")
+
+
+def test_backends_implement_parse():
+    with pytest.raises(TypeError):
+        ParserBackend()
+    assert all(isinstance(get_parser_backend(name), ParserBackend) for name in get_available_parser_backends())
@@ -0,0 +1,51 @@
+"""Test rendering HTML content with several configurations at once."""
+
+from copy import deepcopy
+from glob import glob
+from os.path import dirname, join
+
+import pytest
+
+from inscriptis import get_annotated_text, render_many
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.html_properties import Display
+from inscriptis.model.config import ParserConfig
+
+TESTCASE_PATTERN = join(dirname(__file__), "html/*.html")
+
+CONFIGS = (
+    ParserConfig(css=CSS_PROFILES["strict"]),
+    ParserConfig(),
+    ParserConfig(display_links=True, display_images=True, annotation_rules={"b": ["bold"], "td": ["cell"]}),
+)
+
+
+def test_render_many_matches_get_annotated_text():
+    for testcase in glob(TESTCASE_PATTERN):
+        with open(testcase) as f:
+            html = f.read()
+
+        results = render_many(html, CONFIGS)
+        assert results == [get_annotated_text(html, config) for config in CONFIGS]
+
+
+def test_render_many_with_config_specific_hidden_content():
+    css = deepcopy(CSS_PROFILES["strict"])
+    css["aside"] = deepcopy(css["div"])
+    css["aside"].display = Display.none
+    configs = (ParserConfig(css=css), ParserConfig(annotation_rules={"b": ["bold"]}))
+    html = "<html><body><p>Hello</p><aside>Side <b>note</b><!-- c -->!</aside> and <b>bye</b></body></html>"
+
+    hidden, shown = render_many(html, configs)
+    assert hidden == get_annotated_text(html, configs[0])
+    assert shown == get_annotated_text(html, configs[1])
+    assert "Side" not in hidden["text"]
+    assert "Side note!" in shown["text"]
+
+
+def test_render_many_edge_cases():
+    assert render_many("<p>test</p>", []) == []
+    assert render_many("", CONFIGS) == [{"text": "", "label": []}] * len(CONFIGS)
+
+    with pytest.raises(ValueError):
+        render_many("<p>test</p>", [ParserConfig(), ParserConfig(drop_elements=["svg"])])
@@ -0,0 +1,136 @@
+"""Test the render plan compiled from a ParserConfig."""
+
+import pickle
+from copy import copy, deepcopy
+
+import pytest
+
+from inscriptis import get_annotated_text, get_text
+from inscriptis.css_profiles import STRICT_CSS_PROFILE
+from inscriptis.html_properties import Display
+from inscriptis.model.config import ParserConfig
+from inscriptis.model.html_document_state import HtmlDocumentState
+from inscriptis.model.html_element import DEFAULT_HTML_ELEMENT
+from inscriptis.model.render_plan import RenderPlan
+from inscriptis.model.tag import CustomHtmlTagHandlerMapping
+from inscriptis.model.tag.a_tag import a_start_handler
+from inscriptis.model.tag.table_tag import table_end_handler, table_start_handler
+
+
+def test_render_plan():
+    plan = RenderPlan(ParserConfig(css=STRICT_CSS_PROFILE, display_links=True))
+
+    table_plan = plan.get("table")
+    assert table_plan.start_handler is table_start_handler
+    assert table_plan.end_handler is table_end_handler
+    assert table_plan.template.tag == "table"
+    assert plan.get("a").start_handler is a_start_handler
+
+    # templates are copies of the CSS profile's elements
+    div_plan = plan.get("div")
+    assert div_plan.template.display == Display.block
+    assert div_plan.template is not STRICT_CSS_PROFILE["div"]
+    assert "style" in div_plan.attribute_handlers
+
+    # tags without CSS definition or handlers use the default plan
+    assert plan.get("unknown") is plan.default
+    assert plan.default.template is DEFAULT_HTML_ELEMENT
+    assert plan.default.start_handler is None
+
+
+def test_render_plan_depends_on_config():
+    assert RenderPlan(ParserConfig()).get("a").start_handler is None
+    assert RenderPlan(ParserConfig()).get("img").start_handler is None
+    assert RenderPlan(ParserConfig(display_images=True)).get("img").start_handler is not None
+
+    mapping = CustomHtmlTagHandlerMapping(start_tag_mapping={"custom": print}, end_tag_mapping={"table": print})
+    plan = RenderPlan(ParserConfig(custom_html_tag_handler_mapping=mapping))
+    assert plan.get("custom").start_handler is print
+    assert plan.get("table").start_handler is table_start_handler
+    assert plan.get("table").end_handler is print
+
+    # annotation rules contribute templates and attribute handlers
+    plan = RenderPlan(ParserConfig(annotation_rules={"h1": ["heading"], "#class=note": ["note"]}))
+    assert plan.get("h1").template.annotation == ("heading",)
+    assert "class" in plan.get("p").attribute_handlers
+    assert [name for name, _ in plan.handled_attributes] == ["align", "valign", "class", "style"]
+
+
+def test_render_plan_is_immutable():
+    plan = ParserConfig().render_plan
+    with pytest.raises(AttributeError):
+        plan.default = None
+    with pytest.raises(TypeError):
+        plan.tags["p"] = plan.default
+    with pytest.raises(TypeError):
+        plan.get("p").attribute_handlers["style"] = None
+
+
+def test_render_plan_is_cached():
+    config = ParserConfig(annotation_rules={"b": ["bold"]})
+    plan = config.render_plan
+    html = "<html><body><p>Some <b>bold</b> text</p></body></html>"
+    assert get_text(html, config) == "Some bold text\n"
+    assert get_annotated_text(html, config)["label"] == [(5, 9, "bold")]
+    assert config.render_plan is plan
+
+
+def test_render_plan_follows_config_changes():
+    html = '<a href="u">x</a>'
+    config = ParserConfig()
+    assert get_text(html, config) == "x"
+    config.display_links = True
+    assert get_text(html, config) == "[x](u)"
+
+    copied = copy(config)
+    copied.display_links = False
+    assert get_text(html, copied) == "x"
+    assert get_text(html, config) == "[x](u)"
+
+
+def test_used_configs_can_be_copied():
+    config = ParserConfig(display_links=True, annotation_rules={"a": ["link"]})
+    html = '<a href="u">x</a>'
+    expected = get_annotated_text(html, config)
+    for duplicate in (copy(config), deepcopy(config), pickle.loads(pickle.dumps(config))):  # noqa: S301
+        assert get_annotated_text(html, duplicate) == expected
+
+
+def test_shared_elements():
+    plan = RenderPlan(ParserConfig(annotation_rules={"b": ["bold"]}))
+    assert plan.get("span").shared
+    assert plan.get("a").shared
+    assert not plan.get("li").shared
+    assert not plan.get("td").shared
+    # annotated elements may not be open several times at once
+    assert not plan.get("b").shared
+
+    state = HtmlDocumentState(ParserConfig())
+    state.apply_starttag_layout("span", {})
+    first = state.tags.pop()
+    state.apply_starttag_layout("span", {"class": "note"})
+    assert state.tags.pop() is first
+    # elements modified by attribute handlers obtain a private copy
+    state.apply_starttag_layout("span", {"style": "display: block"})
+    private = state.tags.pop()
+    assert private is not first
+    assert private.display == Display.block
+    assert first.display == Display.inline
+
+
+def test_shared_elements_output():
+    config = ParserConfig(annotation_rules={"b": ["bold"]})
+    html = (
+        "<html><body><span><span>a <b>b <b>c</b></b></span></span>"
+        '<span style="display: block">d</span><span>e</span></body></html>'
+    )
+    assert get_text(html, config) == "a b c\nd\ne"
+    assert get_annotated_text(html, config)["label"] == [(4, 5, "bold"), (2, 5, "bold")]
+
+
+def test_unhandled_attributes_are_ignored():
+    html = (
+        '<html><body><p class="note" data-id="1" aria-label="x" style="display: none">Hidden</p>'
+        '<p class="note" data-style="display: none" align="right">Visible</p></body></html>'
+    )
+    assert get_text(html) == "Visible\n"
@@ -0,0 +1,75 @@
+"""Test the max_elements, max_depth and max_table_cells resource guards."""
+
+from lxml.etree import HTMLParser, fromstring
+
+from inscriptis import Converter, get_annotated_text, get_result, get_text
+from inscriptis.html_engine import Inscriptis, InscriptisTarget
+from inscriptis.model.config import ParserConfig
+
+HTML = (
+    "<html><body><h1>Title</h1><p>First</p><ul><li>one<ul><li>two<ul><li>three</li></ul></li></ul></li></ul>"
+    "<p>Last</p></body></html>"
+)
+TABLE = (
+    "<html><body><table>"
+    + "".join(f"<tr><td>{no}</td><td>cell</td></tr>" for no in range(5))
+    + "</table><p>after</p></body></html>"
+)
+
+
+def convert(html: str, **kwargs) -> tuple[str, set[str]]:
+    inscriptis = Inscriptis(fromstring(html, HTMLParser()), ParserConfig(**kwargs))
+    return inscriptis.get_text(), inscriptis.fired_guards
+
+
+def test_no_guard_fired():
+    assert convert(HTML, max_elements=100, max_depth=10, max_table_cells=10) == (get_text(HTML), set())
+    assert convert(TABLE, max_table_cells=10) == (get_text(TABLE), set())
+
+
+def test_max_depth():
+    # the nested lists are flattened, while the siblings are laid out
+    assert convert(HTML, max_depth=4) == ("Title\n\nFirst\n\n  * one two three\n\nLast\n", {"max_depth"})
+
+
+def test_max_elements():
+    assert convert(HTML, max_elements=5) == ("Title\n\nFirst\n\n    one two three\nLast", {"max_elements"})
+
+
+def test_max_table_cells():
+    # rows exceeding the limit are flattened into the table's last cell
+    text, guards = convert(TABLE, max_table_cells=5)
+    assert guards == {"max_table_cells"}
+    assert text.split("\n")[:2] == ["0  cell                     ", "1  cell 2 cell 3 cell 4 cell"]
+    assert text.rstrip().endswith("after")
+
+
+def test_guards_with_annotations_and_other_engines():
+    config = ParserConfig(max_depth=4, annotation_rules={"li": ["item"]})
+    result = get_annotated_text(HTML, config)
+    assert result["text"] == "Title\n\nFirst\n\n  * one two three\n\nLast\n"
+    assert {label for _, _, label in result["label"]} == {"item"}
+
+    target = fromstring(HTML, HTMLParser(target=InscriptisTarget(ParserConfig(max_depth=4))))
+    assert target.get_text() == result["text"]
+    assert target.fired_guards == {"max_depth"}
+
+
+def test_guards_in_results():
+    config = ParserConfig(max_depth=4)
+    assert get_result(HTML, config).fired_guards == {"max_depth"}
+    assert not get_result(HTML).fired_guards
+
+    converter = Converter(config)
+    result = converter.convert_result(HTML)
+    converter.convert_result("<p>short</p>")
+    assert result.fired_guards == {"max_depth"}
+    assert not converter.fired_guards
+
+
+def test_hostile_nesting():
+    depth = 200
+    html = "<div>" * depth + "deep" + "</div>" * depth
+    text, guards = convert(html, max_depth=20)
+    assert text.strip() == "deep"
+    assert guards == {"max_depth"}
@@ -8,3 +8,9 @@ from inscriptis import get_text
 def test_successive_a():
     html = '<?xml version="1.0" encoding="UTF-8" ?> Hallo?>'
     assert get_text(html).strip() == "Hallo?>"
+
+
+def test_xml_declaration_before_html_document():
+    html = '  <?xml version="1.0" encoding="UTF-8" ?>\n<!DOCTYPE html><html><body><p>Hallo</p>Welt</body></html>'
+    assert get_text(html) == "Hallo\n\nWelt"
+    assert get_text(html.encode("utf-8")) == "Hallo\n\nWelt"
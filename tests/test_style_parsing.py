@@ -4,6 +4,7 @@
 Tests inscriptis' parsing of CSS style definitions.
 """
 
+from inscriptis.html_properties import Display
 from inscriptis.model.css import CssParse
 from inscriptis.model.html_element import HtmlElement
 
@@ -13,3 +14,25 @@ def test_style_unit_parsing():
     CssParse.attr_style("margin-top:2.666666667em;margin-bottom: 2.666666667em", html_element)
     assert html_element.margin_before == 3
     assert html_element.margin_after == 3
+
+
+def test_invalid_style_values():
+    html_element = HtmlElement(margin_before=1)
+    CssParse.attr_style("margin-top: auto; display: ; color: red; unknown", html_element)
+    assert html_element.margin_before == 1
+
+
+def test_compiled_style_cache():
+    style = "display: block; -webkit-margin-before: 16px"
+    CssParse.compile_style.cache_clear()
+    for _ in range(3):
+        html_element = HtmlElement()
+        CssParse.attr_style(style, html_element)
+        assert html_element.display == Display.block
+        assert html_element.margin_before == 2
+
+    cache_info = CssParse.compile_style.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+    assert cache_info.currsize == 1
+    assert len(CssParse.compile_style(style)) == 2
@@ -0,0 +1,98 @@
+"""Test the parsing of the document's <style> sheets."""
+
+import pytest
+from lxml.etree import HTMLParser, fromstring
+
+from inscriptis import get_text, render_many
+from inscriptis.html_engine import InscriptisStream, InscriptisTarget
+from inscriptis.html_properties import Display
+from inscriptis.model.config import ParserConfig
+from inscriptis.model.html_element import HtmlElement
+from inscriptis.model.style_sheet import StyleSheet, is_screen_style
+
+STYLE_CONFIG = ParserConfig(parse_style_sheets=True)
+HTML = (
+    "<html><head><style>"
+    "/* layout */ .hidden, #banner { display: none } "
+    "span.block { display: block } "
+    "@media print { .hidden { display: block } } "
+    "</style></head><body>"
+    '<p>Visible<span class="block">Block</span></p>'
+    '<div class="ad hidden">Hidden <b>content</b></div>'
+    '<div id="banner">Banner</div>'
+    "<p>End</p></body></html>"
+)
+
+
+def apply(style_sheet: StyleSheet, tag: str, attrs: dict) -> HtmlElement:
+    html_element = HtmlElement(tag)
+    for setter in style_sheet.get_setters(tag, attrs):
+        setter(html_element)
+    return html_element
+
+
+def test_rule_index():
+    style_sheet = StyleSheet()
+    style_sheet.add(
+        "div { display: block } .note { display: none } #main.note { display: inline } "
+        "* { padding-left: 16px } p.a.b { margin-top: 2em !important } "
+        "div > p, a:hover, [hidden] { display: none } @import url(x.css); li { margin-bottom: 1em }"
+    )
+    assert set(style_sheet.tag_rules) == {"div", "li"}
+    assert set(style_sheet.class_rules) == {"note", "a"}
+    assert set(style_sheet.id_rules) == {"main"}
+    assert len(style_sheet.universal_rules) == 1
+    assert style_sheet.rule_count == 6
+
+    assert apply(style_sheet, "div", {}).display == Display.block
+    assert apply(style_sheet, "div", {}).padding_inline == 2
+    assert apply(style_sheet, "span", {"class": "x note"}).display == Display.none
+    # rules with a higher specificity win
+    assert apply(style_sheet, "span", {"class": "note", "id": "main"}).display == Display.inline
+    assert apply(style_sheet, "p", {"class": "b a"}).margin_before == 2
+    assert apply(style_sheet, "p", {"class": "a"}).margin_before == 0
+    assert not style_sheet.get_setters("span", {"id": "other"})[1:]
+
+
+def test_is_screen_style():
+    assert is_screen_style({})
+    assert is_screen_style({"type": "text/css", "media": "screen, print"})
+    assert not is_screen_style({"media": "print"})
+    assert not is_screen_style({"type": "text/less"})
+
+
+def test_style_sheets_are_optional():
+    assert "Hidden content" in get_text(HTML)
+    assert get_text(HTML, STYLE_CONFIG) == "Visible\n\nBlock\n\nEnd\n"
+
+
+@pytest.mark.parametrize("backend", ["lxml", "html5lib", "selectolax"])
+def test_style_sheet_backends(backend):
+    config = ParserConfig(parse_style_sheets=True, parser_backend=backend)
+    assert get_text(HTML, config) == "Visible\n\nBlock\n\nEnd\n"
+
+
+def test_inline_styles_override_style_sheets():
+    html = (
+        "<html><head><style>b { display: block }</style></head><body>a<b style='display: inline'>b</b>c</body></html>"
+    )
+    assert get_text(html, STYLE_CONFIG) == "abc"
+
+
+def test_style_sheet_engines():
+    expected = get_text(HTML, STYLE_CONFIG)
+    target = fromstring(HTML, HTMLParser(target=InscriptisTarget(STYLE_CONFIG)))
+    assert target.get_text() == expected
+
+    stream = InscriptisStream(STYLE_CONFIG)
+    text = "".join(stream.feed(HTML[pos : pos + 20]) for pos in range(0, len(HTML), 20)) + stream.close()
+    assert text == expected
+
+    assert render_many(HTML, [STYLE_CONFIG, ParserConfig()])[0]["text"] == expected
+
+
+def test_style_sheets_apply_to_preceding_elements():
+    html = "<html><body><p class=h>hidden</p><p>shown</p><style>.h { display: none }</style></body></html>"
+    assert get_text(html, STYLE_CONFIG) == "shown\n"
+    assert render_many(html, [STYLE_CONFIG, ParserConfig()])[0]["text"] == "shown\n"
+    assert render_many(html, [ParserConfig(), STYLE_CONFIG])[1]["text"] == "shown\n"
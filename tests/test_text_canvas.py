@@ -0,0 +1,55 @@
+"""Test the plain text canvas used for conversions without annotations."""
+
+from glob import glob
+from pathlib import Path
+
+import pytest
+
+from inscriptis import get_text
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.html_engine import InscriptisRenderer
+from inscriptis.html_properties import HorizontalAlignment, VerticalAlignment
+from inscriptis.model.canvas import Canvas, TextCanvas
+from inscriptis.model.config import ParserConfig
+from inscriptis.model.html_element import HtmlElement
+from inscriptis.model.table import TextTable, TextTableCell
+
+TESTS_DIR = Path(__file__).parent
+DOCUMENTS = [Path(fname).read_text() for fname in sorted(glob(str(TESTS_DIR / "html" / "*.html")))]
+# annotation rules which never match and, therefore, only enable the annotation bookkeeping
+UNUSED_RULES = {"inscriptis-unused": ["unused"]}
+
+
+def test_canvas_selection():
+    state = InscriptisRenderer(ParserConfig()).state
+    assert not ParserConfig().render_plan.annotated
+    assert type(state.canvas) is TextCanvas
+    assert (state.table_class, state.table_cell_class) == (TextTable, TextTableCell)
+
+    css = dict(CSS_PROFILES["strict"])
+    css["b"] = HtmlElement(annotation=("bold",))
+    for config in (ParserConfig(annotation_rules=UNUSED_RULES), ParserConfig(css=css)):
+        assert config.render_plan.annotated
+        assert type(InscriptisRenderer(config).state.canvas) is Canvas
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"display_links": True, "css": CSS_PROFILES["strict"]}, {"max_chars": 200}, {"max_blocks": 5}],
+)
+def test_text_canvas_output(options):
+    text_config = ParserConfig(**options)
+    annotated_config = ParserConfig(annotation_rules=UNUSED_RULES, **options)
+    for html in DOCUMENTS:
+        assert get_text(html, text_config) == get_text(html, annotated_config)
+
+
+def test_text_table_cell():
+    cell = TextTableCell(HorizontalAlignment.right, VerticalAlignment.top)
+    cell.write(HtmlElement(), "Text")
+    cell.normalize_blocks()
+    cell.width = 6
+    assert cell.blocks == ["  Text"]
+    assert cell.width == 6
+    assert not cell.line_width
+    assert cell.get_annotations(10, 20) == []
@@ -0,0 +1,43 @@
+"""Test concurrent conversions that share a configuration."""
+
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from pathlib import Path
+
+from inscriptis import get_annotated_text, get_text, get_texts
+from inscriptis.css_profiles import CSS_PROFILES
+from inscriptis.model.attribute import DEFAULT_ATTRIBUTE_MAP, Attribute
+from inscriptis.model.config import ParserConfig
+
+TESTS_DIR = Path(__file__).parent
+DOCUMENTS = [Path(fname).read_text() for fname in sorted(glob(str(TESTS_DIR / "html" / "*.html")))]
+RULES = {"h1": ["heading"], "b": ["emphasis"], "table": ["table"], "#class=short": ["short"]}
+
+
+def test_get_texts():
+    config = ParserConfig(display_links=True)
+    expected = [get_text(html, config) for html in DOCUMENTS]
+    assert get_texts(DOCUMENTS * 4, config, max_workers=4) == expected * 4
+    assert get_texts([DOCUMENTS[0].encode("utf8"), ""]) == [get_text(DOCUMENTS[0]), ""]
+    assert get_texts([]) == []
+
+
+def test_concurrent_conversions_share_config():
+    config = ParserConfig(annotation_rules=RULES)
+    expected = [get_annotated_text(html, config) for html in DOCUMENTS]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda html: get_annotated_text(html, config), DOCUMENTS * 8))
+    assert results == expected * 8
+
+
+def test_configs_do_not_modify_shared_state():
+    css = CSS_PROFILES["strict"]
+    h1 = css["h1"]
+    ParserConfig(css=css, annotation_rules=RULES)
+    assert CSS_PROFILES["strict"] is css
+    assert css["h1"] is h1
+    assert not h1.annotation
+
+    ParserConfig(annotation_rules={"#color": ["color"]})
+    assert "color" not in DEFAULT_ATTRIBUTE_MAP
+    assert Attribute().attribute_mapping is not DEFAULT_ATTRIBUTE_MAP
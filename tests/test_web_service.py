@@ -2,7 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from inscriptis.metadata import __version__
-from inscriptis.service.web import app
+from inscriptis.service.web import CONFIG, app, get_config
 
 
 @pytest.fixture
@@ -38,6 +38,36 @@ def test_get_text_call_without_content_type(client):
     assert response.text == "Hello World!"
 
 
+def test_timeout_configs_are_cached():
+    assert get_config(60) is get_config(60)
+    assert get_config(60).render_plan is get_config(60).render_plan
+    assert get_config() is CONFIG
+
+
+def test_get_text_call_with_declared_encoding(client):
+    html_content = "<html><body>Österliche Freuden!</body></html>".encode("latin1")
+    for content_type in ("text/html;charset=ISO-8859-1", 'text/html; charset="latin1"; foo=bar'):
+        response = client.post("/get_text", content=html_content, headers={"Content-type": content_type})
+        assert response.status_code == 200
+        assert response.text == "Österliche Freuden!"
+
+    # the encoding declared by the document
+    html_content = '<html><head><meta charset="latin1"></head><body>Österliche Freuden!</body></html>'
+    response = client.post("/get_text", content=html_content.encode("latin1"))
+    assert response.text == "Österliche Freuden!"
+
+
+def test_get_text_call_with_timeout(client):
+    html_content = "<html><body>" + "<p>x</p>" * 1000 + "</body></html>"
+    response = client.post("/get_text", params={"timeout": 0}, content=html_content)
+    assert response.status_code == 503
+    assert "timeout" in response.json()["detail"]
+
+    response = client.post("/get_text", params={"timeout": 60}, content="<html><body>Hello World!</body></html>")
+    assert response.status_code == 200
+    assert response.text == "Hello World!"
+
+
 def test_get_version_call(client):
     response = client.get("/version")
     assert response.status_code == 200
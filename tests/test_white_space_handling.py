@@ -70,3 +70,16 @@ def test_tail():
     """
     html = '<body>Hi<span style="white-space: pre"> 1   3 </span> versus 1   3'
     assert get_text(html, config) == "Hi 1   3  versus 1 3"
+
+
+def test_trailing_whitespace_of_the_content():
+    # the content's trailing whitespace is not rendered
+    assert get_text("<pre>code\n\n\n") == "code"
+    assert get_text("<pre>code</pre>\n\n") == "code"
+    assert get_text("<pre>a\n<!-- c -->\n  ") == "a\n"
+    assert get_text(b"<div style='white-space: pre'>a  \r\n") == "  a"
+    assert get_text("<html><body><pre>x\n\n") == "x"
+
+    # whitespace within the preformatted content is kept
+    assert get_text("<pre>code\n\n\n</pre>") == "code\n\n\n"
+    assert get_text("<html><body><pre>x\n</pre></body></html>\n") == "x\n"